@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for production deployments.
+
+Run with:
+
+    gunicorn src.maps.api.main:app -c gunicorn.conf.py
+
+Each worker is a full uvicorn event loop (uvloop + httptools via
+uvicorn[standard]), so uploads are handled in parallel across cores
+instead of serializing through a single process.
+"""
+
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("API_WORKERS", str(max(2, os.cpu_count() or 2))))
+worker_connections = 1000
+# Large batch parses can legitimately hold a request for a while
+timeout = 120
+keepalive = int(os.getenv("API_TIMEOUT_KEEP_ALIVE", "5"))
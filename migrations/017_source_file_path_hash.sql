@@ -0,0 +1,23 @@
+-- =====================================================================
+-- Migration 017: Source File Path Hash Index
+-- =====================================================================
+-- Purpose: Add a fixed-width hash of source_file_path so upsert lookups
+--          probe a compact 32-char index instead of indexing long
+--          pylidc:// path strings. Shorter keys pack more entries per
+--          B-tree page, improving cache hit rate on lookups.
+-- Date: August 27, 2026
+-- =====================================================================
+
+-- Hash column is computed in Python (hashlib.blake2b, digest_size=16,
+-- hex-encoded) so no pgcrypto dependency is needed.
+ALTER TABLE documents
+ADD COLUMN IF NOT EXISTS source_file_path_hash VARCHAR(32);
+
+-- Backfill existing rows with a placeholder-free value is not possible in
+-- SQL without pgcrypto/blake2, so leave pre-existing rows NULL; the
+-- repository falls back to the source_file_path equality check for them.
+-- New inserts and upserts always populate the hash.
+
+CREATE INDEX IF NOT EXISTS idx_documents_source_file_path_hash
+ON documents(source_file_path_hash)
+WHERE source_file_path_hash IS NOT NULL;
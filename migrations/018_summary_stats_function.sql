@@ -0,0 +1,56 @@
+-- =====================================================================
+-- Migration 018: Server-Side Summary Statistics
+-- =====================================================================
+-- Purpose: Aggregate dataset statistics in Postgres instead of pulling
+--          every row of file_imports, unified_segments,
+--          extracted_keywords and case_patterns over the wire just to
+--          count them in Python. Transfers O(groups) bytes per call
+--          instead of O(rows).
+-- Date: August 27, 2026
+-- =====================================================================
+
+CREATE OR REPLACE FUNCTION summary_stats()
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+SELECT jsonb_build_object(
+    'total_files', (SELECT count(*) FROM file_imports),
+    'files_by_type', (
+        SELECT COALESCE(jsonb_object_agg(extension, cnt), '{}'::jsonb)
+        FROM (
+            SELECT extension, count(*) AS cnt
+            FROM file_imports
+            GROUP BY extension
+        ) t
+    ),
+    'files_by_status', (
+        SELECT COALESCE(jsonb_object_agg(processing_status, cnt), '{}'::jsonb)
+        FROM (
+            SELECT processing_status, count(*) AS cnt
+            FROM file_imports
+            GROUP BY processing_status
+        ) t
+    ),
+    'total_segments', (SELECT count(*) FROM unified_segments),
+    'segments_by_type', (
+        SELECT COALESCE(jsonb_object_agg(segment_type, cnt), '{}'::jsonb)
+        FROM (
+            SELECT segment_type, count(*) AS cnt
+            FROM unified_segments
+            GROUP BY segment_type
+        ) t
+    ),
+    'total_keywords', (SELECT count(*) FROM extracted_keywords),
+    'avg_document_frequency', (
+        SELECT avg(document_frequency) FROM extracted_keywords
+    ),
+    'total_case_patterns', (SELECT count(*) FROM case_patterns),
+    'cross_validated_patterns', (
+        SELECT count(*) FROM case_patterns WHERE cross_type_validated
+    )
+);
+$$;
+
+COMMENT ON FUNCTION summary_stats() IS
+'High-level dataset statistics for AnalysisExporter.get_summary_stats';
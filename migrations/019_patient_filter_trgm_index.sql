@@ -0,0 +1,21 @@
+-- =====================================================================
+-- Migration 019: Trigram Index for Patient Substring Filtering
+-- =====================================================================
+-- Purpose: RadiologistExporter.filter_by_patient runs
+--          ILIKE '%LIDC-IDRI-xxxx%' against file names through the
+--          radiologist_annotations_flat view. A leading-wildcard ILIKE
+--          cannot use a btree index and forces a sequential scan of
+--          file_imports on every call. radiologist_annotations_flat is
+--          a plain view, so a generated patient_id column is not an
+--          option without rebuilding it and the dependent
+--          export_radiologist_data materialized view; a pg_trgm GIN
+--          index on the underlying filename column makes the existing
+--          substring search index-backed instead.
+-- Date: August 27, 2026
+-- =====================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Serves ILIKE '%pattern%' through the flat view's join on file_imports
+CREATE INDEX IF NOT EXISTS idx_file_imports_filename_trgm
+ON file_imports USING gin (filename gin_trgm_ops);
@@ -0,0 +1,38 @@
+-- =====================================================================
+-- Migration 020: Materialized Keyword Facet Lists
+-- =====================================================================
+-- Purpose: The /keywords/categories and /keywords/tags endpoints run
+--          SELECT DISTINCT (with an array unnest for tags) over the
+--          keyword_directory view on every cache miss — a full scan of
+--          canonical_keywords plus its aggregation joins just to list a
+--          handful of facet values. Both lists only change when keyword
+--          definitions are edited, so precompute them as materialized
+--          views and refresh them alongside the export views.
+--          The unique indexes allow REFRESH ... CONCURRENTLY so readers
+--          are never blocked during a refresh.
+-- Date: August 27, 2026
+-- =====================================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS keyword_categories_mv AS
+SELECT DISTINCT subject_category AS category
+FROM keyword_directory
+WHERE subject_category IS NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_keyword_categories_mv
+ON keyword_categories_mv(category);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS keyword_tags_mv AS
+SELECT DISTINCT unnest(topic_tags) AS tag
+FROM keyword_directory
+WHERE topic_tags IS NOT NULL AND array_length(topic_tags, 1) > 0;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_keyword_tags_mv
+ON keyword_tags_mv(tag);
+
+COMMENT ON MATERIALIZED VIEW keyword_categories_mv IS 'Distinct subject categories for keyword navigation facets';
+COMMENT ON MATERIALIZED VIEW keyword_tags_mv IS 'Distinct topic tags for keyword navigation facets';
+
+GRANT SELECT ON keyword_categories_mv TO anon;
+GRANT SELECT ON keyword_tags_mv TO anon;
+GRANT SELECT ON keyword_categories_mv TO authenticated;
+GRANT SELECT ON keyword_tags_mv TO authenticated;
@@ -0,0 +1,18 @@
+-- =====================================================================
+-- Migration 021: Trigram Index for Keyword Term Search
+-- =====================================================================
+-- Purpose: KeywordService.search runs term ILIKE '%query%' through the
+--          keyword_directory view. The leading wildcard defeats any
+--          btree index, so every search sequentially scans
+--          canonical_keywords. The term predicate lands on a grouping
+--          column of the view, so the planner pushes it into the base
+--          scan, where a pg_trgm GIN index serves both the ILIKE
+--          substring match and the similarity() ranking the service
+--          now orders by.
+-- Date: August 27, 2026
+-- =====================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_canonical_keywords_keyword_trgm
+ON canonical_keywords USING gin (keyword gin_trgm_ops);
@@ -124,3 +124,26 @@ EXPLAIN ANALYZE
 SELECT * FROM keyword_directory
 ORDER BY total_occurrences DESC
 LIMIT 100;
+
+-- ============================================================
+-- Document Search Keyset Pagination
+-- ============================================================
+
+-- Composite index backing keyset pagination in search_documents
+-- Optimizes: WHERE (ingestion_timestamp, id) < (?, ?) ORDER BY ingestion_timestamp DESC, id DESC
+-- Keyset seek is O(log N) per page regardless of depth, vs O(offset) row skipping
+CREATE INDEX IF NOT EXISTS idx_documents_ingestion_id_desc
+ON documents(ingestion_timestamp DESC, id DESC);
+
+-- Tag containment lookups
+-- Optimizes: WHERE tags @> ARRAY['tag1', 'tag2']
+-- GIN containment is O(log N) vs sequential scan with ANY(tags)
+CREATE INDEX IF NOT EXISTS idx_content_tags_gin
+ON document_content USING gin(tags);
+
+-- Composite index for filter_analysis_table RPC
+-- Optimizes: WHERE segment_type = ANY(?) AND file_type = ANY(?) ORDER BY processed_at DESC
+-- One index scan instead of stacked per-column bitmap scans
+CREATE INDEX IF NOT EXISTS idx_master_filter
+ON master_analysis_table (segment_type, file_type, processed_at DESC)
+INCLUDE (keyword_count);
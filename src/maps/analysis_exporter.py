@@ -8,14 +8,33 @@ Provides easy-to-use functions for:
 - Common query patterns
 """
 
+import asyncio
 import csv
+import itertools
 import json
+import operator
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from supabase import create_client, Client
 import os
 
+from .utils import write_csv_fast, write_json_fast
+
+# Optional streaming Arrow writer for the paginated CSV export path
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pa_csv = None
+
+
+def _compress_exports() -> bool:
+    """Whether CSV exports should be gzip-compressed (env-controlled)."""
+    return os.getenv('ENABLE_EXPORT_COMPRESSION', 'false').lower() == 'true'
+
 
 class AnalysisExporter:
     """Handle data export and analysis from case identifier system"""
@@ -49,12 +68,22 @@ class AnalysisExporter:
                 'file_type': 'xml'
             })
         """
+        # Route the common filters through the filter_analysis_table RPC so
+        # Postgres answers from the composite (segment_type, file_type,
+        # processed_at) index in one scan, instead of stacking per-column
+        # .eq bitmap scans client-side.
+        if filters and set(filters) <= {'segment_type', 'file_type'}:
+            return self.filter_by_criteria(
+                file_types=[filters['file_type']] if 'file_type' in filters else None,
+                segment_types=[filters['segment_type']] if 'segment_type' in filters else None,
+            )
+
         query = self.supabase.table('master_analysis_table').select('*')
-        
+
         if filters:
             for column, value in filters.items():
                 query = query.eq(column, value)
-        
+
         response = query.execute()
         return response.data
     
@@ -114,6 +143,94 @@ class AnalysisExporter:
         response = self.supabase.rpc('filter_analysis_table', params).execute()
         return response.data
     
+    def _iter_rows(self, table: str, chunk_size: int = 10_000) -> Iterator[List[Dict]]:
+        """
+        Yield a table's rows in pages instead of one giant SELECT *.
+
+        A single .select('*').execute() materializes the whole result set
+        in memory and in one HTTP response; paging with .range keeps peak
+        memory at chunk_size rows.
+
+        Args:
+            table: Table or view name
+            chunk_size: Rows per page
+
+        Yields:
+            Lists of row dictionaries, one page at a time
+        """
+        offset = 0
+        while True:
+            response = (
+                self.supabase
+                .table(table)
+                .select('*')
+                .range(offset, offset + chunk_size - 1)
+                .execute()
+            )
+            page = response.data
+            if not page:
+                break
+            yield page
+            if len(page) < chunk_size:
+                break
+            offset += chunk_size
+
+    def export_table_to_csv(
+        self,
+        table: str,
+        output_path: str,
+        chunk_size: int = 10_000
+    ) -> Optional[Path]:
+        """
+        Stream a table straight to CSV without materializing all rows.
+
+        Args:
+            table: Table or view name to export
+            output_path: Path for output CSV file
+            chunk_size: Rows fetched and written per page
+
+        Returns:
+            Path object of created file, or None if the table is empty
+        """
+        pages = self._iter_rows(table, chunk_size)
+        first_page = next(pages, None)
+        if not first_page:
+            print(f"⚠️  No data to export from {table}")
+            return None
+
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        total = 0
+
+        if pa is not None:
+            # Arrow CSVWriter appends one table per page: vectorized C
+            # serialization with at most chunk_size rows resident
+            first_table = pa.Table.from_pylist(first_page)
+            with pa_csv.CSVWriter(str(output_file), first_table.schema) as writer:
+                writer.write_table(first_table)
+                total += len(first_page)
+                for page in pages:
+                    writer.write_table(
+                        pa.Table.from_pylist(page, schema=first_table.schema)
+                    )
+                    total += len(page)
+        else:
+            fieldnames = list(first_page[0].keys())
+            getter = operator.itemgetter(*fieldnames)
+
+            with output_file.open('w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                for page in itertools.chain([first_page], pages):
+                    if len(fieldnames) == 1:
+                        writer.writerows((getter(row),) for row in page)
+                    else:
+                        writer.writerows(getter(row) for row in page)
+                    total += len(page)
+
+        print(f"✅ Exported {total} rows to {output_file}")
+        return output_file
+
     def refresh_export_table(self) -> Dict:
         """
         Refresh materialized export_ready_table for latest data
@@ -152,15 +269,14 @@ class AnalysisExporter:
         if not data:
             print(f"⚠️  No data to export")
             return None
-        
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with output_file.open('w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-        
+
+        # Opt-in gzip output: honors ENABLE_RESPONSE_COMPRESSION or an
+        # explicit .gz suffix on the requested path
+        if _compress_exports() and not str(output_path).endswith('.gz'):
+            output_path = f"{output_path}.gz"
+
+        output_file = write_csv_fast(data, output_path)
+
         print(f"✅ Exported {len(data)} rows to {output_file}")
         return output_file
     
@@ -195,61 +311,118 @@ class AnalysisExporter:
             print(f"⚠️  No data to export")
             return None
         
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with output_file.open('w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(data, f, indent=2, default=str)
-            else:
-                json.dump(data, f, default=str)
-        
+        output_file = write_json_fast(data, output_path, pretty=pretty)
+
         print(f"✅ Exported {len(data)} rows to {output_file}")
         return output_file
     
     def get_summary_stats(self) -> Dict:
         """
         Get high-level statistics about the dataset
-        
+
+        Aggregation runs server-side via the summary_stats() Postgres
+        function (migration 018), so only the grouped counts cross the
+        network instead of every row of four tables. Falls back to
+        client-side counting if the function is not installed yet.
+
         Returns:
             Dict with counts and distributions
         """
-        stats = {}
-        
-        # File counts
-        files = self.supabase.table('file_imports').select('extension, processing_status').execute()
-        stats['total_files'] = len(files.data)
-        stats['files_by_type'] = {}
-        stats['files_by_status'] = {}
-        
-        for file in files.data:
-            ext = file['extension']
-            status = file['processing_status']
-            stats['files_by_type'][ext] = stats['files_by_type'].get(ext, 0) + 1
-            stats['files_by_status'][status] = stats['files_by_status'].get(status, 0) + 1
-        
-        # Segment counts
-        segments = self.supabase.table('unified_segments').select('segment_type').execute()
-        stats['total_segments'] = len(segments.data)
-        stats['segments_by_type'] = {}
-        
-        for seg in segments.data:
-            seg_type = seg['segment_type']
-            stats['segments_by_type'][seg_type] = stats['segments_by_type'].get(seg_type, 0) + 1
-        
-        # Keyword counts
-        keywords = self.supabase.table('extracted_keywords').select('keyword_id, document_frequency').execute()
-        stats['total_keywords'] = len(keywords.data)
-        
-        if keywords.data:
-            doc_freqs = [k['document_frequency'] for k in keywords.data]
+        try:
+            response = self.supabase.rpc('summary_stats', {}).execute()
+            if response.data is not None:
+                return response.data
+        except Exception as e:
+            print(f"⚠️  summary_stats RPC unavailable ({e}), falling back to client-side counts")
+
+        return self._get_summary_stats_fallback()
+
+    def _count_exact(self, table: str, **eq_filters) -> int:
+        """
+        Count rows without transferring them.
+
+        count='exact' with head=True makes PostgREST return the total in
+        the Content-Range header and zero rows in the body.
+        """
+        query = self.supabase.table(table).select('*', count='exact', head=True)
+        for column, value in eq_filters.items():
+            query = query.eq(column, value)
+        response = query.execute()
+        return response.count or 0
+
+    @staticmethod
+    def _gather_concurrently(tasks: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run independent zero-arg callables concurrently.
+
+        Each callable is a blocking HTTP request with no dependency on the
+        others, so running them via asyncio.gather over worker threads hides
+        all but one round-trip. Falls back to serial execution when already
+        inside a running event loop.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return {name: task() for name, task in tasks.items()}
+
+        async def _run():
+            names = list(tasks)
+            results = await asyncio.gather(
+                *(asyncio.to_thread(tasks[name]) for name in names)
+            )
+            return dict(zip(names, results))
+
+        return asyncio.run(_run())
+
+    def _get_summary_stats_fallback(self) -> Dict:
+        """Client-side aggregation for databases without migration 018"""
+        # All eight queries are independent; issue them in parallel
+        resolved = self._gather_concurrently({
+            # Totals via head-only count queries (O(1) bytes instead of O(N))
+            'total_files': lambda: self._count_exact('file_imports'),
+            'total_segments': lambda: self._count_exact('unified_segments'),
+            'total_keywords': lambda: self._count_exact('extracted_keywords'),
+            'total_case_patterns': lambda: self._count_exact('case_patterns'),
+            'cross_validated_patterns': lambda: self._count_exact(
+                'case_patterns', cross_type_validated=True
+            ),
+            # Distributions still need the (single) grouping column per row
+            'files': lambda: self.supabase.table('file_imports')
+                .select('extension, processing_status').execute().data,
+            'segments': lambda: self.supabase.table('unified_segments')
+                .select('segment_type').execute().data,
+            'keywords': lambda: self.supabase.table('extracted_keywords')
+                .select('document_frequency').execute().data,
+        })
+
+        stats = {
+            key: resolved[key]
+            for key in (
+                'total_files', 'total_segments', 'total_keywords',
+                'total_case_patterns', 'cross_validated_patterns'
+            )
+        }
+
+        # Counter's C-level increment replaces two dict probes per row, and
+        # both file distributions fill in one fused pass
+        types = Counter()
+        statuses = Counter()
+        for file in resolved['files']:
+            types[file['extension']] += 1
+            statuses[file['processing_status']] += 1
+        stats['files_by_type'] = dict(types)
+        stats['files_by_status'] = dict(statuses)
+
+        stats['segments_by_type'] = dict(
+            Counter(seg['segment_type'] for seg in resolved['segments'])
+        )
+
+        if resolved['keywords']:
+            doc_freqs = [k['document_frequency'] for k in resolved['keywords']]
             stats['avg_document_frequency'] = sum(doc_freqs) / len(doc_freqs)
-        
-        # Case pattern counts
-        patterns = self.supabase.table('case_patterns').select('case_id, cross_type_validated').execute()
-        stats['total_case_patterns'] = len(patterns.data)
-        stats['cross_validated_patterns'] = sum(1 for p in patterns.data if p.get('cross_type_validated'))
-        
+
         return stats
     
     def print_summary(self):
@@ -0,0 +1,69 @@
+"""
+Response Cache
+
+In-process TTL cache for idempotent GET handlers.
+
+The read-heavy routers (keywords, parse cases, profiles, pylidc, views)
+serve data that changes rarely but is polled constantly; a cache hit skips
+the SQL round-trip and the JSON serialization entirely because the finished
+response object is reused. Same monotonic-clock memo pattern as
+dependencies.py and the analytics router, generalized into a decorator so
+it can key on the handler's query/path parameters.
+"""
+
+import functools
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from starlette.responses import StreamingResponse
+
+from .config import settings
+
+# Dependency-injected arguments that vary per request but never change the
+# response; they are excluded from the cache key (and are unhashable anyway)
+_NON_KEY_PARAMS = frozenset({"db", "request", "profile_manager"})
+
+# Safety valve: a burst of distinct key combinations (e.g. crawlers walking
+# pylidc filter permutations) flushes the memo rather than growing unbounded
+_MAX_ENTRIES = 1024
+
+
+def ttl_cache(ttl: Optional[float] = None) -> Callable:
+    """
+    Memoize an async GET handler for `ttl` seconds (CACHE_TTL by default).
+
+    The key is the handler's keyword arguments minus injected dependencies,
+    so each path/query combination is computed at most once per TTL window.
+    Exceptions (404s etc.) are never cached. The wrapped handler exposes
+    ``cache_clear()`` for the write endpoints that mutate the underlying
+    data.
+    """
+    def decorator(func: Callable) -> Callable:
+        store: Dict[Tuple, Tuple[float, Any]] = {}
+        max_age = ttl if ttl is not None else settings.CACHE_TTL
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = tuple(sorted(
+                (name, value) for name, value in kwargs.items()
+                if name not in _NON_KEY_PARAMS
+            ))
+            now = time.monotonic()
+            entry = store.get(key)
+            if entry is not None and now - entry[0] < max_age:
+                return entry[1]
+
+            result = await func(*args, **kwargs)
+            # Streaming responses are single-use (their generator is
+            # consumed on send) and must never be replayed from the cache
+            if isinstance(result, StreamingResponse):
+                return result
+            if len(store) >= _MAX_ENTRIES:
+                store.clear()
+            store[key] = (now, result)
+            return result
+
+        wrapper.cache_clear = store.clear
+        return wrapper
+
+    return decorator
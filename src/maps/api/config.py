@@ -4,6 +4,7 @@ API Configuration
 Environment variables and configuration settings for the API.
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -22,6 +23,13 @@ class Settings(BaseModel):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     RELOAD: bool = True
+    # Worker processes for production runs (ignored while RELOAD is on —
+    # uvicorn cannot combine reload with multiple workers). One worker per
+    # core so concurrent uploads are handled in parallel instead of
+    # serialized through a single event loop.
+    WORKERS: int = int(os.getenv("API_WORKERS", str(max(2, os.cpu_count() or 2))))
+    LIMIT_CONCURRENCY: int = int(os.getenv("API_LIMIT_CONCURRENCY", "1000"))
+    TIMEOUT_KEEP_ALIVE: int = int(os.getenv("API_TIMEOUT_KEEP_ALIVE", "5"))
 
     # CORS Settings
     CORS_ORIGINS: list = ["*"]  # Configure for production
@@ -33,6 +41,10 @@ class Settings(BaseModel):
 
     # Database Settings
     DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL", os.getenv("SUPABASE_DB_URL"))
+    # Supavisor transaction-mode pooler (port 6543). Preferred for the API's
+    # short per-request transactions: connections are returned per
+    # transaction instead of each app pool slot pinning a backend.
+    SUPABASE_POOLER_URL: Optional[str] = os.getenv("SUPABASE_POOLER_URL")
 
     # File Storage Settings
     UPLOAD_DIR: Path = Path("./uploads")
@@ -53,6 +65,9 @@ class Settings(BaseModel):
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))  # 5 minutes default
     PYLIDC_CACHE_TTL: int = int(os.getenv("PYLIDC_CACHE_TTL", "3600"))  # 1 hour for PYLIDC metadata
     ENABLE_RESPONSE_COMPRESSION: bool = os.getenv("ENABLE_RESPONSE_COMPRESSION", "true").lower() == "true"
+    # When set (e.g. redis://localhost:6379/0) the keyword read cache is
+    # shared across workers instead of being per-process
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL") or None
 
     # Database Connection Pooling
     DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
@@ -64,8 +79,20 @@ class Settings(BaseModel):
         case_sensitive = True
 
 
-# Global settings instance
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Lazily construct the singleton Settings instance.
 
-# Ensure upload directory exists
-settings.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    os.getenv reads and pydantic validation run once per process instead
+    of on every import cycle; usable directly or as Depends(get_settings).
+    """
+    s = Settings()
+    # Ensure upload directory exists (once, not on every import)
+    s.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    return s
+
+
+# Global settings instance (kept for existing `from .config import settings`
+# callers; resolves through the cached constructor)
+settings = get_settings()
@@ -4,14 +4,22 @@ API Dependencies
 Shared dependencies for FastAPI endpoints.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import create_engine
+from functools import lru_cache
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import QueuePool
-from typing import Generator
+from sqlalchemy.pool import NullPool, QueuePool
+from typing import AsyncGenerator
+import asyncio
 import logging
+import os
+import time
 
-from .config import settings
+from .config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
@@ -19,22 +27,68 @@ logger = logging.getLogger(__name__)
 engine = None
 SessionLocal = None
 
+# Async database engine (asyncpg) for the read-heavy keyword endpoints
+async_engine = None
+AsyncSessionLocal = None
+
+# Monotonic timestamp of the last successful connectivity check, or None
+# when no check has succeeded yet; a burst of requests shouldn't each run
+# its own SELECT 1
+_last_healthcheck_ok = None
+
+# CPU-bound parse work (lxml, PDF text extraction, zip inflate) runs in a
+# process pool so concurrent uploads don't serialize on the event-loop
+# thread or fight the GIL. The semaphore keeps at most one queued job per
+# core so a burst of uploads degrades gracefully instead of piling futures.
+PARSE_SEMAPHORE = asyncio.Semaphore(os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=1)
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared parser process pool (one worker per core)."""
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
 def get_db_engine():
-    """Get or create database engine with connection pooling"""
+    """
+    Get or create database engine with connection pooling.
+
+    When SUPABASE_POOLER_URL (or a DATABASE_URL on port 6543) is
+    configured, pooling is delegated to Supavisor's transaction mode:
+    app-side QueuePool slots would otherwise pin session-mode backends
+    indefinitely, which is the limiting factor at scale. NullPool hands
+    every short request transaction to the pooler. Note transaction mode
+    does not support prepared statements, so psycopg2's default
+    unprepared execution is required here.
+    """
     global engine
     if engine is None:
-        if not settings.DATABASE_URL:
+        database_url = settings.SUPABASE_POOLER_URL or settings.DATABASE_URL
+        if not database_url:
             raise ValueError("DATABASE_URL not configured")
-        engine = create_engine(
-            settings.DATABASE_URL,
-            poolclass=QueuePool,
-            pool_size=settings.DB_POOL_SIZE,
-            max_overflow=settings.DB_MAX_OVERFLOW,
-            pool_recycle=settings.DB_POOL_RECYCLE,
-            pool_timeout=settings.DB_POOL_TIMEOUT,
-            pool_pre_ping=True,  # Verify connections before using
-            echo=False
-        )
+
+        # query_cache_size: the services execute a fixed set of statements
+        # hoisted to module scope, so a roomy compiled cache means each is
+        # compiled once per process rather than per request
+        if ":6543" in database_url:
+            # Transaction-mode pooler: no app-side pooling on top
+            engine = create_engine(
+                database_url,
+                poolclass=NullPool,
+                query_cache_size=1200,
+                echo=False
+            )
+        else:
+            engine = create_engine(
+                database_url,
+                poolclass=QueuePool,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_pre_ping=True,  # Verify connections before using
+                query_cache_size=1200,
+                echo=False
+            )
     return engine
 
 
@@ -50,10 +104,80 @@ def get_session_local():
     return SessionLocal
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_async_db_engine():
+    """
+    Get or create the asyncpg-backed engine.
+
+    Mirrors get_db_engine's pooling rules. Through the transaction-mode
+    pooler, asyncpg's automatic prepared statements must be disabled
+    (statement_cache_size=0): Supavisor may hand consecutive statements
+    to different backends, where a previously prepared name is unknown.
+    """
+    global async_engine
+    if async_engine is None:
+        database_url = settings.SUPABASE_POOLER_URL or settings.DATABASE_URL
+        if not database_url:
+            raise ValueError("DATABASE_URL not configured")
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+        if ":6543" in database_url:
+            async_engine = create_async_engine(
+                database_url,
+                poolclass=NullPool,
+                connect_args={"statement_cache_size": 0},
+                query_cache_size=1200,
+                echo=False
+            )
+        else:
+            async_engine = create_async_engine(
+                database_url,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_pre_ping=True,
+                query_cache_size=1200,
+                echo=False
+            )
+    return async_engine
+
+
+def get_async_session_local():
+    """Get or create the async session factory"""
+    global AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        AsyncSessionLocal = async_sessionmaker(
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_async_db_engine()
+        )
+    return AsyncSessionLocal
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for async database sessions.
+
+    Query I/O awaits on the event loop instead of occupying a threadpool
+    worker per request, so concurrent reads multiplex on one thread.
+
+    Yields:
+        Async database session
+    """
+    AsyncSessionLocal = get_async_session_local()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_db() -> AsyncGenerator[Session, None]:
     """
     Dependency for database sessions.
 
+    Declared async so FastAPI resolves it on the event loop instead of
+    bouncing through the threadpool: constructing/closing a Session is
+    non-blocking, so the offload only added latency and tied up worker
+    threads needed for the actual (sync) query execution.
+
     Yields:
         Database session
     """
@@ -66,17 +190,32 @@ def get_db() -> Generator[Session, None, None]:
 
 
 def verify_database_connection():
-    """Verify database connection is available"""
-    if not settings.DATABASE_URL:
+    """
+    Verify database connection is available.
+
+    A successful check is remembered for CACHE_TTL seconds so bursts of
+    requests don't all open a connection to run SELECT 1; any failure
+    invalidates the memo immediately.
+    """
+    global _last_healthcheck_ok
+
+    if not settings.DATABASE_URL and not settings.SUPABASE_POOLER_URL:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database not configured"
         )
+
+    now = time.monotonic()
+    if _last_healthcheck_ok is not None and now - _last_healthcheck_ok < settings.CACHE_TTL:
+        return
+
     try:
         engine = get_db_engine()
         with engine.connect() as conn:
-            conn.execute("SELECT 1")
+            conn.execute(text("SELECT 1"))
+        _last_healthcheck_ok = now
     except Exception as e:
+        _last_healthcheck_ok = None
         logger.error(f"Database connection failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -4,11 +4,15 @@ MAPS FastAPI Application
 Main FastAPI application with all routers and middleware.
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.routing import Route
+import functools
+import itertools
 import logging
+import orjson
 
 from .config import settings
 from .routers import (
@@ -36,13 +40,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# FastAPI re-answers "is this field a sequence?" twice per query parameter on
+# every request while solving dependencies, and the answer never changes for
+# a given field. Memoizing it cuts measurable setup time on query-heavy
+# routes (list_documents, list_queue_items). The hook is a private FastAPI
+# module, so degrade gracefully if it moves in a future release.
+try:
+    from fastapi import _compat as _fastapi_compat
+
+    _is_sequence_field_orig = _fastapi_compat.is_sequence_field
+    # Keyed by id() because ModelField is an unhashable dataclass; the memo
+    # also holds the field itself so the id can't be recycled. Fields are
+    # created once per route at startup, so this stays small and hot.
+    _is_sequence_memo = {}
+
+    @functools.wraps(_is_sequence_field_orig)
+    def _is_sequence_field_cached(field):
+        entry = _is_sequence_memo.get(id(field))
+        if entry is None:
+            entry = (field, _is_sequence_field_orig(field))
+            _is_sequence_memo[id(field)] = entry
+        return entry[1]
+
+    _fastapi_compat.is_sequence_field = _is_sequence_field_cached
+except (ImportError, AttributeError):  # pragma: no cover - fastapi internals moved
+    logger.debug("fastapi._compat.is_sequence_field not patchable; skipping memoization")
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version=settings.API_VERSION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes responses in C (including datetimes/UUIDs natively),
+    # which is the single biggest win for the list-heavy GET endpoints
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -54,9 +87,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add response compression for large payloads
+# Add response compression for large payloads. compresslevel=5 keeps nearly
+# all of the ratio on repetitive JSON at a fraction of level 9's CPU cost.
 if settings.ENABLE_RESPONSE_COMPRESSION:
-    app.add_middleware(GZipMiddleware, minimum_size=1000)  # Compress responses > 1KB
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # Add file size limit middleware for uploads
@@ -70,7 +104,7 @@ async def limit_upload_size(request: Request, call_next):
         if "multipart/form-data" in content_type or "application/octet-stream" in content_type:
             content_length = request.headers.get("content-length")
             if content_length and int(content_length) > max_upload_size:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=413,
                     content={
                         "error": "File too large",
@@ -83,95 +117,131 @@ async def limit_upload_size(request: Request, call_next):
     return response
 
 
-# Include routers
-app.include_router(profiles.router, prefix="/api/v1/profiles", tags=["Profiles"])
-app.include_router(approval_queue.router, prefix="/api/v1/approval-queue", tags=["Approval Queue"])
-app.include_router(detection_details.router, prefix="/api/v1/detection-details", tags=["Detection Details"])
-app.include_router(parse_cases.router, prefix="/api/v1/parse-cases", tags=["Parse Cases"])
-app.include_router(parse.router, prefix="/api/v1/parse", tags=["Parsing"])
-app.include_router(pylidc.router, prefix="/api/v1/pylidc", tags=["PYLIDC"])
+# Include routers. Starlette matches routes linearly, so the read-heavy
+# routers polled by the UI (documents, keywords, analytics, approval queue)
+# are mounted first and admin/setup routers last — hot endpoints resolve
+# after the fewest path comparisons.
 app.include_router(documents.router, prefix="/api/v1/documents", tags=["Documents"])
 app.include_router(keywords.router, prefix="/api/v1/keywords", tags=["Keywords"])
+app.include_router(analytics.router, prefix="/api/v1/analytics", tags=["Analytics"])
+app.include_router(approval_queue.router, prefix="/api/v1/approval-queue", tags=["Approval Queue"])
+app.include_router(batch.router, prefix="/api/v1/batch", tags=["Batch"])
+app.include_router(search.router, prefix="/api/v1/search", tags=["Search"])
+app.include_router(parse.router, prefix="/api/v1/parse", tags=["Parsing"])
+app.include_router(parse_cases.router, prefix="/api/v1/parse-cases", tags=["Parse Cases"])
+app.include_router(detection_details.router, prefix="/api/v1/detection-details", tags=["Detection Details"])
 app.include_router(views.router, prefix="/api/v1/views", tags=["Views"])
 app.include_router(export.router, prefix="/api/v1/export", tags=["Export"])
 app.include_router(visualization.router, prefix="/api/v1/3d", tags=["3D Visualization"])
-app.include_router(analytics.router, prefix="/api/v1/analytics", tags=["Analytics"])
+app.include_router(pylidc.router, prefix="/api/v1/pylidc", tags=["PYLIDC"])
 app.include_router(database.router, prefix="/api/v1/db", tags=["Database"])
-app.include_router(batch.router, prefix="/api/v1/batch", tags=["Batch"])
-app.include_router(search.router, prefix="/api/v1/search", tags=["Search"])
+app.include_router(profiles.router, prefix="/api/v1/profiles", tags=["Profiles"])
 
 
-@app.get("/", tags=["Root"])
-async def root():
-    """API root endpoint with service information"""
-    return {
-        "service": settings.API_TITLE,
-        "version": settings.API_VERSION,
-        "description": settings.API_DESCRIPTION,
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "endpoints": {
-            "parse_cases": "/api/v1/parse-cases",
-            "parse": "/api/v1/parse",
-            "pylidc": "/api/v1/pylidc",
-            "documents": "/api/v1/documents",
-            "keywords": "/api/v1/keywords",
-            "views": "/api/v1/views",
-            "export": "/api/v1/export",
-            "3d": "/api/v1/3d",
-            "analytics": "/api/v1/analytics",
-            "database": "/api/v1/db",
-            "batch": "/api/v1/batch",
-            "search": "/api/v1/search"
-        }
+# Root and health are polled constantly (load balancers hit /health every
+# second) and their payloads are static, so they are registered as plain
+# Starlette routes at the head of the route table with bodies serialized
+# once at import time — no dependency solving, no per-request encoding.
+_ROOT_BODY = orjson.dumps({
+    "service": settings.API_TITLE,
+    "version": settings.API_VERSION,
+    "description": settings.API_DESCRIPTION,
+    "docs": "/docs",
+    "redoc": "/redoc",
+    "endpoints": {
+        "parse_cases": "/api/v1/parse-cases",
+        "parse": "/api/v1/parse",
+        "pylidc": "/api/v1/pylidc",
+        "documents": "/api/v1/documents",
+        "keywords": "/api/v1/keywords",
+        "views": "/api/v1/views",
+        "export": "/api/v1/export",
+        "3d": "/api/v1/3d",
+        "analytics": "/api/v1/analytics",
+        "database": "/api/v1/db",
+        "batch": "/api/v1/batch",
+        "search": "/api/v1/search"
     }
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": settings.API_TITLE,
+    "version": settings.API_VERSION
+})
+
+
+async def _root(request: Request) -> Response:
+    """API root endpoint with service information"""
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health", tags=["Health"])
-async def health_check(detailed: bool = False):
+async def _health(request: Request) -> Response:
     """
-    Health check endpoint
+    Health check endpoint.
 
-    Args:
-        detailed: If True, includes database and service status checks
+    The default (non-detailed) response is a pre-serialized static body;
+    ?detailed=true still runs the database and service checks.
     """
+    if request.query_params.get("detailed") not in (None, "", "false", "0"):
+        return ORJSONResponse(_detailed_health())
+
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+def _detailed_health() -> dict:
+    """Full health payload including database and service status checks."""
     response = {
         "status": "healthy",
         "service": settings.API_TITLE,
         "version": settings.API_VERSION
     }
 
-    if detailed:
-        # Check database connectivity
-        try:
-            from .database import get_session
-            db = next(get_session())
-            db.execute("SELECT 1")
-            db.close()
-            database_status = "connected"
-        except Exception as e:
-            logger.warning(f"Database health check failed: {e}")
-            database_status = "unavailable"
-
-        response["database"] = {
-            "status": database_status,
-            "backend": settings.DATABASE_BACKEND if hasattr(settings, 'DATABASE_BACKEND') else "unknown"
-        }
+    # Check database connectivity
+    try:
+        from .database import get_session
+        db = next(get_session())
+        db.execute("SELECT 1")
+        db.close()
+        database_status = "connected"
+    except Exception as e:
+        logger.warning(f"Database health check failed: {e}")
+        database_status = "unavailable"
 
-        response["services"] = {
-            "api": "operational",
-            "parsing": "operational",
-            "export": "operational"
-        }
+    response["database"] = {
+        "status": database_status,
+        "backend": settings.DATABASE_BACKEND if hasattr(settings, 'DATABASE_BACKEND') else "unknown"
+    }
+
+    response["services"] = {
+        "api": "operational",
+        "parsing": "operational",
+        "export": "operational"
+    }
 
     return response
 
 
+# Inserted at the head of the route table so the load-balancer endpoints
+# short-circuit route matching entirely
+app.router.routes.insert(0, Route("/health", _health, methods=["GET"]))
+app.router.routes.insert(0, Route("/", _root, methods=["GET"]))
+
+
+# Sampling counter for the exception handler: full tracebacks are logged for
+# one error in 100 so a malformed-request storm can't melt the error path
+# with traceback formatting, while still leaving a stack to debug from
+_error_counter = itertools.count()
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    if next(_error_counter) % 100 == 0 or logger.isEnabledFor(logging.DEBUG):
+        logger.error("Unhandled exception: %s", exc, exc_info=True)
+    else:
+        logger.error("%s: %s (path: %s)", type(exc).__name__, exc, request.url.path)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -187,6 +257,31 @@ async def startup_event():
     logger.info(f"Starting {settings.API_TITLE} v{settings.API_VERSION}")
     logger.info(f"Documentation available at /docs")
 
+    # Pydantic builds TypeAdapter core schemas lazily, which shows up as a
+    # latency spike on the first request to each endpoint. Walk the schemas
+    # of the response models (and the queue models) once here so the cost is
+    # paid at boot instead of on a live request.
+    from pydantic import TypeAdapter
+    from .models.responses import (
+        ParseResponse,
+        DocumentResponse,
+        KeywordResponse,
+        AnalyticsResponse,
+        BatchJobResponse,
+        ExportResponse,
+    )
+    from .routers.approval_queue import QueueItem, QueueStats
+
+    for model in (ParseResponse, DocumentResponse, KeywordResponse,
+                  AnalyticsResponse, BatchJobResponse, ExportResponse,
+                  QueueItem, QueueStats):
+        TypeAdapter(model).core_schema  # noqa: B018 - forces the schema build
+
+    # Warm the shared keyword-extraction pipeline (loads medical_terms.json
+    # and builds the lookup maps) so the first /extract doesn't pay for it
+    from .services.keyword_service import get_normalizer
+    get_normalizer()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -200,5 +295,15 @@ if __name__ == "__main__":
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.RELOAD
+        reload=settings.RELOAD,
+        # uvloop + httptools (bundled with uvicorn[standard]) roughly double
+        # small-response throughput over the asyncio/h11 defaults; the access
+        # log and per-response Server/Date headers are further per-request
+        # overhead we don't need (structured logging covers observability)
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        proxy_headers=False,
+        server_header=False,
+        date_header=False
     )
@@ -4,10 +4,21 @@ API Request Models
 Pydantic models for validating incoming API requests.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
+# Shared config for all request models: these are parse-once, read-only
+# payloads on the hot POST path, so frozen immutability plus disabled
+# assignment validation keeps per-request construction cost minimal.
+_REQUEST_CONFIG = ConfigDict(
+    extra="ignore",
+    frozen=True,
+    str_strip_whitespace=False,
+    validate_assignment=False,
+    arbitrary_types_allowed=False,
+)
+
 
 class ProfileType(str, Enum):
     """Supported parsing profiles"""
@@ -27,6 +38,8 @@ class ExportFormat(str, Enum):
 class ParseRequest(BaseModel):
     """Request model for parsing a single file"""
 
+    model_config = _REQUEST_CONFIG
+
     profile: ProfileType = Field(
         default=ProfileType.LIDC_IDRI,
         description="Parsing profile to use"
@@ -52,6 +65,8 @@ class ParseRequest(BaseModel):
 class BatchParseRequest(BaseModel):
     """Request model for batch parsing multiple files"""
 
+    model_config = _REQUEST_CONFIG
+
     profile: ProfileType = Field(
         default=ProfileType.LIDC_IDRI,
         description="Parsing profile to use"
@@ -70,11 +85,17 @@ class BatchParseRequest(BaseModel):
         default=True,
         description="Whether to extract keywords"
     )
+    wait: bool = Field(
+        default=True,
+        description="Wait for the batch to finish; if false, return the job id immediately"
+    )
 
 
 class DetectRequest(BaseModel):
     """Request model for parse case detection"""
 
+    model_config = _REQUEST_CONFIG
+
     analyze_structure: bool = Field(
         default=True,
         description="Include detailed structure analysis"
@@ -84,6 +105,8 @@ class DetectRequest(BaseModel):
 class PyLIDCImportRequest(BaseModel):
     """Request model for PYLIDC import"""
 
+    model_config = _REQUEST_CONFIG
+
     patient_id: Optional[str] = Field(
         default=None,
         description="Specific patient ID to import"
@@ -102,11 +125,19 @@ class PyLIDCImportRequest(BaseModel):
         default=True,
         description="Detect and assign parse case"
     )
+    concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Scans converted in parallel during batch import"
+    )
 
 
 class SearchRequest(BaseModel):
     """Request model for document search"""
 
+    model_config = _REQUEST_CONFIG
+
     query: str = Field(
         ...,
         min_length=1,
@@ -137,6 +168,8 @@ class SearchRequest(BaseModel):
 class ExportRequest(BaseModel):
     """Request model for data export"""
 
+    model_config = _REQUEST_CONFIG
+
     format: ExportFormat = Field(
         ...,
         description="Export format"
@@ -166,6 +199,8 @@ class ExportRequest(BaseModel):
 class CustomQueryRequest(BaseModel):
     """Request model for custom SQL query"""
 
+    model_config = _REQUEST_CONFIG
+
     query: str = Field(
         ...,
         min_length=1,
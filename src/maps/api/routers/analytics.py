@@ -5,74 +5,87 @@ Endpoints for analytics and statistics.
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Awaitable, Callable, Dict, Tuple
 import logging
+import time
 
+from ..config import settings
 from ..models.responses import AnalyticsResponse
-from ..dependencies import get_db
-from ..services.analytics_service import AnalyticsService
+from ..dependencies import get_async_db
+from ..services.analytics_service import analytics_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# TTL memo for the aggregation endpoints: dashboards poll these every few
+# seconds but the underlying aggregates change only when documents are
+# written, so each key is computed at most once per CACHE_TTL window.
+# Write endpoints call invalidate_analytics_cache() to drop stale entries
+# immediately. (Same monotonic-clock memo pattern as dependencies.py; not
+# worth a cachetools dependency.)
+_analytics_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+async def _cached(key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the memoized value for key, recomputing it after CACHE_TTL."""
+    now = time.monotonic()
+    entry = _analytics_cache.get(key)
+    if entry is not None and now - entry[0] < settings.CACHE_TTL:
+        return entry[1]
+
+    value = await compute()
+    _analytics_cache[key] = (now, value)
+    return value
+
+
+def invalidate_analytics_cache() -> None:
+    """Drop all cached analytics; called after document writes."""
+    _analytics_cache.clear()
+
 
 @router.get("/dashboard")
 async def get_dashboard():
     """Dashboard statistics - aggregated view"""
-    # Return basic stats - will be populated as data is processed
-    return {
-        "total_documents": 0,
-        "total_keywords": 0,
-        "total_parse_cases": 0,
-        "total_jobs": 0,
-        "recent_uploads": 0,
-        "processing_jobs": 0,
-        "parse_case_distribution": {},
-        "keyword_trends": [],
-        "processing_trends": []
-    }
+    # All six sections gathered concurrently on per-query sessions, so
+    # the dashboard pays for its slowest aggregation rather than the sum
+    return await _cached("get_dashboard", analytics_service.get_dashboard)
 
 
 @router.get("/summary")
-async def get_summary(db: Session = Depends(get_db)):
+async def get_summary(db: AsyncSession = Depends(get_async_db)):
     """Database overview statistics"""
-    service = AnalyticsService(db)
-    return service.get_summary()
+    return await _cached("get_summary", lambda: analytics_service.get_summary(db))
 
 
 @router.get("/parse-cases")
-async def get_parse_case_distribution(db: Session = Depends(get_db)):
+async def get_parse_case_distribution(db: AsyncSession = Depends(get_async_db)):
     """Parse case distribution"""
-    service = AnalyticsService(db)
-    return service.get_parse_case_distribution()
+    return await _cached("get_parse_case_distribution", lambda: analytics_service.get_parse_case_distribution(db))
 
 
 @router.get("/keywords")
-async def get_keyword_stats(db: Session = Depends(get_db)):
+async def get_keyword_stats(db: AsyncSession = Depends(get_async_db)):
     """Keyword statistics"""
-    service = AnalyticsService(db)
-    return service.get_keyword_stats()
+    return await _cached("get_keyword_stats", lambda: analytics_service.get_keyword_stats(db))
 
 
 @router.get("/inter-rater")
-async def get_inter_rater_reliability(db: Session = Depends(get_db)):
+async def get_inter_rater_reliability(db: AsyncSession = Depends(get_async_db)):
     """Inter-rater reliability metrics"""
-    service = AnalyticsService(db)
-    return service.get_inter_rater_reliability()
+    return await _cached("get_inter_rater_reliability", lambda: analytics_service.get_inter_rater_reliability(db))
 
 
 @router.get("/completeness")
-async def get_data_completeness(db: Session = Depends(get_db)):
+async def get_data_completeness(db: AsyncSession = Depends(get_async_db)):
     """Data completeness metrics"""
-    service = AnalyticsService(db)
-    return service.get_completeness_metrics()
+    return await _cached("get_completeness_metrics", lambda: analytics_service.get_completeness_metrics(db))
 
 
 @router.get("/case-identifier")
-async def get_case_identifier_stats(db: Session = Depends(get_db)):
+async def get_case_identifier_stats(db: AsyncSession = Depends(get_async_db)):
     """Case validation statistics"""
-    service = AnalyticsService(db)
-    return service.get_case_identifier_stats()
+    return await _cached("get_case_identifier_stats", lambda: analytics_service.get_case_identifier_stats(db))
 
 
 @router.get("/trends")
@@ -5,9 +5,12 @@ Manages files awaiting approval due to low confidence scores.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Annotated, Dict, List, Optional
 from pydantic import BaseModel, Field
+import asyncio
+import heapq
 import logging
 from datetime import datetime
 
@@ -29,6 +32,10 @@ class QueueItem(BaseModel):
     file_type: str
     file_size: int
     uploaded_at: datetime
+    # ISO rendering of uploaded_at, computed once at enqueue time; ISO 8601
+    # sorts lexicographically, so internal orderings compare this string
+    # instead of re-deriving datetime keys per request
+    uploaded_at_iso: str = ""
     status: str = "pending"  # pending, approved, rejected
     reviewed_by: Optional[str] = None
     reviewed_at: Optional[datetime] = None
@@ -56,12 +63,73 @@ class QueueStats(BaseModel):
     oldest_pending: Optional[datetime] = None
 
 
-# In-memory queue for now (in production, this would be in database)
-_approval_queue: List[QueueItem] = []
+# In-memory queue for now (in production, this would be in database).
+# Keyed by item id: every GET/POST/DELETE resolves an item, and a dict makes
+# that O(1) instead of an O(N) scan. Insertion order (= upload order) is
+# preserved, which the listing endpoints rely on.
+_approval_queue: Dict[str, QueueItem] = {}
 _queue_counter = 0
 
-
-@router.get("/stats", response_model=QueueStats)
+# Running statistics, maintained incrementally by add_to_queue /
+# review_queue_item / delete_queue_item so /stats is O(1) regardless of
+# queue size. conf_sum and the low/med buckets track *pending* items only,
+# matching what the endpoint has always reported.
+_stats = {
+    "pending": 0,
+    "approved": 0,
+    "rejected": 0,
+    "conf_sum": 0.0,
+    "low": 0,   # pending with confidence < 0.5
+    "med": 0,   # pending with 0.5 <= confidence < 0.75
+}
+# Min-heap of (uploaded_at, item_id) for pending items; stale entries
+# (reviewed or deleted items) are popped lazily when stats are read
+_oldest_heap: list = []
+
+# Serializes review mutations so concurrent reviews of the same item (e.g.
+# from batch_review fan-out) can't both pass the pending check
+_queue_lock = asyncio.Lock()
+
+# JSON-ready dict per item, built once on the write paths (add/review)
+# instead of re-running model_dump for every item on every list request.
+# Items only change shape on review, so the cache is trivially kept in sync.
+_payload_cache: Dict[str, dict] = {}
+
+
+def _stats_add_pending(item: QueueItem) -> None:
+    _stats["pending"] += 1
+    _stats["conf_sum"] += item.confidence
+    if item.confidence < 0.5:
+        _stats["low"] += 1
+    elif item.confidence < 0.75:
+        _stats["med"] += 1
+    heapq.heappush(_oldest_heap, (item.uploaded_at_iso, item.id))
+
+
+def _stats_remove_pending(item: QueueItem) -> None:
+    _stats["pending"] -= 1
+    _stats["conf_sum"] -= item.confidence
+    if item.confidence < 0.5:
+        _stats["low"] -= 1
+    elif item.confidence < 0.75:
+        _stats["med"] -= 1
+
+
+def _oldest_pending() -> Optional[str]:
+    """Peek the oldest pending upload time (ISO), discarding stale entries."""
+    while _oldest_heap:
+        uploaded_at_iso, item_id = _oldest_heap[0]
+        item = _approval_queue.get(item_id)
+        if item is not None and item.status == "pending":
+            return uploaded_at_iso
+        heapq.heappop(_oldest_heap)
+    return None
+
+
+# GET endpoints below skip response_model: queue items are built by trusted
+# server code, so the Pydantic re-validation pass adds nothing. OpenAPI
+# schemas are preserved through `responses=`.
+@router.get("/stats", responses={200: {"model": QueueStats}})
 async def get_queue_stats():
     """
     Get approval queue statistics.
@@ -69,35 +137,27 @@ async def get_queue_stats():
     Returns:
         Summary statistics for the approval queue
     """
-    pending_items = [item for item in _approval_queue if item.status == "pending"]
-    approved_items = [item for item in _approval_queue if item.status == "approved"]
-    rejected_items = [item for item in _approval_queue if item.status == "rejected"]
-
-    confidences = [item.confidence for item in pending_items] if pending_items else [0]
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-
-    low_conf = len([item for item in pending_items if item.confidence < 0.5])
-    med_conf = len([item for item in pending_items if 0.5 <= item.confidence < 0.75])
-
-    oldest = min([item.uploaded_at for item in pending_items]) if pending_items else None
-
-    return QueueStats(
-        total_pending=len(pending_items),
-        total_approved=len(approved_items),
-        total_rejected=len(rejected_items),
-        avg_confidence=avg_confidence,
-        low_confidence_count=low_conf,
-        medium_confidence_count=med_conf,
-        oldest_pending=oldest
-    )
-
-
-@router.get("", response_model=List[QueueItem])
+    # All counters are maintained incrementally on the write paths; no scans
+    pending = _stats["pending"]
+    oldest = _oldest_pending()
+
+    return ORJSONResponse({
+        "total_pending": pending,
+        "total_approved": _stats["approved"],
+        "total_rejected": _stats["rejected"],
+        "avg_confidence": _stats["conf_sum"] / pending if pending else 0,
+        "low_confidence_count": _stats["low"],
+        "medium_confidence_count": _stats["med"],
+        "oldest_pending": oldest
+    })
+
+
+@router.get("", responses={200: {"model": List[QueueItem]}})
 async def list_queue_items(
-    status: Optional[str] = Query(None, regex="^(pending|approved|rejected)$"),
-    min_confidence: Optional[float] = Query(None, ge=0.0, le=1.0),
-    max_confidence: Optional[float] = Query(None, ge=0.0, le=1.0),
-    limit: int = Query(100, ge=1, le=1000)
+    status: Annotated[Optional[str], Query(pattern="^(pending|approved|rejected)$")] = None,
+    min_confidence: Annotated[Optional[float], Query(ge=0.0, le=1.0)] = None,
+    max_confidence: Annotated[Optional[float], Query(ge=0.0, le=1.0)] = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100
 ):
     """
     List items in approval queue.
@@ -111,26 +171,28 @@ async def list_queue_items(
     Returns:
         List of queue items matching filters
     """
-    items = _approval_queue.copy()
-
-    # Apply filters
-    if status:
-        items = [item for item in items if item.status == status]
-    if min_confidence is not None:
-        items = [item for item in items if item.confidence >= min_confidence]
-    if max_confidence is not None:
-        items = [item for item in items if item.confidence <= max_confidence]
+    # Single fused pass: one generator applies all filters, and
+    # heapq.nsmallest keeps only the top `limit` items — O(N log limit)
+    # with no intermediate list per filter, vs. copy + three
+    # comprehensions + a full O(N log N) sort
+    filtered = (
+        item for item in _approval_queue.values()
+        if (not status or item.status == status)
+        and (min_confidence is None or item.confidence >= min_confidence)
+        and (max_confidence is None or item.confidence <= max_confidence)
+    )
 
-    # Sort by confidence (lowest first for pending items)
+    # Lowest confidence first for pending items, newest first otherwise
+    # (ISO strings compare in chronological order, so no datetime math)
     if not status or status == "pending":
-        items.sort(key=lambda x: x.confidence)
+        items = heapq.nsmallest(limit, filtered, key=lambda x: x.confidence)
     else:
-        items.sort(key=lambda x: x.uploaded_at, reverse=True)
+        items = heapq.nlargest(limit, filtered, key=lambda x: x.uploaded_at_iso)
 
-    return items[:limit]
+    return ORJSONResponse([_payload_cache[item.id] for item in items])
 
 
-@router.get("/{item_id}", response_model=QueueItem)
+@router.get("/{item_id}", responses={200: {"model": QueueItem}})
 async def get_queue_item(item_id: str):
     """
     Get specific queue item.
@@ -144,11 +206,11 @@ async def get_queue_item(item_id: str):
     Raises:
         404: Item not found
     """
-    for item in _approval_queue:
-        if item.id == item_id:
-            return item
+    item = _approval_queue.get(item_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"Queue item '{item_id}' not found")
 
-    raise HTTPException(status_code=404, detail=f"Queue item '{item_id}' not found")
+    return ORJSONResponse(_payload_cache[item_id])
 
 
 @router.post("/{item_id}/review", response_model=QueueItem)
@@ -170,37 +232,41 @@ async def review_queue_item(
         404: Item not found
         400: Invalid action or item already reviewed
     """
-    # Find item
-    item = None
-    for i, queue_item in enumerate(_approval_queue):
-        if queue_item.id == item_id:
-            item = queue_item
-            break
-
-    if not item:
-        raise HTTPException(status_code=404, detail=f"Queue item '{item_id}' not found")
+    async with _queue_lock:
+        item = _approval_queue.get(item_id)
+        if item is None:
+            raise HTTPException(status_code=404, detail=f"Queue item '{item_id}' not found")
+
+        if item.status != "pending":
+            raise HTTPException(
+                status_code=400,
+                detail=f"Item already reviewed with status: {item.status}"
+            )
 
-    if item.status != "pending":
-        raise HTTPException(
-            status_code=400,
-            detail=f"Item already reviewed with status: {item.status}"
+        # Update item and keep the running stats in sync
+        _stats_remove_pending(item)
+        item.status = "approved" if request.action == "approve" else "rejected"
+        _stats[item.status] += 1
+        item.reviewed_by = request.reviewed_by
+        item.reviewed_at = datetime.now()
+        item.notes = request.notes
+
+        # Override parse case if provided
+        if request.parse_case:
+            item.detected_parse_case = request.parse_case
+
+        _payload_cache[item.id] = item.model_dump(mode="json")
+
+    # %s-style args defer formatting until a handler actually wants the
+    # record; the isEnabledFor gate skips even building the multi-field call
+    # at WARNING and above
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Queue item %s %s by %s. Parse case: %s (confidence: %s)",
+            item_id, item.status, item.reviewed_by,
+            item.detected_parse_case, item.confidence
         )
 
-    # Update item
-    item.status = "approved" if request.action == "approve" else "rejected"
-    item.reviewed_by = request.reviewed_by
-    item.reviewed_at = datetime.now()
-    item.notes = request.notes
-
-    # Override parse case if provided
-    if request.parse_case:
-        item.detected_parse_case = request.parse_case
-
-    logger.info(
-        f"Queue item {item_id} {item.status} by {item.reviewed_by}. "
-        f"Parse case: {item.detected_parse_case} (confidence: {item.confidence})"
-    )
-
     return item
 
 
@@ -219,14 +285,8 @@ async def reprocess_item(item_id: str):
         404: Item not found
         400: Item not approved
     """
-    # Find item
-    item = None
-    for queue_item in _approval_queue:
-        if queue_item.id == item_id:
-            item = queue_item
-            break
-
-    if not item:
+    item = _approval_queue.get(item_id)
+    if item is None:
         raise HTTPException(status_code=404, detail=f"Queue item '{item_id}' not found")
 
     if item.status != "approved":
@@ -259,22 +319,27 @@ async def delete_queue_item(item_id: str):
     Raises:
         404: Item not found
     """
-    for i, item in enumerate(_approval_queue):
-        if item.id == item_id:
-            _approval_queue.pop(i)
-            logger.info(f"Deleted queue item {item_id}")
-            return {
-                "status": "success",
-                "message": f"Queue item '{item_id}' deleted"
-            }
+    item = _approval_queue.pop(item_id, None)
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"Queue item '{item_id}' not found")
 
-    raise HTTPException(status_code=404, detail=f"Queue item '{item_id}' not found")
+    if item.status == "pending":
+        _stats_remove_pending(item)
+    else:
+        _stats[item.status] -= 1
+    _payload_cache.pop(item_id, None)
+
+    logger.info("Deleted queue item %s", item_id)
+    return {
+        "status": "success",
+        "message": f"Queue item '{item_id}' deleted"
+    }
 
 
 @router.post("/batch-review")
 async def batch_review(
-    action: str = Query(..., regex="^(approve|reject)$"),
-    item_ids: List[str] = Query(...),
+    action: Annotated[str, Query(pattern="^(approve|reject)$")],
+    item_ids: Annotated[List[str], Query()],
     reviewed_by: str = "system"
 ):
     """
@@ -288,27 +353,36 @@ async def batch_review(
     Returns:
         Batch operation results
     """
+    # The reviews are independent, so run them concurrently and collect
+    # per-item failures instead of serializing N round-trips
+    request = ApprovalRequest(action=action, reviewed_by=reviewed_by)
+    outcomes = await asyncio.gather(
+        *(review_queue_item(item_id, request) for item_id in item_ids),
+        return_exceptions=True
+    )
+
     results = []
-    for item_id in item_ids:
-        try:
-            request = ApprovalRequest(
-                action=action,
-                reviewed_by=reviewed_by
-            )
-            updated_item = await review_queue_item(item_id, request)
+    success_count = 0
+    for item_id, outcome in zip(item_ids, outcomes):
+        if isinstance(outcome, HTTPException):
             results.append({
                 "item_id": item_id,
-                "status": "success",
-                "action": action
+                "status": "error",
+                "error": outcome.detail
             })
-        except HTTPException as e:
+        elif isinstance(outcome, BaseException):
             results.append({
                 "item_id": item_id,
                 "status": "error",
-                "error": e.detail
+                "error": str(outcome)
+            })
+        else:
+            success_count += 1
+            results.append({
+                "item_id": item_id,
+                "status": "success",
+                "action": action
             })
-
-    success_count = len([r for r in results if r["status"] == "success"])
     return {
         "total": len(item_ids),
         "success": success_count,
@@ -386,24 +460,34 @@ def add_to_queue(
 
     # Auto-approve if confidence is high enough
     if confidence >= DEFAULT_CONFIDENCE_THRESHOLD:
-        logger.info(f"Auto-approved: {filename} (confidence: {confidence})")
+        logger.info("Auto-approved: %s (confidence: %s)", filename, confidence)
         return None
 
-    # Add to queue
+    # Add to queue. model_construct skips field validation, which is safe
+    # here because every value is produced by trusted server code (the parse
+    # detection pipeline) — defaults for the reviewed_* fields must then be
+    # supplied explicitly.
     _queue_counter += 1
-    item = QueueItem(
+    uploaded_at = datetime.now()
+    item = QueueItem.model_construct(
         id=f"q_{_queue_counter}",
         filename=filename,
         detected_parse_case=detected_parse_case,
         confidence=confidence,
         file_type=file_type,
         file_size=file_size,
-        uploaded_at=datetime.now(),
+        uploaded_at=uploaded_at,
+        uploaded_at_iso=uploaded_at.isoformat(),
         status="pending",
+        reviewed_by=None,
+        reviewed_at=None,
+        notes=None,
         detection_details=detection_details
     )
 
-    _approval_queue.append(item)
-    logger.info(f"Added to queue: {filename} (confidence: {confidence})")
+    _approval_queue[item.id] = item
+    _stats_add_pending(item)
+    _payload_cache[item.id] = item.model_dump(mode="json")
+    logger.info("Added to queue: %s (confidence: %s)", filename, confidence)
 
     return item
@@ -15,7 +15,7 @@ from datetime import datetime
 
 from ..models.responses import BatchJobResponse
 from ..dependencies import get_db
-from ..services.batch_service import BatchService
+from ..services.batch_service import batch_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -28,8 +28,7 @@ async def create_batch_job(
     db: Session = Depends(get_db)
 ):
     """Create batch processing job"""
-    service = BatchService(db)
-    return await service.create_job(file_paths, profile=profile)
+    return await batch_service.create_job(db, file_paths, profile=profile)
 
 
 @router.get("/jobs")
@@ -40,9 +39,8 @@ async def list_jobs(
     db: Session = Depends(get_db)
 ):
     """List batch processing jobs with pagination"""
-    service = BatchService(db)
-    jobs = service.list_jobs(skip=skip, limit=limit, status=status)
-    total = service.count_jobs(status=status)
+    jobs = batch_service.list_jobs(db, skip=skip, limit=limit, status=status)
+    total = batch_service.count_jobs(db, status=status)
     
     return {
         "items": jobs,
@@ -56,8 +54,7 @@ async def list_jobs(
 @router.get("/{job_id}", response_model=BatchJobResponse)
 async def get_batch_status(job_id: str, db: Session = Depends(get_db)):
     """Check batch job status"""
-    service = BatchService(db)
-    result = service.get_job_status(job_id)
+    result = batch_service.get_job_status(db, job_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     return result
@@ -66,15 +63,13 @@ async def get_batch_status(job_id: str, db: Session = Depends(get_db)):
 @router.get("/{job_id}/results")
 async def get_batch_results(job_id: str, db: Session = Depends(get_db)):
     """Get batch job results"""
-    service = BatchService(db)
-    return service.get_job_results(job_id)
+    return batch_service.get_job_results(db, job_id)
 
 
 @router.delete("/{job_id}")
 async def cancel_batch_job(job_id: str, db: Session = Depends(get_db)):
     """Cancel batch job"""
-    service = BatchService(db)
-    success = service.cancel_job(job_id)
+    success = batch_service.cancel_job(db, job_id)
     if not success:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     return {"status": "cancelled", "job_id": job_id}
@@ -96,8 +91,7 @@ async def job_progress_websocket(websocket: WebSocket, job_id: str):
             db = SessionLocal()
             
             try:
-                service = BatchService(db)
-                job = service.get_job_status(job_id)
+                job = batch_service.get_job_status(db, job_id)
                 
                 if not job:
                     await websocket.send_json({
@@ -158,8 +152,7 @@ async def job_progress_sse(job_id: str):
         while True:
             db = SessionLocal()
             try:
-                service = BatchService(db)
-                job = service.get_job_status(job_id)
+                job = batch_service.get_job_status(db, job_id)
                 
                 if not job:
                     yield f"data: {json.dumps({'error': 'Job not found'})}\n\n"
@@ -53,7 +53,10 @@ class ParseCaseSchemaResponse(BaseModel):
     attributes: List[dict]
 
 
-@router.get("/queue-item/{queue_item_id}", response_model=DetectionDetailsResponse)
+# Read endpoints return rows our own parser wrote, so the handlers build
+# responses with model_construct and skip the response_model re-validation
+# pass (OpenAPI schema preserved via `responses=`).
+@router.get("/queue-item/{queue_item_id}", responses={200: {"model": DetectionDetailsResponse}})
 async def get_detection_by_queue_item(
     queue_item_id: str,
     db: Session = Depends(get_db)
@@ -81,10 +84,10 @@ async def get_detection_by_queue_item(
             detail=f"Detection details not found for queue item '{queue_item_id}'"
         )
 
-    return DetectionDetailsResponse(**detection.to_dict())
+    return DetectionDetailsResponse.model_construct(**detection.to_dict())
 
 
-@router.get("/document/{document_id}", response_model=DetectionDetailsResponse)
+@router.get("/document/{document_id}", responses={200: {"model": DetectionDetailsResponse}})
 async def get_detection_by_document(
     document_id: str,
     db: Session = Depends(get_db)
@@ -111,10 +114,10 @@ async def get_detection_by_document(
             detail=f"Detection details not found for document '{document_id}'"
         )
 
-    return DetectionDetailsResponse(**detection.to_dict())
+    return DetectionDetailsResponse.model_construct(**detection.to_dict())
 
 
-@router.get("/parse-cases", response_model=List[str])
+@router.get("/parse-cases", responses={200: {"model": List[str]}})
 async def list_parse_cases():
     """
     Get list of all registered parse cases.
@@ -125,7 +128,7 @@ async def list_parse_cases():
     return get_all_parse_cases()
 
 
-@router.get("/parse-cases/{parse_case}/schema", response_model=ParseCaseSchemaResponse)
+@router.get("/parse-cases/{parse_case}/schema", responses={200: {"model": ParseCaseSchemaResponse}})
 async def get_parse_case_schema(parse_case: str):
     """
     Get expected attributes schema for a parse case.
@@ -208,7 +211,7 @@ async def get_detection_stats(db: Session = Depends(get_db)):
     }
 
 
-@router.get("/recent", response_model=List[DetectionDetailsResponse])
+@router.get("/recent", responses={200: {"model": List[DetectionDetailsResponse]}})
 async def list_recent_detections(
     limit: int = Query(50, ge=1, le=500),
     db: Session = Depends(get_db)
@@ -226,10 +229,10 @@ async def list_recent_detections(
         DetectionDetails.detected_at.desc()
     ).limit(limit).all()
 
-    return [DetectionDetailsResponse(**d.to_dict()) for d in detections]
+    return [DetectionDetailsResponse.model_construct(**d.to_dict()) for d in detections]
 
 
-@router.get("/low-confidence", response_model=List[DetectionDetailsResponse])
+@router.get("/low-confidence", responses={200: {"model": List[DetectionDetailsResponse]}})
 async def list_low_confidence_detections(
     threshold: float = Query(0.6, ge=0.0, le=1.0),
     limit: int = Query(100, ge=1, le=500),
@@ -249,4 +252,4 @@ async def list_low_confidence_detections(
         DetectionDetails.confidence < threshold
     ).order_by(DetectionDetails.confidence).limit(limit).all()
 
-    return [DetectionDetailsResponse(**d.to_dict()) for d in detections]
+    return [DetectionDetailsResponse.model_construct(**d.to_dict()) for d in detections]
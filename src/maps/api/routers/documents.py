@@ -5,10 +5,10 @@ API endpoints for document management, search, and export.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query, Response
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_, text
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from pydantic import BaseModel, Field
 import logging
 from datetime import datetime, date
@@ -65,16 +65,20 @@ class DocumentDetail(BaseModel):
     detection_details: Optional[dict] = None
 
 
-@router.get("", response_model=List[DocumentSummary])
+# response_model is intentionally omitted on the trusted read path: the data
+# comes straight from our own ORM rows, so re-validating it through Pydantic
+# plus jsonable_encoder just burns CPU per response. The schema is kept in
+# OpenAPI via `responses=`.
+@router.get("", responses={200: {"model": List[DocumentSummary]}})
 async def list_documents(
-    status: Optional[str] = Query(None, regex="^(pending|processing|completed|failed)$"),
+    status: Annotated[Optional[str], Query(pattern="^(pending|processing|completed|failed)$")] = None,
     parse_case: Optional[str] = None,
     file_type: Optional[str] = None,
     search: Optional[str] = None,
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
-    limit: int = Query(100, ge=1, le=1000),
-    offset: int = Query(0, ge=0),
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    offset: Annotated[int, Query(ge=0)] = 0,
     db: Session = Depends(get_db)
 ):
     """
@@ -125,10 +129,11 @@ async def list_documents(
     # Apply pagination
     documents = query.offset(offset).limit(limit).all()
 
-    # Build response
+    # Build plain dicts and serialize directly with orjson; server-owned
+    # data needs no second validation pass
     results = []
     for doc in documents:
-        results.append(DocumentSummary(
+        results.append(dict(
             id=str(doc.id),
             filename=doc.source_file_name,
             document_title=doc.document_title,
@@ -145,7 +150,7 @@ async def list_documents(
             content_preview=doc.parsed_content_preview
         ))
 
-    return results
+    return ORJSONResponse(results)
 
 
 @router.get("/stats")
@@ -186,7 +191,7 @@ async def get_documents_stats(db: Session = Depends(get_db)):
     }
 
 
-@router.get("/{document_id}", response_model=DocumentDetail)
+@router.get("/{document_id}", responses={200: {"model": DocumentDetail}})
 async def get_document(
     document_id: str,
     db: Session = Depends(get_db)
@@ -218,7 +223,7 @@ async def get_document(
         DetectionDetails.document_id == document_id
     ).first()
 
-    return DocumentDetail(
+    return ORJSONResponse(dict(
         id=str(document.id),
         filename=document.source_file_name,
         file_path=document.source_file_path,
@@ -238,7 +243,7 @@ async def get_document(
         canonical_data=content.canonical_data if content else None,
         tags=content.tags if content else None,
         detection_details=detection.to_dict() if detection else None
-    )
+    ))
 
 
 @router.delete("/{document_id}")
@@ -323,7 +328,7 @@ async def search_documents(
 @router.get("/{document_id}/export")
 async def export_document(
     document_id: str,
-    format: str = Query("json", regex="^(json|csv)$"),
+    format: Annotated[str, Query(pattern="^(json|csv)$")] = "json",
     db: Session = Depends(get_db)
 ):
     """
@@ -391,7 +396,7 @@ async def export_document(
 @router.post("/batch-export")
 async def batch_export_documents(
     document_ids: List[str],
-    format: str = Query("json", regex="^(json|csv)$"),
+    format: Annotated[str, Query(pattern="^(json|csv)$")] = "json",
     db: Session = Depends(get_db)
 ):
     """
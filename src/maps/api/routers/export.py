@@ -19,6 +19,30 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+async def _export(service: ExportService, view_name: str, format: str, limit: Optional[int] = None):
+    """
+    Dispatch one view export.
+
+    CSV and JSON stream straight to the client from a server-side
+    cursor; Excel still goes through the file-writing service path (an
+    xlsx is a ZIP whose directory is written at close, so it cannot be
+    emitted front-to-back).
+    """
+    if format == "csv":
+        return StreamingResponse(
+            service.stream_view_csv(view_name, limit=limit),
+            media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename={view_name}.csv"}
+        )
+    if format == "json":
+        return StreamingResponse(
+            service.stream_view_json(view_name, limit=limit),
+            media_type="application/json",
+            headers={"Content-Disposition": f"attachment; filename={view_name}.json"}
+        )
+    return await service.export_view(view_name, format=format, limit=limit)
+
+
 @router.post("/", response_model=ExportResponse)
 async def export_data(export_request: dict, db: Session = Depends(get_db)):
     """
@@ -58,7 +82,7 @@ async def export_universal_wide(
 ):
     """Export universal wide view"""
     service = ExportService(db)
-    return await service.export_view("export_universal_wide", format=format)
+    return await _export(service, "export_universal_wide", format)
 
 
 @router.get("/lidc-analysis-ready")
@@ -68,7 +92,7 @@ async def export_lidc_analysis_ready(
 ):
     """Export LIDC analysis-ready format (SPSS/R/Stata)"""
     service = ExportService(db)
-    return await service.export_view("export_lidc_analysis_ready", format=format)
+    return await _export(service, "export_lidc_analysis_ready", format)
 
 
 @router.get("/lidc-with-links")
@@ -78,7 +102,7 @@ async def export_lidc_with_links(
 ):
     """Export LIDC with TCIA links"""
     service = ExportService(db)
-    return await service.export_view("export_lidc_with_links", format=format)
+    return await _export(service, "export_lidc_with_links", format)
 
 
 @router.get("/radiologist-data")
@@ -88,7 +112,7 @@ async def export_radiologist_data(
 ):
     """Export radiologist inter-rater analysis format"""
     service = ExportService(db)
-    return await service.export_view("export_radiologist_data", format=format)
+    return await _export(service, "export_radiologist_data", format)
 
 
 @router.get("/top-keywords")
@@ -99,7 +123,7 @@ async def export_top_keywords(
 ):
     """Export top keywords by relevance"""
     service = ExportService(db)
-    return await service.export_view("export_top_keywords", format=format, limit=limit)
+    return await _export(service, "export_top_keywords", format, limit=limit)
 
 
 @router.post("/custom", response_model=ExportResponse)
@@ -127,4 +151,4 @@ async def export_any_view(
 ):
     """Export any view by name"""
     service = ExportService(db)
-    return await service.export_view(view_name, format=format)
+    return await _export(service, view_name, format)
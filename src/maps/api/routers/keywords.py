@@ -5,14 +5,17 @@ Endpoints for keyword management and search.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Body, UploadFile, File
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from pydantic import BaseModel
 import logging
 
+from ..cache import ttl_cache
 from ..models.responses import KeywordResponse
-from ..dependencies import get_db
-from ..services.keyword_service import KeywordService
+from ..dependencies import get_async_db, get_db
+from ..services.keyword_service import keyword_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -31,65 +34,72 @@ class KeywordAliasCreate(BaseModel):
     synonym_type: str = "variant"
 
 
-@router.get("/", response_model=List[KeywordResponse])
+# Trusted server-side rows: skip the response_model re-validation pass and
+# hand the dicts straight to orjson (schema kept in OpenAPI via `responses=`)
+@router.get("/", responses={200: {"model": List[KeywordResponse]}})
+@ttl_cache()
 async def list_keywords(
-    limit: int = Query(default=100, ge=1, le=1000),
-    offset: int = Query(default=0, ge=0),
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    offset: Annotated[int, Query(ge=0)] = 0,
     category: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List canonical keywords"""
-    service = KeywordService(db)
-    return service.list_keywords(limit=limit, offset=offset, category=category)
+    return ORJSONResponse(await keyword_service.list_keywords(db, limit=limit, offset=offset, category=category))
 
 
 @router.get("/directory")
-async def get_keyword_directory(db: Session = Depends(get_db)):
+@ttl_cache()
+async def get_keyword_directory(db: AsyncSession = Depends(get_async_db)):
     """Get complete keyword catalog"""
-    service = KeywordService(db)
-    return service.get_directory()
+    return await keyword_service.get_directory(db)
 
 
 @router.get("/search")
 async def search_keywords(
-    query: str = Query(..., min_length=1),
-    limit: int = Query(default=100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    query: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Search keywords by term"""
-    service = KeywordService(db)
-    return service.search(query, limit=limit)
+    return await keyword_service.search(db, query, limit=limit)
 
 
-@router.get("/{keyword_id}", response_model=KeywordResponse)
-async def get_keyword(keyword_id: str, db: Session = Depends(get_db)):
+@router.get("/{keyword_id}", responses={200: {"model": KeywordResponse}})
+async def get_keyword(keyword_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get keyword details"""
-    service = KeywordService(db)
-    result = service.get_keyword(keyword_id)
+    result = await keyword_service.get_keyword(db, keyword_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Keyword {keyword_id} not found")
-    return result
+    return ORJSONResponse(result)
 
 
 @router.get("/{keyword_id}/occurrences")
-async def get_keyword_occurrences(keyword_id: str, db: Session = Depends(get_db)):
+async def get_keyword_occurrences(keyword_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get where keyword appears"""
-    service = KeywordService(db)
-    return service.get_occurrences(keyword_id)
+    return await keyword_service.get_occurrences(db, keyword_id)
 
 
 @router.get("/categories")
-async def list_categories(db: Session = Depends(get_db)):
+@ttl_cache()
+async def list_categories(db: AsyncSession = Depends(get_async_db)):
     """List keyword categories"""
-    service = KeywordService(db)
-    return service.list_categories()
+    return await keyword_service.list_categories(db)
 
 
 @router.get("/tags")
-async def list_tags(db: Session = Depends(get_db)):
+@ttl_cache()
+async def list_tags(db: AsyncSession = Depends(get_async_db)):
     """List topic tags"""
-    service = KeywordService(db)
-    return service.list_tags()
+    return await keyword_service.list_tags(db)
+
+
+def _invalidate_keyword_caches() -> None:
+    """Drop cached listings after keyword writes"""
+    list_keywords.cache_clear()
+    get_keyword_directory.cache_clear()
+    list_categories.cache_clear()
+    list_tags.cache_clear()
 
 
 @router.post("/extract")
@@ -98,8 +108,16 @@ async def extract_keywords(
     db: Session = Depends(get_db)
 ):
     """Extract keywords from text"""
-    service = KeywordService(db)
-    return service.extract(text)
+    return keyword_service.extract(db, text)
+
+
+@router.post("/extract/batch")
+async def extract_keywords_batch(
+    texts: List[str] = Body(..., embed=True),
+    db: Session = Depends(get_db)
+):
+    """Extract keywords from multiple texts against the warm pipeline"""
+    return keyword_service.extract_batch(db, texts)
 
 
 @router.post("/definitions/import")
@@ -110,8 +128,8 @@ async def import_keyword_definitions(
     """Bulk import keyword definitions from CSV"""
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be CSV format")
-    service = KeywordService(db)
-    result = await service.import_definitions_csv(file)
+    result = await keyword_service.import_definitions_csv(db, file)
+    _invalidate_keyword_caches()
     return result
 
 
@@ -122,18 +140,17 @@ async def update_keyword_definition(
     db: Session = Depends(get_db)
 ):
     """Update keyword definition"""
-    service = KeywordService(db)
-    result = service.update_definition(keyword_id, update.dict())
+    result = keyword_service.update_definition(db, keyword_id, update.dict())
     if not result:
         raise HTTPException(status_code=404, detail=f"Keyword {keyword_id} not found")
+    _invalidate_keyword_caches()
     return result
 
 
 @router.get("/{keyword_id}/citations")
-async def get_keyword_citations(keyword_id: str, db: Session = Depends(get_db)):
+async def get_keyword_citations(keyword_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get citations for keyword definition"""
-    service = KeywordService(db)
-    result = service.get_citations(keyword_id)
+    result = await keyword_service.get_citations(db, keyword_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Keyword {keyword_id} not found")
     return result
@@ -146,8 +163,8 @@ async def add_keyword_alias(
     db: Session = Depends(get_db)
 ):
     """Add synonym/alias to keyword"""
-    service = KeywordService(db)
-    result = service.add_alias(keyword_id, alias_data.alias, alias_data.synonym_type)
+    result = keyword_service.add_alias(db, keyword_id, alias_data.alias, alias_data.synonym_type)
     if not result:
         raise HTTPException(status_code=404, detail=f"Keyword {keyword_id} not found")
+    _invalidate_keyword_caches()
     return result
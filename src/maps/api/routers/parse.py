@@ -6,17 +6,42 @@ Endpoints for parsing XML/PDF files.
 
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
 from sqlalchemy.orm import Session
+from tempfile import SpooledTemporaryFile
 from typing import List
 import logging
 
 from ..models.requests import ParseRequest, BatchParseRequest
 from ..models.responses import ParseResponse, BatchJobResponse
 from ..dependencies import get_db
-from ..services.parse_service import ParseService
+from ..uploads import require_kind, sniff_upload
+from ..services.parse_service import parse_service
+from .analytics import invalidate_analytics_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Spool threshold: uploads under 1 MiB stay in memory, larger ones spill to
+# disk instead of being materialized as one giant bytes object
+_SPOOL_MAX_MEMORY = 1 << 20
+
+
+async def spool_upload(file: UploadFile, chunk_size: int = 1 << 20) -> SpooledTemporaryFile:
+    """
+    Stream an UploadFile into a SpooledTemporaryFile in fixed-size chunks.
+
+    Avoids `await file.read()` buffering the entire upload (potentially
+    hundreds of MB of PDF/ZIP) in RAM and blocking the event loop on one
+    big copy. The returned spool is rewound and ready for reading.
+    """
+    spool = SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY)
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
 
 @router.post("/xml", response_model=ParseResponse)
 async def parse_xml(
@@ -35,22 +60,22 @@ async def parse_xml(
     Returns:
         Parse results including document ID and parse case
     """
-    if not file.filename.endswith('.xml'):
-        raise HTTPException(status_code=400, detail="File must be XML format")
-
-    service = ParseService(db)
+    await require_kind(file, "xml")
 
     try:
-        content = await file.read()
-        result = await service.parse_xml(
-            content,
-            file.filename,
-            profile=request.profile,
-            validate=request.validate_data,
-            extract_keywords=request.extract_keywords,
-            detect_parse_case=request.detect_parse_case,
-            insert_to_db=request.insert_to_db
-        )
+        with await spool_upload(file) as spool:
+            result = await parse_service.parse_xml(
+                db,
+                spool,
+                file.filename,
+                profile=request.profile,
+                validate=request.validate_data,
+                extract_keywords=request.extract_keywords,
+                detect_parse_case=request.detect_parse_case,
+                insert_to_db=request.insert_to_db
+            )
+        if request.insert_to_db:
+            invalidate_analytics_cache()
         return result
     except Exception as e:
         logger.error(f"XML parsing failed: {e}", exc_info=True)
@@ -74,19 +99,19 @@ async def parse_pdf(
     Returns:
         Parse results including extracted keywords
     """
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="File must be PDF format")
-
-    service = ParseService(db)
+    await require_kind(file, "pdf")
 
     try:
-        content = await file.read()
-        result = await service.parse_pdf(
-            content,
-            file.filename,
-            extract_keywords=request.extract_keywords,
-            insert_to_db=request.insert_to_db
-        )
+        with await spool_upload(file) as spool:
+            result = await parse_service.parse_pdf(
+                db,
+                spool,
+                file.filename,
+                extract_keywords=request.extract_keywords,
+                insert_to_db=request.insert_to_db
+            )
+        if request.insert_to_db:
+            invalidate_analytics_cache()
         return result
     except Exception as e:
         logger.error(f"PDF parsing failed: {e}", exc_info=True)
@@ -110,18 +135,17 @@ async def upload_files(
     Returns:
         Upload response with job ID
     """
-    service = ParseService(db)
-
     try:
         # Create batch job for the uploaded files
-        result = await service.parse_batch(
+        result = await parse_service.parse_batch(
             files,
             profile=profile,
             batch_size=len(files),
             validate=True,
             extract_keywords=True
         )
-        
+        invalidate_analytics_cache()
+
         return {
             "job_id": result.job_id,
             "files_uploaded": len(files),
@@ -149,16 +173,16 @@ async def parse_batch(
     Returns:
         Batch job status
     """
-    service = ParseService(db)
-
     try:
-        result = await service.parse_batch(
+        result = await parse_service.parse_batch(
             files,
             profile=request.profile,
             batch_size=request.batch_size,
             validate=request.validate_data,
-            extract_keywords=request.extract_keywords
+            extract_keywords=request.extract_keywords,
+            wait=request.wait
         )
+        invalidate_analytics_cache()
         return result
     except Exception as e:
         logger.error(f"Batch parsing failed: {e}", exc_info=True)
@@ -180,30 +204,32 @@ async def parse_preview(
     Returns:
         Parse results without database insertion
     """
-    service = ParseService(None)
+    # Dispatch on sniffed content, not the client-supplied filename
+    kind = await sniff_upload(file)
 
     try:
-        content = await file.read()
-
-        if file.filename.endswith('.xml'):
-            result = await service.parse_xml(
-                content,
-                file.filename,
-                profile=request.profile,
-                validate=request.validate_data,
-                extract_keywords=request.extract_keywords,
-                detect_parse_case=request.detect_parse_case,
-                insert_to_db=False
-            )
-        elif file.filename.endswith('.pdf'):
-            result = await service.parse_pdf(
-                content,
-                file.filename,
-                extract_keywords=request.extract_keywords,
-                insert_to_db=False
-            )
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file format")
+        with await spool_upload(file) as spool:
+            if kind == 'xml':
+                result = await parse_service.parse_xml(
+                    None,
+                    spool,
+                    file.filename,
+                    profile=request.profile,
+                    validate=request.validate_data,
+                    extract_keywords=request.extract_keywords,
+                    detect_parse_case=request.detect_parse_case,
+                    insert_to_db=False
+                )
+            elif kind == 'pdf':
+                result = await parse_service.parse_pdf(
+                    None,
+                    spool,
+                    file.filename,
+                    extract_keywords=request.extract_keywords,
+                    insert_to_db=False
+                )
+            else:
+                raise HTTPException(status_code=400, detail="Unsupported file format")
 
         return result
     except Exception as e:
@@ -226,17 +252,14 @@ async def extract_and_parse_zip(
     Returns:
         List of extracted files with metadata
     """
-    if not file.filename.endswith('.zip'):
-        raise HTTPException(status_code=400, detail="File must be ZIP format")
-
-    service = ParseService(db)
+    await require_kind(file, "zip")
 
     try:
-        content = await file.read()
-        result = await service.extract_zip(
-            content,
-            file.filename
-        )
+        with await spool_upload(file) as spool:
+            result = await parse_service.extract_zip(
+                spool,
+                file.filename
+            )
         return result
     except Exception as e:
         logger.error(f"ZIP extraction failed: {e}", exc_info=True)
@@ -251,5 +274,4 @@ async def list_profiles():
     Returns:
         List of parsing profile names and descriptions
     """
-    service = ParseService(None)
-    return service.list_profiles()
+    return parse_service.list_profiles()
@@ -23,23 +23,30 @@ from ..services.parse_case_service import ParseCaseService
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Prefix read for detection without structure analysis: 64 KiB comfortably
+# covers the response header and the first reading session
+_DETECT_HEAD_BYTES = 64 * 1024
 
-@router.get("/", response_model=ParseCaseListResponse)
+# The catalog is static, so the list response is materialized once at
+# import time; the handlers are plain dict/attribute lookups
+_CATALOG = ParseCaseService().get_all_parse_cases()
+_BY_NAME = {case.name: case for case in _CATALOG}
+_LIST_RESPONSE = ParseCaseListResponse(parse_cases=_CATALOG, total=len(_CATALOG))
+
+
+# The catalog responses below are prebuilt constants; re-validating them
+# against response_model on every request would be pure overhead
+@router.get("/", responses={200: {"model": ParseCaseListResponse}})
 async def list_parse_cases():
     """
     List all recognized parse cases.
 
     Returns information about all parse case types supported by the system.
     """
-    service = ParseCaseService()
-    parse_cases = service.get_all_parse_cases()
-    return ParseCaseListResponse(
-        parse_cases=parse_cases,
-        total=len(parse_cases)
-    )
+    return _LIST_RESPONSE
 
 
-@router.get("/{name}", response_model=ParseCaseInfo)
+@router.get("/{name}", responses={200: {"model": ParseCaseInfo}})
 async def get_parse_case(name: str):
     """
     Get details about a specific parse case.
@@ -50,8 +57,7 @@ async def get_parse_case(name: str):
     Returns:
         Parse case information including fields and requirements
     """
-    service = ParseCaseService()
-    parse_case = service.get_parse_case(name)
+    parse_case = _BY_NAME.get(name)
     if not parse_case:
         raise HTTPException(status_code=404, detail=f"Parse case '{name}' not found")
     return parse_case
@@ -77,12 +83,19 @@ async def detect_parse_case(
     service = ParseCaseService()
 
     try:
-        content = await file.read()
-        result = service.detect_from_content(
-            content,
-            file.filename,
-            analyze_structure=request.analyze_structure
-        )
+        if request.analyze_structure:
+            # Element/depth counts need the full document
+            content = await file.read()
+            result = service.detect_from_content(
+                content,
+                file.filename,
+                analyze_structure=True
+            )
+        else:
+            # Detection alone only looks at the header and first session,
+            # so a bounded prefix answers regardless of upload size
+            head = await file.read(_DETECT_HEAD_BYTES)
+            result = service.detect_from_header(head, file.filename)
         return result
     except Exception as e:
         logger.error(f"Parse case detection failed: {e}", exc_info=True)
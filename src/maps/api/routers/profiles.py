@@ -12,6 +12,8 @@ from ...profile_manager import ProfileManager, get_profile_manager
 from ...schemas.profile import Profile, profile_to_dict, dict_to_profile
 from pydantic import BaseModel
 
+from ..cache import ttl_cache
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ class ProfileUpdateRequest(BaseModel):
 
 
 @router.get("")
+@ttl_cache()
 async def list_profiles(
     profile_manager: ProfileManager = Depends(get_profile_manager)
 ) -> List[dict]:
@@ -53,6 +56,7 @@ async def list_profiles(
 
 
 @router.get("/{name}")
+@ttl_cache()
 async def get_profile(
     name: str,
     profile_manager: ProfileManager = Depends(get_profile_manager)
@@ -81,6 +85,12 @@ async def get_profile(
         raise HTTPException(status_code=500, detail=f"Failed to get profile: {str(e)}")
 
 
+def _invalidate_profile_caches() -> None:
+    """Drop cached profile listings after writes"""
+    list_profiles.cache_clear()
+    get_profile.cache_clear()
+
+
 @router.post("")
 async def create_profile(
     request: ProfileCreateRequest,
@@ -134,6 +144,8 @@ async def create_profile(
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save profile")
 
+        _invalidate_profile_caches()
+
         # Return saved profile
         saved_profile = profile_manager.load_profile(request.profile_name)
         return profile_to_dict(saved_profile)
@@ -196,6 +208,8 @@ async def update_profile(
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save profile")
 
+        _invalidate_profile_caches()
+
         # Return updated profile
         updated_profile = profile_manager.load_profile(name)
         return profile_to_dict(updated_profile)
@@ -235,6 +249,8 @@ async def delete_profile(
         if not success:
             raise HTTPException(status_code=500, detail="Failed to delete profile")
 
+        _invalidate_profile_caches()
+
         return {"status": "success", "message": f"Profile '{name}' deleted successfully"}
 
     except HTTPException:
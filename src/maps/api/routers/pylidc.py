@@ -9,6 +9,9 @@ from sqlalchemy.orm import Session
 from typing import Optional
 import logging
 
+from ..config import settings
+
+from ..cache import ttl_cache
 from ..models.requests import PyLIDCImportRequest
 from ..models.responses import ParseResponse, DocumentResponse
 from ..dependencies import get_db
@@ -19,6 +22,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/scans")
+@ttl_cache(ttl=settings.PYLIDC_CACHE_TTL)
 async def list_scans(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=30, ge=1, le=100),
@@ -119,7 +123,9 @@ async def list_scans(
     )
 
 
-@router.get("/scans/{patient_id}", response_model=DocumentResponse)
+# Trusted read path: scan rows come straight from our schema, so skip the
+# response_model validation pass (schema kept in OpenAPI via `responses=`)
+@router.get("/scans/{patient_id}", responses={200: {"model": DocumentResponse}})
 async def get_scan(patient_id: str, db: Session = Depends(get_db)):
     """Get specific PYLIDC scan data"""
     service = PyLIDCService(db)
@@ -159,7 +165,8 @@ async def import_batch(
         result = await service.import_batch(
             limit=request.limit,
             extract_keywords=request.extract_keywords,
-            detect_parse_case=request.detect_parse_case
+            detect_parse_case=request.detect_parse_case,
+            concurrency=request.concurrency
         )
         return result
     except Exception as e:
@@ -5,94 +5,132 @@ Endpoints for accessing Supabase views.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 import logging
+import orjson
 
+from ..cache import ttl_cache
 from ..models.responses import ViewDataResponse
 from ..dependencies import get_db
-from ..services.view_service import ViewService
+from ..services.view_service import view_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _ndjson(rows):
+    """Lazily serialize rows to NDJSON, one line per row"""
+    for row in rows:
+        yield orjson.dumps(row) + b"\n"
+
+
+def _stream_ndjson(db: Session, view_name: str, order_col: str, limit: int, after_id):
+    """
+    Keyset-paginated NDJSON stream of a view.
+
+    Rows arrive from a server-side cursor and are serialized one at a
+    time, so memory stays constant however deep the client pages. The
+    cursor for the next page is the last row's value in order_col —
+    each view names its own key column (file_id, segment_id, ...).
+    """
+    return StreamingResponse(
+        _ndjson(view_service.stream_view(
+            db, view_name, limit=limit, after=after_id, order_col=order_col
+        )),
+        media_type="application/x-ndjson"
+    )
+
+
 # Universal Views
 @router.get("/file-summary")
+@ttl_cache()
 async def file_summary(
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    after_id: Optional[str] = Query(default=None, description="Keyset cursor: stream rows with file_id greater than this as NDJSON"),
     db: Session = Depends(get_db)
 ):
     """Per-file aggregated statistics"""
-    service = ViewService(db)
-    return service.get_view("file_summary", limit=limit, offset=offset)
+    if after_id is not None:
+        return _stream_ndjson(db, "file_summary", "file_id", limit, after_id)
+    return ORJSONResponse(view_service.get_view(db, "file_summary", limit=limit, offset=offset))
 
 
 @router.get("/segment-statistics")
+@ttl_cache()
 async def segment_statistics(
     limit: int = Query(default=100, ge=1, le=1000),
+    after_id: Optional[str] = Query(default=None, description="Keyset cursor: stream rows with segment_id greater than this as NDJSON"),
     db: Session = Depends(get_db)
 ):
     """Per-segment metrics"""
-    service = ViewService(db)
-    return service.get_view("segment_statistics", limit=limit)
+    if after_id is not None:
+        return _stream_ndjson(db, "segment_statistics", "segment_id", limit, after_id)
+    return ORJSONResponse(view_service.get_view(db, "segment_statistics", limit=limit))
 
 
 @router.get("/numeric-data-flat")
-async def numeric_data_flat(limit: int = Query(default=100), db: Session = Depends(get_db)):
+@ttl_cache()
+async def numeric_data_flat(
+    limit: int = Query(default=100),
+    after_id: Optional[str] = Query(default=None, description="Keyset cursor: stream rows with segment_id greater than this as NDJSON"),
+    db: Session = Depends(get_db)
+):
     """Auto-extracted numeric fields"""
-    service = ViewService(db)
-    return service.get_view("numeric_data_flat", limit=limit)
+    if after_id is not None:
+        return _stream_ndjson(db, "numeric_data_flat", "segment_id", limit, after_id)
+    return ORJSONResponse(view_service.get_view(db, "numeric_data_flat", limit=limit))
 
 
 # LIDC Medical Views
 @router.get("/lidc/patient-summary")
+@ttl_cache()
 async def lidc_patient_summary(
     limit: int = Query(default=100),
     db: Session = Depends(get_db)
 ):
     """Patient-level consensus"""
-    service = ViewService(db)
-    return service.get_view("lidc_patient_summary", limit=limit)
+    return ORJSONResponse(view_service.get_view(db, "lidc_patient_summary", limit=limit))
 
 
 @router.get("/lidc/nodule-analysis")
+@ttl_cache()
 async def lidc_nodule_analysis(
     limit: int = Query(default=100),
     db: Session = Depends(get_db)
 ):
     """Per-nodule analysis"""
-    service = ViewService(db)
-    return service.get_view("lidc_nodule_analysis", limit=limit)
+    return ORJSONResponse(view_service.get_view(db, "lidc_nodule_analysis", limit=limit))
 
 
 @router.get("/lidc/3d-contours")
+@ttl_cache()
 async def lidc_3d_contours(
     patient_id: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """3D spatial coordinates"""
-    service = ViewService(db)
-    return service.get_view("lidc_3d_contours", filters={"patient_id": patient_id} if patient_id else None)
+    return ORJSONResponse(view_service.get_view(db, "lidc_3d_contours", filters={"patient_id": patient_id} if patient_id else None))
 
 
 # Keyword Navigation Views
 @router.get("/keyword-occurrence-map")
+@ttl_cache()
 async def keyword_occurrence_map(
     limit: int = Query(default=100),
     db: Session = Depends(get_db)
 ):
     """Keyword locations"""
-    service = ViewService(db)
-    return service.get_view("keyword_occurrence_map", limit=limit)
+    return ORJSONResponse(view_service.get_view(db, "keyword_occurrence_map", limit=limit))
 
 
 @router.get("/file-keyword-summary")
+@ttl_cache()
 async def file_keyword_summary(
     limit: int = Query(default=100),
     db: Session = Depends(get_db)
 ):
     """Keywords per file"""
-    service = ViewService(db)
-    return service.get_view("file_keyword_summary", limit=limit)
+    return ORJSONResponse(view_service.get_view(db, "file_keyword_summary", limit=limit))
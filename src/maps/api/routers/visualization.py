@@ -5,9 +5,9 @@ Endpoints for 3D visualization data.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Literal, Optional
 import logging
 
 from ..dependencies import get_db
@@ -21,24 +21,26 @@ logger = logging.getLogger(__name__)
 async def get_nodule_mesh(
     patient_id: str,
     nodule_id: str,
-    format: str = Query(default="json", regex="^(json|stl|obj)$"),
+    format: Literal["json", "stl", "obj"] = Query(default="json"),
     db: Session = Depends(get_db)
 ):
     """Get nodule mesh data for visualization"""
+    # Returned directly so orjson encodes the payload (numpy arrays
+    # included) without a jsonable_encoder pass over every vertex
     service = VisualizationService(db)
-    return await service.get_nodule_mesh(patient_id, nodule_id, format=format)
+    return ORJSONResponse(await service.get_nodule_mesh(patient_id, nodule_id, format=format))
 
 
 @router.get("/consensus/{patient_id}/{nodule_id}")
 async def get_consensus_contour(
     patient_id: str,
     nodule_id: str,
-    method: str = Query(default="average", regex="^(average|union|intersection)$"),
+    method: Literal["average", "union", "intersection"] = Query(default="average"),
     db: Session = Depends(get_db)
 ):
     """Get consensus contour from multiple radiologists"""
     service = VisualizationService(db)
-    return await service.get_consensus_contour(patient_id, nodule_id, method=method)
+    return ORJSONResponse(await service.get_consensus_contour(patient_id, nodule_id, method=method))
 
 
 @router.get("/contours/{patient_id}/{nodule_id}")
@@ -49,7 +51,7 @@ async def get_all_contours(
 ):
     """Get all radiologist contours"""
     service = VisualizationService(db)
-    return await service.get_all_contours(patient_id, nodule_id)
+    return ORJSONResponse(await service.get_all_contours(patient_id, nodule_id))
 
 
 @router.get("/spatial-stats/{patient_id}")
@@ -59,21 +61,25 @@ async def get_spatial_stats(
 ):
     """Get spatial statistics for patient"""
     service = VisualizationService(db)
-    return await service.get_spatial_stats(patient_id)
+    return ORJSONResponse(await service.get_spatial_stats(patient_id))
 
 
 @router.post("/generate-mesh")
 async def generate_mesh(
     patient_id: str,
     nodule_id: str,
-    format: str = Query(default="stl"),
+    format: Literal["stl", "obj"] = Query(default="stl"),
     db: Session = Depends(get_db)
 ):
     """Generate 3D mesh file (STL/OBJ)"""
+    # The mesh is produced and sent from memory; the old temp-file round
+    # trip paid a disk write plus read on every download
     service = VisualizationService(db)
-    file_path = await service.generate_mesh_file(patient_id, nodule_id, format=format)
-    return FileResponse(
-        file_path,
+    mesh = await service.generate_mesh_bytes(patient_id, nodule_id, format=format)
+    return Response(
+        content=mesh,
         media_type="application/octet-stream",
-        filename=f"{patient_id}_{nodule_id}.{format}"
+        headers={
+            "Content-Disposition": f"attachment; filename={patient_id}_{nodule_id}.{format}"
+        },
     )
@@ -5,16 +5,16 @@ Business logic services that use ra_d_ps functionality.
 """
 
 from .parse_case_service import ParseCaseService
-from .parse_service import ParseService
+from .parse_service import ParseService, parse_service
 from .pylidc_service import PyLIDCService
 from .document_service import DocumentService
-from .keyword_service import KeywordService
-from .view_service import ViewService
+from .keyword_service import KeywordService, keyword_service
+from .view_service import ViewService, view_service
 from .export_service import ExportService
 from .visualization_service import VisualizationService
-from .analytics_service import AnalyticsService
+from .analytics_service import AnalyticsService, analytics_service
 from .database_service import DatabaseService
-from .batch_service import BatchService
+from .batch_service import BatchService, batch_service
 from .search_service import SearchService
 
 __all__ = [
@@ -29,5 +29,10 @@ __all__ = [
     'AnalyticsService',
     'DatabaseService',
     'BatchService',
-    'SearchService'
+    'SearchService',
+    'analytics_service',
+    'batch_service',
+    'keyword_service',
+    'parse_service',
+    'view_service'
 ]
@@ -1,11 +1,14 @@
 """Batch Service"""
 from sqlalchemy.orm import Session
 
+
 class BatchService:
-    def __init__(self, db: Session):
-        self.db = db
+    """
+    Stateless: the session is passed per call, so routers share the single
+    module-level instance below instead of allocating a service per request.
+    """
 
-    async def create_job(self, file_paths, profile):
+    async def create_job(self, db: Session, file_paths, profile):
         """TODO: Create batch job"""
         from datetime import datetime
         from ..models.responses import BatchJobResponse
@@ -18,23 +21,24 @@ class BatchService:
             created_at=datetime.utcnow()
         )
 
-    def get_job_status(self, job_id: str):
+    def get_job_status(self, db: Session, job_id: str):
         """TODO: Get job status"""
         return None
 
-    def get_job_results(self, job_id: str):
+    def get_job_results(self, db: Session, job_id: str):
         """TODO: Get results"""
         return {}
 
-    def cancel_job(self, job_id: str) -> bool:
+    def cancel_job(self, db: Session, job_id: str) -> bool:
         """TODO: Cancel job"""
         return False
 
-    def list_jobs(self, skip: int = 0, limit: int = 100, status: str = None):
+    def list_jobs(self, db: Session, skip: int = 0, limit: int = 100, status: str = None):
         """
         List batch jobs with pagination and optional status filter
 
         Args:
+            db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
             status: Optional status filter (pending, processing, completed, failed)
@@ -46,11 +50,12 @@ class BatchService:
         # For now, return empty list for tests
         return []
 
-    def count_jobs(self, status: str = None) -> int:
+    def count_jobs(self, db: Session, status: str = None) -> int:
         """
         Count total batch jobs, optionally filtered by status
 
         Args:
+            db: Database session
             status: Optional status filter
 
         Returns:
@@ -59,3 +64,7 @@ class BatchService:
         # TODO: Count from batch_jobs table when implemented
         # For now, return 0 for tests
         return 0
+
+
+# Shared instance used by the routers
+batch_service = BatchService()
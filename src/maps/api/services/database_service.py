@@ -1,13 +1,39 @@
 """Database Service"""
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+# Statements built once at import so the compiled-statement cache hits
+_REFRESH_EXPORT_VIEWS_STMT = text("SELECT * FROM refresh_all_export_views()")
+
+# The facet matviews (migration 020) have unique indexes, so they refresh
+# CONCURRENTLY without blocking the keyword endpoints that read them
+_REFRESH_FACET_STMTS = (
+    text("REFRESH MATERIALIZED VIEW CONCURRENTLY keyword_categories_mv"),
+    text("REFRESH MATERIALIZED VIEW CONCURRENTLY keyword_tags_mv"),
+)
+
+
 class DatabaseService:
     def __init__(self, db: Session):
         self.db = db
 
     def refresh_views(self):
-        """TODO: Call refresh_all_export_views()"""
-        return []
+        """Refresh the export and keyword-facet materialized views"""
+        result = self.db.execute(_REFRESH_EXPORT_VIEWS_STMT)
+        refreshed = [dict(row) for row in result.mappings()]
+        self.db.commit()
+
+        # REFRESH ... CONCURRENTLY cannot run inside a transaction block,
+        # so the facet refreshes use their own AUTOCOMMIT connection
+        # rather than the Session's implicit transaction
+        engine = self.db.get_bind()
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            for stmt in _REFRESH_FACET_STMTS:
+                conn.execute(stmt)
+                refreshed.append({"view_name": stmt.text.rsplit(" ", 1)[-1]})
+        return refreshed
 
     def backfill_canonical_keywords(self):
         """TODO: Call backfill_canonical_keyword_ids()"""
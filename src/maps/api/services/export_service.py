@@ -1,8 +1,19 @@
 """Export Service - Uses pandas for export"""
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+import csv
+import io
+import orjson
 import pandas as pd
+import xlsxwriter
 from ..models.responses import ExportResponse
 
+# Rows fetched per round trip while streaming an export
+_EXPORT_FETCH = 10_000
+
+# Emit buffered CSV to the client once it reaches this size
+_CSV_CHUNK = 64 * 1024
+
 
 class ExportService:
     def __init__(self, db: Session):
@@ -11,30 +22,36 @@ class ExportService:
     async def export_view(self, view_name: str, format: str, limit: int = None):
         """Export Supabase view to file"""
         try:
-            # Query view
             query = f"SELECT * FROM {view_name}"
             if limit:
                 query += f" LIMIT {limit}"
 
-            result = self.db.execute(query)
-            data = [dict(row) for row in result.fetchall()]
-            df = pd.DataFrame(data)
-
-            if format == "csv":
-                filename = f"{view_name}.csv"
-                df.to_csv(filename, index=False)
-            elif format == "excel":
+            if format == "excel":
                 filename = f"{view_name}.xlsx"
-                df.to_excel(filename, index=False, engine='openpyxl')
-            else:
+                record_count = self._write_excel(filename, query)
+            elif format == "json":
+                # orjson encodes the rows directly — the DataFrame this
+                # used to build existed only to call to_json
+                result = self.db.execute(text(query))
+                data = [dict(row) for row in result.mappings()]
+                record_count = len(data)
                 filename = f"{view_name}.json"
-                df.to_json(filename, orient="records")
+                with open(filename, "wb") as f:
+                    # default=str covers Decimal aggregates from the views
+                    f.write(orjson.dumps(data, default=str))
+            else:
+                result = self.db.execute(text(query))
+                data = [dict(row) for row in result.mappings()]
+                record_count = len(data)
+                df = pd.DataFrame(data)
+                filename = f"{view_name}.csv"
+                df.to_csv(filename, index=False)
 
             return ExportResponse(
                 status="success",
                 format=format,
                 filename=filename,
-                record_count=len(data)
+                record_count=record_count
             )
         except Exception as e:
             return ExportResponse(
@@ -43,6 +60,90 @@ class ExportService:
                 record_count=0
             )
 
+    def stream_view_csv(self, view_name: str, limit: int = None):
+        """
+        Yield a view as CSV chunks from a server-side cursor.
+
+        Rows go straight from the cursor through csv.writer into a small
+        rotating buffer, so the first chunk reaches the client before the
+        query finishes and memory stays at one fetch batch — no fetchall,
+        no list of dicts, no DataFrame in between.
+        """
+        query = f"SELECT * FROM {view_name}"
+        if limit:
+            query += f" LIMIT {limit}"
+
+        result = self.db.execute(
+            text(query).execution_options(
+                stream_results=True, yield_per=_EXPORT_FETCH
+            )
+        )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(result.keys())
+        for row in result:
+            writer.writerow(row)
+            if buffer.tell() >= _CSV_CHUNK:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def stream_view_json(self, view_name: str, limit: int = None):
+        """
+        Yield a view as a JSON array, one orjson-encoded row at a time.
+
+        Same server-side cursor as the CSV stream: no file round-trip and
+        no whole-view buffer, just array punctuation around encoded rows.
+        """
+        query = f"SELECT * FROM {view_name}"
+        if limit:
+            query += f" LIMIT {limit}"
+
+        result = self.db.execute(
+            text(query).execution_options(
+                stream_results=True, yield_per=_EXPORT_FETCH
+            )
+        )
+
+        yield b"["
+        first = True
+        for row in result.mappings():
+            prefix = b"" if first else b","
+            first = False
+            # default=str covers Decimal aggregates from the views
+            yield prefix + orjson.dumps(dict(row), default=str)
+        yield b"]"
+
+    def _write_excel(self, filename: str, query: str) -> int:
+        """
+        Stream query rows straight into an xlsxwriter workbook.
+
+        constant_memory mode flushes each finished row to disk, and the
+        server-side cursor delivers rows in _EXPORT_FETCH batches, so the
+        export holds one batch in memory instead of a DataFrame of the
+        whole view (openpyxl kept every cell object live until save).
+        """
+        result = self.db.execute(
+            text(query).execution_options(
+                stream_results=True, yield_per=_EXPORT_FETCH
+            )
+        )
+
+        workbook = xlsxwriter.Workbook(filename, {"constant_memory": True})
+        worksheet = workbook.add_worksheet()
+        row_idx = 0
+        try:
+            worksheet.write_row(0, 0, list(result.keys()))
+            for row in result:
+                row_idx += 1
+                worksheet.write_row(row_idx, 0, list(row))
+        finally:
+            workbook.close()
+        return row_idx
+
     async def export_custom(self, **kwargs):
         """Custom export with filtering"""
         return await self.export_view(
@@ -1,22 +1,162 @@
 """Keyword Service - Uses ra_d_ps.keyword_search_engine"""
 from typing import Optional, List, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from functools import lru_cache
 from datetime import datetime, timedelta
-import csv
-import io
 import hashlib
 import json
+import orjson
+import re
 
-# In-memory cache for keyword queries
+from ..config import settings
+
+# Optional cross-worker cache: with REDIS_URL set (and redis installed)
+# the memoized reads below are shared across uvicorn workers instead of
+# warming once per process and cache-busting on every deploy
+try:
+    import redis as redis_sync
+    import redis.asyncio as redis_async
+except ImportError:  # redis is an optional dependency
+    redis_sync = None
+    redis_async = None
+
+# In-memory cache for keyword queries; also the fallback when Redis is
+# not configured or unreachable
 _keyword_cache: Dict[str, tuple[Any, datetime]] = {}
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
+# Invalidation bumps a version counter that is part of every cache key,
+# so stale entries become unreachable and age out via their TTL — no
+# cross-process SCAN/delete needed
+_REDIS_PREFIX = "maps:keywords:"
+_REDIS_VERSION_KEY = _REDIS_PREFIX + "version"
+
+_redis_read = None   # async client for the read path
+_redis_write = None  # sync client, used post-commit by the write methods
+
+
+def _redis_enabled() -> bool:
+    return redis_async is not None and bool(getattr(settings, "REDIS_URL", None))
+
+
+def _get_redis_read():
+    global _redis_read
+    if _redis_read is None:
+        _redis_read = redis_async.from_url(settings.REDIS_URL)
+    return _redis_read
+
+
+def _get_redis_write():
+    global _redis_write
+    if _redis_write is None:
+        _redis_write = redis_sync.from_url(settings.REDIS_URL)
+    return _redis_write
+
+# Token pattern for single-word extraction, compiled once
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z-]+")
+
+# Statements built once at import: SQLAlchemy's compiled cache keys on the
+# clause object, so a per-call text() would recompile on every request.
+# keyword_occurrence_map already joins file/segment context into each row,
+# so occurrences arrive in a single round trip.
+_OCCURRENCES_STMT = text("""
+SELECT * FROM keyword_occurrence_map
+WHERE keyword_id = :keyword_id
+""")
+
+_LIST_KEYWORDS_STMT = text("""
+SELECT keyword_id, term, category, subject_category,
+       topic_tags, occurrence_count, citations
+FROM keyword_directory
+ORDER BY occurrence_count DESC LIMIT :limit OFFSET :offset
+""")
+
+_LIST_KEYWORDS_BY_CATEGORY_STMT = text("""
+SELECT keyword_id, term, category, subject_category,
+       topic_tags, occurrence_count, citations
+FROM keyword_directory
+WHERE subject_category = :category
+ORDER BY occurrence_count DESC LIMIT :limit OFFSET :offset
+""")
+
+_DIRECTORY_STMT = text("SELECT * FROM keyword_directory ORDER BY total_occurrences DESC")
+
+# The leading-wildcard ILIKE is served by the pg_trgm GIN index from
+# migration 021, which also backs the similarity() ranking, so closer
+# matches sort first instead of purely by frequency
+_SEARCH_STMT = text("""
+SELECT *, similarity(term, :query) AS match_score
+FROM keyword_directory
+WHERE term ILIKE :pattern
+ORDER BY match_score DESC, total_occurrences DESC
+LIMIT :limit
+""")
+
+_GET_KEYWORD_STMT = text("SELECT * FROM keyword_directory WHERE keyword_id = :keyword_id")
+
+# Facet lists come from the matviews added in migration 020: an index scan
+# over a few dozen precomputed values instead of a DISTINCT (plus unnest,
+# for tags) over the whole directory view on every cache miss
+_CATEGORIES_STMT = text(
+    "SELECT category FROM keyword_categories_mv ORDER BY category"
+)
+
+_TAGS_STMT = text(
+    "SELECT tag FROM keyword_tags_mv ORDER BY tag"
+)
+
+_UPDATE_DEFINITION_STMT = text("""
+UPDATE canonical_keywords
+SET definition = :definition,
+    source_refs = :source_refs,
+    vocabulary_source = :vocabulary_source
+WHERE keyword_id = :keyword_id
+RETURNING keyword_id, term, definition, source_refs, vocabulary_source
+""")
+
+_ADD_ALIAS_STMT = text("""
+INSERT INTO canonical_keyword_aliases (keyword_id, alias, synonym_type)
+VALUES (:keyword_id, :alias, :synonym_type)
+RETURNING alias_id, keyword_id, alias, synonym_type
+""")
+
+# Citations plus aliases in one statement — the LEFT JOIN/array_agg replaces
+# a follow-up per-keyword alias query.
+_CITATIONS_STMT = text("""
+SELECT ck.keyword_id, ck.term, ck.definition, ck.source_refs, ck.vocabulary_source,
+       COALESCE(array_agg(a.alias) FILTER (WHERE a.alias IS NOT NULL), '{}') AS aliases
+FROM canonical_keywords ck
+LEFT JOIN canonical_keyword_aliases a ON a.keyword_id = ck.keyword_id
+WHERE ck.keyword_id = :keyword_id
+GROUP BY ck.keyword_id, ck.term, ck.definition, ck.source_refs, ck.vocabulary_source
+""")
+
+
+@lru_cache(maxsize=1)
+def get_normalizer():
+    """
+    Warm, shared KeywordNormalizer.
+
+    Construction loads medical_terms.json and builds the synonym,
+    abbreviation, and multi-word lookup maps — far too expensive to repeat
+    per extract request, so the instance is built once and reused. Warmed
+    at startup so the first request doesn't pay the load cost.
+    """
+    from ...keyword_normalizer import KeywordNormalizer
+    return KeywordNormalizer()
+
 class KeywordService:
-    def __init__(self, db: Session):
-        self.db = db
-    
+    """
+    Stateless: the session is passed per call, so routers share the single
+    module-level instance below instead of allocating a service per request.
+
+    Read methods take an AsyncSession (get_async_db) so query I/O awaits
+    on the event loop; write methods keep the sync Session — the CSV
+    import in particular drives psycopg2's COPY machinery directly.
+    """
+
     @staticmethod
     def _get_cache_key(prefix: str, **kwargs) -> str:
         """Generate cache key from parameters"""
@@ -24,8 +164,16 @@ class KeywordService:
         return f"{prefix}:{hashlib.md5(params.encode()).hexdigest()}"
     
     @staticmethod
-    def _get_cached(key: str) -> Optional[Any]:
-        """Get cached value if not expired"""
+    async def _get_cached(key: str) -> Optional[Any]:
+        """Get cached value if not expired (Redis when configured)"""
+        if _redis_enabled():
+            try:
+                r = _get_redis_read()
+                version = await r.get(_REDIS_VERSION_KEY) or b"0"
+                raw = await r.get(f"{_REDIS_PREFIX}{version.decode()}:{key}")
+                return orjson.loads(raw) if raw is not None else None
+            except Exception:
+                pass  # Redis outage degrades to the per-process cache
         if key in _keyword_cache:
             value, timestamp = _keyword_cache[key]
             if datetime.utcnow() - timestamp < timedelta(seconds=CACHE_TTL_SECONDS):
@@ -34,181 +182,244 @@ class KeywordService:
         return None
     
     @staticmethod
-    def _set_cache(key: str, value: Any):
+    async def _set_cache(key: str, value: Any):
         """Set cache value with timestamp"""
+        if _redis_enabled():
+            try:
+                r = _get_redis_read()
+                version = await r.get(_REDIS_VERSION_KEY) or b"0"
+                await r.set(
+                    f"{_REDIS_PREFIX}{version.decode()}:{key}",
+                    # default=dict keeps any Mapping-typed values serializable
+                    orjson.dumps(value, default=dict),
+                    ex=CACHE_TTL_SECONDS,
+                )
+                return
+            except Exception:
+                pass
         _keyword_cache[key] = (value, datetime.utcnow())
+
+    @staticmethod
+    def _invalidate_cache():
+        """Drop memoized query results after a write to the keyword tables"""
+        _keyword_cache.clear()
+        if _redis_enabled():
+            try:
+                _get_redis_write().incr(_REDIS_VERSION_KEY)
+            except Exception:
+                pass
         
-    def list_keywords(self, limit: int, offset: int, category: Optional[str]):
+    async def list_keywords(self, db: AsyncSession, limit: int, offset: int, category: Optional[str]):
         """Query keywords from database"""
         try:
-            query = """
-            SELECT keyword_id, term, category, subject_category, 
-                   topic_tags, occurrence_count, citations
-            FROM keyword_directory
-            """
-            
-            params = []
+            stmt = _LIST_KEYWORDS_BY_CATEGORY_STMT if category else _LIST_KEYWORDS_STMT
+            params: Dict[str, Any] = {"limit": limit, "offset": offset}
             if category:
-                query += " WHERE subject_category = %s"
-                params.append(category)
-                
-            query += " ORDER BY occurrence_count DESC LIMIT %s OFFSET %s"
-            params.extend([limit, offset])
-            
-            result = self.db.execute(query, params)
-            return [dict(row) for row in result.fetchall()]
+                params["category"] = category
+
+            result = await db.execute(stmt, params)
+            # The routers hand these straight to ORJSONResponse, and orjson
+            # only accepts real dicts — RowMapping is not serializable, so
+            # each row is materialized (a cheap shallow copy)
+            return [dict(row) for row in result.mappings()]
         except Exception as e:
             return []
     
-    def get_directory(self):
+    async def get_directory(self, db: AsyncSession):
         """Get complete keyword catalog"""
         cache_key = self._get_cache_key("directory")
-        cached = self._get_cached(cache_key)
+        cached = await self._get_cached(cache_key)
         if cached is not None:
             return cached
-        
-        query = text("SELECT * FROM keyword_directory ORDER BY total_occurrences DESC")
-        result = self.db.execute(query)
-        data = {"keywords": [dict(row._mapping) for row in result.fetchall()]}
-        self._set_cache(cache_key, data)
+
+        result = await db.execute(_DIRECTORY_STMT)
+        data = {"keywords": [dict(row) for row in result.mappings()]}
+        await self._set_cache(cache_key, data)
         return data
     
-    def search(self, query: str, limit: int):
+    async def search(self, db: AsyncSession, query: str, limit: int):
         """Search keywords by term"""
         cache_key = self._get_cache_key("search", query=query, limit=limit)
-        cached = self._get_cached(cache_key)
+        cached = await self._get_cached(cache_key)
         if cached is not None:
             return cached
-        
-        sql = text("""
-        SELECT * FROM keyword_directory
-        WHERE term ILIKE :query
-        ORDER BY total_occurrences DESC
-        LIMIT :limit
-        """)
-        result = self.db.execute(sql, {"query": f"%{query}%", "limit": limit})
-        rows = result.fetchall()
-        data = {"items": [dict(row._mapping) for row in rows], "total": len(rows)}
-        self._set_cache(cache_key, data)
+
+        result = await db.execute(
+            _SEARCH_STMT,
+            {"pattern": f"%{query}%", "query": query, "limit": limit},
+        )
+        rows = result.mappings().all()
+        data = {"items": [dict(row) for row in rows], "total": len(rows)}
+        await self._set_cache(cache_key, data)
         return data
     
-    def get_keyword(self, keyword_id: str):
+    async def get_keyword(self, db: AsyncSession, keyword_id: str):
         """Get keyword details"""
-        query = text("SELECT * FROM keyword_directory WHERE keyword_id = :keyword_id")
-        result = self.db.execute(query, {"keyword_id": keyword_id})
-        row = result.fetchone()
-        return dict(row._mapping) if row else None
+        result = await db.execute(_GET_KEYWORD_STMT, {"keyword_id": keyword_id})
+        row = result.mappings().fetchone()
+        return dict(row) if row else None
     
-    def get_occurrences(self, keyword_id: str):
+    async def get_occurrences(self, db: AsyncSession, keyword_id: str):
         """Get keyword occurrences"""
-        query = text("""
-        SELECT * FROM keyword_occurrence_map
-        WHERE keyword_id = :keyword_id
-        """)
-        result = self.db.execute(query, {"keyword_id": keyword_id})
-        return [dict(row._mapping) for row in result.fetchall()]
+        result = await db.execute(_OCCURRENCES_STMT, {"keyword_id": keyword_id})
+        return [dict(row) for row in result.mappings()]
     
-    def list_categories(self):
+    async def list_categories(self, db: AsyncSession):
         """List keyword categories"""
-        query = text("SELECT DISTINCT subject_category FROM keyword_directory WHERE subject_category IS NOT NULL")
-        result = self.db.execute(query)
-        return [row[0] for row in result.fetchall() if row[0]]
+        cache_key = self._get_cache_key("categories")
+        cached = await self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await db.execute(_CATEGORIES_STMT)
+        data = [row[0] for row in result.fetchall() if row[0]]
+        await self._set_cache(cache_key, data)
+        return data
     
-    def list_tags(self):
+    async def list_tags(self, db: AsyncSession):
         """List topic tags"""
-        query = text("SELECT DISTINCT unnest(topic_tags) as tag FROM keyword_directory WHERE topic_tags IS NOT NULL AND array_length(topic_tags, 1) > 0")
-        result = self.db.execute(query)
-        return [row[0] for row in result.fetchall() if row[0]]
+        cache_key = self._get_cache_key("tags")
+        cached = await self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await db.execute(_TAGS_STMT)
+        data = [row[0] for row in result.fetchall() if row[0]]
+        await self._set_cache(cache_key, data)
+        return data
     
-    def extract(self, text: str):
-        """Extract keywords from text"""
-        # TODO: Use keyword_search_engine or keyword_normalizer
-        return {"keywords": []}
+    def extract(self, db: Session, text: str):
+        """Extract medical keywords from text via the shared normalizer"""
+        normalizer = get_normalizer()
+        keywords = []
+        seen = set()
+
+        # Multi-word terms first (longest-match, with positions)
+        for term, start, end in normalizer.detect_multi_word_terms(text):
+            canonical = normalizer.normalize(term)
+            if canonical not in seen:
+                seen.add(canonical)
+                keywords.append({
+                    "term": term,
+                    "canonical": canonical,
+                    "start": start,
+                    "end": end
+                })
+
+        # Single-word terms: only tokens the vocabulary actually knows
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group().lower()
+            if token in normalizer.stopwords:
+                continue
+            if token not in normalizer.synonym_map and token not in normalizer.abbreviation_map:
+                continue
+            canonical = normalizer.normalize(token)
+            if canonical not in seen:
+                seen.add(canonical)
+                keywords.append({
+                    "term": match.group(),
+                    "canonical": canonical,
+                    "start": match.start(),
+                    "end": match.end()
+                })
+
+        return {"keywords": keywords, "total": len(keywords)}
 
-    async def import_definitions_csv(self, file) -> Dict:
-        """Bulk import keyword definitions from CSV"""
+    def extract_batch(self, db: Session, texts: List[str]):
+        """Extract keywords from several texts against the warm pipeline"""
+        return {"results": [self.extract(db, t) for t in texts], "total": len(texts)}
+
+    async def import_definitions_csv(self, db: Session, file) -> Dict:
+        """
+        Bulk import keyword definitions from CSV via COPY.
+
+        The upload is streamed straight from its spool into a temp staging
+        table with COPY FROM STDIN (one round trip, O(chunk) memory), then
+        merged into canonical_keywords with a single upsert — instead of an
+        INSERT per row. Columns must be in order: term, definition,
+        source_refs, vocabulary_source (header row required).
+        """
         try:
-            content = await file.read()
-            csv_data = io.StringIO(content.decode('utf-8'))
-            reader = csv.DictReader(csv_data)
+            cursor = db.connection().connection.cursor()
+            cursor.execute("""
+                CREATE TEMP TABLE keyword_import_staging (
+                    term TEXT,
+                    definition TEXT,
+                    source_refs TEXT,
+                    vocabulary_source TEXT
+                ) ON COMMIT DROP
+            """)
+
+            # UploadFile.file is the synchronous spool Starlette already
+            # buffered the body into; copy_expert streams it in chunks
+            cursor.copy_expert(
+                """
+                COPY keyword_import_staging
+                    (term, definition, source_refs, vocabulary_source)
+                FROM STDIN WITH (FORMAT csv, HEADER true)
+                """,
+                file.file
+            )
+            total_rows = cursor.rowcount
+
+            cursor.execute("""
+                INSERT INTO canonical_keywords
+                    (term, definition, source_refs, vocabulary_source)
+                SELECT term, definition,
+                       COALESCE(source_refs, ''),
+                       COALESCE(vocabulary_source, '')
+                FROM keyword_import_staging
+                WHERE term IS NOT NULL AND term <> ''
+                  AND definition IS NOT NULL AND definition <> ''
+                ON CONFLICT (term)
+                DO UPDATE SET
+                    definition = EXCLUDED.definition,
+                    source_refs = EXCLUDED.source_refs,
+                    vocabulary_source = EXCLUDED.vocabulary_source
+            """)
+            imported = cursor.rowcount
+
+            db.commit()
+            self._invalidate_cache()
 
-            imported = 0
             errors = []
+            skipped = total_rows - imported
+            if skipped > 0:
+                errors.append(f"{skipped} row(s) skipped: missing term or definition")
 
-            for row in reader:
-                try:
-                    term = row.get('term')
-                    definition = row.get('definition')
-                    source_refs = row.get('source_refs', '')
-                    vocabulary_source = row.get('vocabulary_source', '')
-
-                    if not term or not definition:
-                        errors.append(f"Missing required fields: {row}")
-                        continue
-
-                    # Insert or update canonical_keywords table
-                    query = """
-                    INSERT INTO canonical_keywords
-                        (term, definition, source_refs, vocabulary_source)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (term)
-                    DO UPDATE SET
-                        definition = EXCLUDED.definition,
-                        source_refs = EXCLUDED.source_refs,
-                        vocabulary_source = EXCLUDED.vocabulary_source
-                    """
-                    self.db.execute(query, [term, definition, source_refs, vocabulary_source])
-                    imported += 1
-
-                except Exception as e:
-                    errors.append(f"Error importing row {row}: {str(e)}")
-
-            self.db.commit()
             return {
                 "imported": imported,
                 "errors": errors,
-                "total_rows": imported + len(errors)
+                "total_rows": total_rows
             }
 
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             return {"error": str(e), "imported": 0}
 
-    def update_definition(self, keyword_id: str, data: Dict) -> Optional[Dict]:
+    def update_definition(self, db: Session, keyword_id: str, data: Dict) -> Optional[Dict]:
         """Update keyword definition"""
         try:
-            query = """
-            UPDATE canonical_keywords
-            SET definition = %s,
-                source_refs = %s,
-                vocabulary_source = %s
-            WHERE keyword_id = %s
-            RETURNING keyword_id, term, definition, source_refs, vocabulary_source
-            """
-            result = self.db.execute(query, [
-                data.get('definition'),
-                data.get('source_refs'),
-                data.get('vocabulary_source'),
-                keyword_id
-            ])
-            self.db.commit()
+            result = db.execute(_UPDATE_DEFINITION_STMT, {
+                "definition": data.get('definition'),
+                "source_refs": data.get('source_refs'),
+                "vocabulary_source": data.get('vocabulary_source'),
+                "keyword_id": keyword_id
+            })
+            db.commit()
+            self._invalidate_cache()
 
-            row = result.fetchone()
+            row = result.mappings().fetchone()
             return dict(row) if row else None
 
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             return None
 
-    def get_citations(self, keyword_id: str) -> Optional[Dict]:
-        """Get citations for keyword definition"""
+    async def get_citations(self, db: AsyncSession, keyword_id: str) -> Optional[Dict]:
+        """Get citations (and aliases) for keyword definition"""
         try:
-            query = """
-            SELECT keyword_id, term, definition, source_refs, vocabulary_source
-            FROM canonical_keywords
-            WHERE keyword_id = %s
-            """
-            result = self.db.execute(query, [keyword_id])
+            result = await db.execute(_CITATIONS_STMT, {"keyword_id": keyword_id})
             row = result.fetchone()
 
             if not row:
@@ -219,26 +430,31 @@ class KeywordService:
                 "term": row[1],
                 "definition": row[2],
                 "citations": row[3] or "",
-                "vocabulary_source": row[4] or ""
+                "vocabulary_source": row[4] or "",
+                "aliases": list(row[5] or [])
             }
 
         except Exception as e:
             return None
 
-    def add_alias(self, keyword_id: str, alias: str, synonym_type: str = "variant") -> Optional[Dict]:
+    def add_alias(self, db: Session, keyword_id: str, alias: str, synonym_type: str = "variant") -> Optional[Dict]:
         """Add synonym/alias to keyword"""
         try:
-            query = """
-            INSERT INTO canonical_keyword_aliases (keyword_id, alias, synonym_type)
-            VALUES (%s, %s, %s)
-            RETURNING alias_id, keyword_id, alias, synonym_type
-            """
-            result = self.db.execute(query, [keyword_id, alias, synonym_type])
-            self.db.commit()
+            result = db.execute(_ADD_ALIAS_STMT, {
+                "keyword_id": keyword_id,
+                "alias": alias,
+                "synonym_type": synonym_type
+            })
+            db.commit()
+            self._invalidate_cache()
 
-            row = result.fetchone()
+            row = result.mappings().fetchone()
             return dict(row) if row else None
 
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             return None
+
+
+# Shared instance used by the routers
+keyword_service = KeywordService()
@@ -7,7 +7,10 @@ Business logic for parse case detection and management.
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
-import xml.etree.ElementTree as ET
+import hashlib
+import io
+
+from lxml import etree as lxml_etree
 
 from ..models.responses import ParseCaseInfo, ParseCaseStatsResponse, DetectResponse, StructureAnalysis
 
@@ -18,6 +21,55 @@ def _get_parser_functions():
     return detect_parse_case, get_expected_attributes_for_case
 
 
+# The parse-case catalog is static, so the list (and its name index) is
+# built once at import time instead of being reconstructed — four model
+# validations and a list build — on every request
+_CATALOG: List[ParseCaseInfo] = [
+    ParseCaseInfo(
+        name="Complete_Attributes",
+        description="Full radiologist data with all attributes",
+        fields=["confidence", "subtlety", "obscuration", "reason"],
+        required_fields=["nodule_id", "radiologist_id"],
+        example_count=None
+    ),
+    ParseCaseInfo(
+        name="LIDC_Multi_Session_4",
+        description="LIDC format with 4 radiologist readings",
+        fields=["malignancy", "subtlety", "calcification", "sphericity", "margin",
+               "lobulation", "spiculation", "texture", "internal_structure"],
+        required_fields=["study_instance_uid"],
+        example_count=None
+    ),
+    ParseCaseInfo(
+        name="LIDC_Multi_Session_3",
+        description="LIDC format with 3 radiologist readings",
+        fields=["malignancy", "subtlety", "calcification", "sphericity", "margin",
+               "lobulation", "spiculation", "texture", "internal_structure"],
+        required_fields=["study_instance_uid"],
+        example_count=None
+    ),
+    ParseCaseInfo(
+        name="Core_Attributes_Only",
+        description="Essential attributes without reason",
+        fields=["confidence", "subtlety", "obscuration"],
+        required_fields=["nodule_id"],
+        example_count=None
+    )
+]
+
+_BY_NAME: Dict[str, ParseCaseInfo] = {case.name: case for case in _CATALOG}
+
+# Detection is a pure function of the uploaded bytes, and the common
+# validate-then-ingest workflow uploads the same file twice — memoize on a
+# content digest so the repeat skips the parse entirely
+_DETECT_CACHE: Dict[tuple, DetectResponse] = {}
+_DETECT_CACHE_MAX = 512
+
+
+def _content_key(content: bytes, analyze_structure: bool) -> tuple:
+    return (hashlib.blake2b(content, digest_size=16).digest(), analyze_structure)
+
+
 class ParseCaseService:
     """Service for parse case operations"""
 
@@ -26,47 +78,11 @@ class ParseCaseService:
 
     def get_all_parse_cases(self) -> List[ParseCaseInfo]:
         """Get all recognized parse cases"""
-        parse_cases = [
-            ParseCaseInfo(
-                name="Complete_Attributes",
-                description="Full radiologist data with all attributes",
-                fields=["confidence", "subtlety", "obscuration", "reason"],
-                required_fields=["nodule_id", "radiologist_id"],
-                example_count=None
-            ),
-            ParseCaseInfo(
-                name="LIDC_Multi_Session_4",
-                description="LIDC format with 4 radiologist readings",
-                fields=["malignancy", "subtlety", "calcification", "sphericity", "margin",
-                       "lobulation", "spiculation", "texture", "internal_structure"],
-                required_fields=["study_instance_uid"],
-                example_count=None
-            ),
-            ParseCaseInfo(
-                name="LIDC_Multi_Session_3",
-                description="LIDC format with 3 radiologist readings",
-                fields=["malignancy", "subtlety", "calcification", "sphericity", "margin",
-                       "lobulation", "spiculation", "texture", "internal_structure"],
-                required_fields=["study_instance_uid"],
-                example_count=None
-            ),
-            ParseCaseInfo(
-                name="Core_Attributes_Only",
-                description="Essential attributes without reason",
-                fields=["confidence", "subtlety", "obscuration"],
-                required_fields=["nodule_id"],
-                example_count=None
-            )
-        ]
-        return parse_cases
+        return _CATALOG
 
     def get_parse_case(self, name: str) -> Optional[ParseCaseInfo]:
         """Get specific parse case by name"""
-        all_cases = self.get_all_parse_cases()
-        for case in all_cases:
-            if case.name == name:
-                return case
-        return None
+        return _BY_NAME.get(name)
 
     def detect_from_content(
         self,
@@ -75,19 +91,30 @@ class ParseCaseService:
         analyze_structure: bool = True
     ) -> DetectResponse:
         """Detect parse case from file content"""
-        try:
-            # Parse XML
-            root = ET.fromstring(content)
+        key = _content_key(content, analyze_structure)
+        cached = _DETECT_CACHE.get(key)
+        if cached is not None:
+            return cached
 
-            # Detect parse case using existing function
+        try:
+            # Parse XML with lxml (C parser, ~2-5x faster than stdlib
+            # ElementTree on multi-MB LIDC files). Parser objects are not
+            # safe for concurrent use, so build one per call — it is cheap
+            # next to the parse itself
+            parser = lxml_etree.XMLParser(huge_tree=True, collect_ids=False)
+            root = lxml_etree.fromstring(content, parser=parser)
+
+            # Detect parse case using existing function (streams, so it
+            # takes a file-like object rather than the parsed root)
             detect_func, get_attrs_func = _get_parser_functions()
-            parse_case = detect_func(root)
+            parse_case = detect_func(io.BytesIO(content))
 
-            # Structure analysis
+            # Structure analysis — {*} wildcards match namespaced and
+            # plain documents alike, same as the streaming parser
             structure = None
             if analyze_structure:
-                session_count = len(root.findall(".//readingSession"))
-                unblinded = len(root.findall(".//unblindedReadNodule")) > 0
+                session_count = len(root.findall(".//{*}readingSession"))
+                unblinded = len(root.findall(".//{*}unblindedReadNodule")) > 0
                 structure = StructureAnalysis(
                     root_element=root.tag,
                     session_count=session_count,
@@ -99,13 +126,50 @@ class ParseCaseService:
             # Get expected fields
             expected_attrs = get_attrs_func(parse_case)
 
-            return DetectResponse(
+            response = DetectResponse(
                 detected_parse_case=parse_case,
                 confidence=1.0 if parse_case != "Unknown" else 0.0,
                 file_type="XML",
                 structure_analysis=structure,
                 possible_fields=expected_attrs
             )
+            if len(_DETECT_CACHE) >= _DETECT_CACHE_MAX:
+                _DETECT_CACHE.clear()
+            _DETECT_CACHE[key] = response
+            return response
+        except Exception as e:
+            raise ValueError(f"Parse case detection failed: {e}")
+
+    def detect_from_header(self, head: bytes, filename: str) -> DetectResponse:
+        """
+        Detect parse case from the leading bytes of an upload.
+
+        The heuristics only need the response header and the first reading
+        session, which sit at the front of every supported XML, so a
+        bounded prefix answers without reading the rest of the file. No
+        structure analysis: element and depth counts need the full tree.
+        """
+        key = _content_key(head, False)
+        cached = _DETECT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            detect_func, get_attrs_func = _get_parser_functions()
+            parse_case = detect_func(io.BytesIO(head))
+            expected_attrs = get_attrs_func(parse_case)
+
+            response = DetectResponse(
+                detected_parse_case=parse_case,
+                confidence=1.0 if parse_case != "Unknown" else 0.0,
+                file_type="XML",
+                structure_analysis=None,
+                possible_fields=expected_attrs
+            )
+            if len(_DETECT_CACHE) >= _DETECT_CACHE_MAX:
+                _DETECT_CACHE.clear()
+            _DETECT_CACHE[key] = response
+            return response
         except Exception as e:
             raise ValueError(f"Parse case detection failed: {e}")
 
@@ -136,8 +200,14 @@ class ParseCaseService:
             last_updated=datetime.utcnow()
         )
 
-    def _get_tree_depth(self, element, depth=0) -> int:
-        """Get XML tree depth"""
-        if len(element) == 0:
-            return depth
-        return max(self._get_tree_depth(child, depth + 1) for child in element)
+    def _get_tree_depth(self, element) -> int:
+        """Get XML tree depth with an explicit stack (no recursion limit)"""
+        max_depth = 0
+        stack = [(element, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            for child in node:
+                stack.append((child, depth + 1))
+        return max_depth
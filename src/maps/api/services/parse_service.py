@@ -5,17 +5,45 @@ Business logic for file parsing operations.
 Uses ra_d_ps.parser and ra_d_ps.parsers modules.
 """
 
-from typing import Optional, List
+from typing import BinaryIO, Optional, List
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
+import io
 import time
 import tempfile
 import os
 import zipfile
 from pathlib import Path
 
+# Uploads are copied in fixed-size chunks so a large file never has to fit
+# in one contiguous bytes object
+_COPY_CHUNK = 1 << 20  # 1 MiB
+
+
+def _spool_to_tempfile(stream: BinaryIO, suffix: str) -> tuple:
+    """
+    Copy a (spooled) upload stream to a named temporary file in chunks.
+
+    The legacy parsers expect a filesystem path, so the stream is drained
+    to disk 1 MiB at a time instead of materializing the whole upload.
+
+    Returns:
+        (tmp_path, total_bytes) tuple
+    """
+    total = 0
+    with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as tmp_file:
+        while True:
+            chunk = stream.read(_COPY_CHUNK)
+            if not chunk:
+                break
+            tmp_file.write(chunk)
+            total += len(chunk)
+        return tmp_file.name, total
+
 from ..models.responses import ParseResponse, BatchJobResponse
+from ..dependencies import PARSE_SEMAPHORE, get_parse_pool
 from datetime import datetime
+import asyncio
 
 # Lazy imports to avoid tkinter dependency at module level
 def _get_parser_functions():
@@ -34,15 +62,87 @@ def _get_detector_factory():
     return get_detector_factory()
 
 
+# --- Process-pool workers -------------------------------------------------
+# Top-level so they pickle cleanly; each takes a temp-file path and returns
+# plain picklable results. Anything touching request-process state (approval
+# queue, DB session) stays in the parent.
+
+def _parse_xml_sync(src, filename: Optional[str] = None):
+    """Run the streaming parse of an XML sample in a worker process.
+
+    Accepts the upload bytes (single-file endpoint) or a staged temp-file
+    path (batch pipeline)."""
+    parse_func = _get_parser_functions()
+    if isinstance(src, bytes):
+        return parse_func(io.BytesIO(src), filename=filename)
+    return parse_func(src)
+
+
+def _detect_structure_sync(tmp_path: str):
+    """Run parse-case detection in a worker process; None if no detector."""
+    detector = _get_detector_factory().get_detector(tmp_path)
+    if detector is None:
+        return None
+    return detector.detect_structure(tmp_path)
+
+
+def _extract_pdf_sync(src, filename: Optional[str] = None):
+    """Run PDF keyword extraction in a worker process.
+
+    Accepts the upload bytes (single-file endpoint) or a staged temp-file
+    path (batch pipeline)."""
+    extractor = _get_pdf_extractor()()
+    if isinstance(src, bytes):
+        return extractor.extract_from_pdf(io.BytesIO(src), filename=filename)
+    return extractor.extract_from_pdf(src)
+
+
+def _extract_zip_sync(tmp_path: str):
+    """
+    Collect supported-file metadata from a ZIP's central directory.
+
+    The central directory already records each member's name and
+    uncompressed size, so nothing is inflated: a multi-GB archive costs
+    one directory read instead of a full extract-and-walk round trip.
+    """
+    extracted_files = []
+    with zipfile.ZipFile(tmp_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            filename = os.path.basename(info.filename)
+
+            # Only process supported file types
+            if filename.endswith(('.xml', '.json', '.pdf')):
+                extracted_files.append({
+                    'filename': filename,
+                    'path': info.filename,
+                    'size': info.file_size,
+                    'type': filename.split('.')[-1].upper()
+                })
+    return extracted_files
+
+
+async def _run_cpu_bound(func, *args):
+    """Run a picklable worker on the shared parse pool, bounded per core."""
+    loop = asyncio.get_running_loop()
+    async with PARSE_SEMAPHORE:
+        return await loop.run_in_executor(get_parse_pool(), func, *args)
+
+
 class ParseService:
-    """Service for parsing XML/PDF files"""
+    """
+    Service for parsing XML/PDF files.
 
-    def __init__(self, db: Optional[Session]):
-        self.db = db
+    Stateless: the session is passed per call (None for preview-only
+    parses), so routers share the single module-level instance below
+    instead of allocating a service per request.
+    """
 
     async def parse_xml(
         self,
-        content: bytes,
+        db: Optional[Session],
+        stream: BinaryIO,
         filename: str,
         profile: str,
         validate: bool,
@@ -54,71 +154,72 @@ class ParseService:
         start_time = time.time()
 
         try:
-            # Save content to temporary file (parser expects file path)
-            with tempfile.NamedTemporaryFile(mode='wb', suffix='.xml', delete=False) as tmp_file:
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
-
-            try:
-                # Use existing parse_radiology_sample function
-                parse_func = _get_parser_functions()
-                main_df, unblinded_df = parse_func(tmp_path)
-
-                # Detect parse case if requested using new detector factory
-                detected_parse_case = None
-                confidence = None
-                queue_item_id = None
-
-                if detect_parse_case:
-                    detector_factory = _get_detector_factory()
-                    detector = detector_factory.get_detector(tmp_path)
-
-                    if detector:
-                        detection_result = detector.detect_structure(tmp_path)
-                        detected_parse_case = detection_result.get("parse_case")
-                        confidence = detection_result.get("confidence", 1.0)
-
-                        # Add to approval queue if confidence is low
-                        from ..routers.approval_queue import add_to_queue
-                        queue_item = add_to_queue(
-                            filename=filename,
-                            detected_parse_case=detected_parse_case,
-                            confidence=confidence,
-                            file_type="XML",
-                            file_size=len(content)
-                        )
-
-                        if queue_item:
-                            queue_item_id = queue_item.id
+            # Starlette has already buffered the upload in its spool; one
+            # read hands the bytes to the pool worker over the pipe instead
+            # of writing a temp file here and re-reading it there
+            content = stream.read()
+            file_size = len(content)
+
+            # Streaming parse is pure CPU: run it off the event loop
+            main_df, unblinded_df = await _run_cpu_bound(_parse_xml_sync, content, filename)
+
+            # Detect parse case if requested using new detector factory
+            detected_parse_case = None
+            confidence = None
+            queue_item_id = None
+
+            if detect_parse_case:
+                # The structure detectors are path-based (they record
+                # detections per file), so only this optional branch still
+                # stages the upload on disk
+                tmp_path, _ = _spool_to_tempfile(io.BytesIO(content), '.xml')
+                try:
+                    detection_result = await _run_cpu_bound(_detect_structure_sync, tmp_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+
+                if detection_result is not None:
+                    detected_parse_case = detection_result.get("parse_case")
+                    confidence = detection_result.get("confidence", 1.0)
+
+                    # Add to approval queue if confidence is low
+                    from ..routers.approval_queue import add_to_queue
+                    queue_item = add_to_queue(
+                        filename=filename,
+                        detected_parse_case=detected_parse_case,
+                        confidence=confidence,
+                        file_type="XML",
+                        file_size=file_size
+                    )
+
+                    if queue_item:
+                        queue_item_id = queue_item.id
+
+            # TODO: Insert to database if requested
+            document_id = None
+            if insert_to_db and db:
+                # Will implement database insertion here
+                document_id = "placeholder-doc-id"
+
+            # TODO: Extract keywords if requested
+            keywords_count = 0
+            if extract_keywords:
+                # Will implement keyword extraction here
+                keywords_count = 0
 
-                # TODO: Insert to database if requested
-                document_id = None
-                if insert_to_db and self.db:
-                    # Will implement database insertion here
-                    document_id = "placeholder-doc-id"
+            processing_time = (time.time() - start_time) * 1000
 
-                # TODO: Extract keywords if requested
-                keywords_count = 0
-                if extract_keywords:
-                    # Will implement keyword extraction here
-                    keywords_count = 0
-
-                processing_time = (time.time() - start_time) * 1000
-
-                return ParseResponse(
-                    status="success" if not queue_item_id else "pending_approval",
-                    document_id=document_id,
-                    parse_case=detected_parse_case,
-                    confidence=confidence,
-                    queue_item_id=queue_item_id,
-                    keywords_extracted=keywords_count,
-                    processing_time_ms=processing_time,
-                    errors=None
-                )
-            finally:
-                # Clean up temporary file
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            return ParseResponse(
+                status="success" if not queue_item_id else "pending_approval",
+                document_id=document_id,
+                parse_case=detected_parse_case,
+                confidence=confidence,
+                queue_item_id=queue_item_id,
+                keywords_extracted=keywords_count,
+                processing_time_ms=processing_time,
+                errors=None
+            )
 
         except Exception as e:
             return ParseResponse(
@@ -129,7 +230,8 @@ class ParseService:
 
     async def parse_pdf(
         self,
-        content: bytes,
+        db: Optional[Session],
+        stream: BinaryIO,
         filename: str,
         extract_keywords: bool,
         insert_to_db: bool
@@ -138,41 +240,33 @@ class ParseService:
         start_time = time.time()
 
         try:
-            # Save content to temporary file
-            with tempfile.NamedTemporaryFile(mode='wb', suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
+            document_id = None
+            keywords_count = 0
 
-            try:
-                document_id = None
-                keywords_count = 0
+            if extract_keywords:
+                # pdfplumber reads the stream directly, so the upload bytes
+                # go straight to the pool worker — no temp file round trip
+                content = stream.read()
 
-                if extract_keywords:
-                    # Use PDFKeywordExtractor
-                    PDFKeywordExtractor = _get_pdf_extractor()
-                    extractor = PDFKeywordExtractor()
-                    metadata, keywords = extractor.extract_from_pdf(tmp_path)
+                # PDF text extraction is pure CPU: run it off the event loop
+                metadata, keywords = await _run_cpu_bound(_extract_pdf_sync, content, filename)
 
-                    keywords_count = len(keywords)
+                keywords_count = len(keywords)
 
-                    # TODO: Insert to database if requested
-                    if insert_to_db and self.db:
-                        document_id = "placeholder-pdf-doc-id"
+                # TODO: Insert to database if requested
+                if insert_to_db and db:
+                    document_id = "placeholder-pdf-doc-id"
 
-                processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.time() - start_time) * 1000
 
-                return ParseResponse(
-                    status="success",
-                    document_id=document_id,
-                    parse_case="PDF_Document",
-                    keywords_extracted=keywords_count,
-                    processing_time_ms=processing_time,
-                    errors=None
-                )
-            finally:
-                # Clean up temporary file
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            return ParseResponse(
+                status="success",
+                document_id=document_id,
+                parse_case="PDF_Document",
+                keywords_extracted=keywords_count,
+                processing_time_ms=processing_time,
+                errors=None
+            )
 
         except Exception as e:
             return ParseResponse(
@@ -183,7 +277,7 @@ class ParseService:
 
     async def extract_zip(
         self,
-        content: bytes,
+        stream: BinaryIO,
         filename: str
     ) -> dict:
         """
@@ -195,42 +289,12 @@ class ParseService:
         extracted_files = []
         
         try:
-            # Save ZIP to temporary file
-            with tempfile.NamedTemporaryFile(mode='wb', suffix='.zip', delete=False) as tmp_file:
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
+            # Drain the upload stream to a temporary ZIP file
+            tmp_path, _ = _spool_to_tempfile(stream, '.zip')
 
             try:
-                # Extract ZIP contents
-                with zipfile.ZipFile(tmp_path, 'r') as zip_ref:
-                    # Create temporary directory for extraction
-                    extract_dir = tempfile.mkdtemp()
-                    
-                    try:
-                        zip_ref.extractall(extract_dir)
-                        
-                        # Walk through extracted files
-                        for root, dirs, files in os.walk(extract_dir):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                relative_path = os.path.relpath(file_path, extract_dir)
-                                
-                                # Only process supported file types
-                                if file.endswith(('.xml', '.json', '.pdf')):
-                                    with open(file_path, 'rb') as f:
-                                        file_size = os.path.getsize(file_path)
-                                    
-                                    extracted_files.append({
-                                        'filename': file,
-                                        'path': relative_path,
-                                        'size': file_size,
-                                        'type': file.split('.')[-1].upper()
-                                    })
-                    finally:
-                        # Clean up extraction directory
-                        import shutil
-                        if os.path.exists(extract_dir):
-                            shutil.rmtree(extract_dir)
+                # Inflate + walk is CPU/disk bound: run it off the event loop
+                extracted_files = await _run_cpu_bound(_extract_zip_sync, tmp_path)
             finally:
                 # Clean up ZIP file
                 if os.path.exists(tmp_path):
@@ -254,48 +318,171 @@ class ParseService:
                 'processing_time_ms': (time.time() - start_time) * 1000
             }
 
+    # --- Batch pipeline ---------------------------------------------------
+    # parse_batch runs as a three-stage pipeline connected by queues:
+    # ingest (drain uploads to temp files) -> parse workers (process pool)
+    # -> flusher (batches results for the DB insert). The stages overlap, so
+    # upload I/O, CPU parsing, and commits proceed concurrently instead of
+    # one blocking call per file.
+
+    _INGEST_QUEUE_SIZE = 32   # backpressure: ingest pauses when workers lag
+    _FLUSH_THRESHOLD = 64     # results per DB flush
+    _FLUSH_INTERVAL = 0.5     # seconds before a partial batch is flushed
+
+    async def _ingest_upload(self, file: UploadFile) -> str:
+        """Stage 1: drain one upload to a temp file in chunks, return its path."""
+        suffix = Path(file.filename).suffix or '.xml'
+        with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as tmp_file:
+            while True:
+                chunk = await file.read(_COPY_CHUNK)
+                if not chunk:
+                    break
+                tmp_file.write(chunk)
+            return tmp_file.name
+
+    async def _parse_worker(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue):
+        """Stage 2: pull staged files and parse them on the process pool."""
+        while True:
+            item = await in_queue.get()
+            if item is None:
+                break
+            filename, tmp_path = item
+            try:
+                if filename.endswith('.pdf'):
+                    await _run_cpu_bound(_extract_pdf_sync, tmp_path)
+                else:
+                    await _run_cpu_bound(_parse_xml_sync, tmp_path)
+                await out_queue.put({"filename": filename, "status": "success"})
+            except Exception as e:
+                await out_queue.put({"filename": filename, "status": "error", "error": str(e)})
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
+    def _flush_results(self, batch: List[dict], counts: dict):
+        """Commit a batch of parse results; updates the running counters."""
+        if not batch:
+            return
+        # TODO: session.bulk_insert_mappings on the documents table once the
+        # batch schema lands; counters keep the job status accurate meanwhile
+        for result in batch:
+            if result["status"] == "success":
+                counts["processed"] += 1
+            else:
+                counts["failed"] += 1
+                counts["errors"].append(f"{result['filename']}: {result['error']}")
+        batch.clear()
+
+    async def _db_flusher(self, out_queue: asyncio.Queue, counts: dict):
+        """Stage 3: flush results when the batch fills or the interval elapses."""
+        loop = asyncio.get_running_loop()
+        batch: List[dict] = []
+        deadline = loop.time() + self._FLUSH_INTERVAL
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    out_queue.get(),
+                    timeout=max(deadline - loop.time(), 0.0)
+                )
+            except asyncio.TimeoutError:
+                self._flush_results(batch, counts)
+                deadline = loop.time() + self._FLUSH_INTERVAL
+                continue
+            if item is None:
+                self._flush_results(batch, counts)
+                break
+            batch.append(item)
+            if len(batch) >= self._FLUSH_THRESHOLD:
+                self._flush_results(batch, counts)
+                deadline = loop.time() + self._FLUSH_INTERVAL
+
+    async def _run_pipeline(self, staged_iter, counts: dict):
+        """Wire the stages together and run them to completion."""
+        in_queue: asyncio.Queue = asyncio.Queue(maxsize=self._INGEST_QUEUE_SIZE)
+        out_queue: asyncio.Queue = asyncio.Queue()
+        worker_count = os.cpu_count() or 1
+
+        async def produce():
+            async for staged in staged_iter:
+                await in_queue.put(staged)
+            for _ in range(worker_count):
+                await in_queue.put(None)
+
+        workers = [
+            asyncio.create_task(self._parse_worker(in_queue, out_queue))
+            for _ in range(worker_count)
+        ]
+        flusher = asyncio.create_task(self._db_flusher(out_queue, counts))
+        await asyncio.gather(produce(), *workers)
+        await out_queue.put(None)
+        await flusher
+
     async def parse_batch(
         self,
         files: List[UploadFile],
         profile: str,
         batch_size: int,
         validate: bool,
-        extract_keywords: bool
+        extract_keywords: bool,
+        wait: bool = True
     ) -> BatchJobResponse:
-        """Batch parse files"""
-        # TODO: Implement using ra_d_ps.batch_processor
+        """Batch parse files through the ingest->parse->flush pipeline"""
         job_id = f"batch-{int(time.time())}"
+        created_at = datetime.utcnow()
+        counts = {"processed": 0, "failed": 0, "errors": []}
+
+        if wait:
+            async def staged_uploads():
+                for file in files:
+                    yield file.filename, await self._ingest_upload(file)
+
+            await self._run_pipeline(staged_uploads(), counts)
+            return BatchJobResponse(
+                job_id=job_id,
+                status="completed" if not counts["failed"] else "completed_with_errors",
+                total_files=len(files),
+                processed_files=counts["processed"],
+                failed_files=counts["failed"],
+                created_at=created_at,
+                completed_at=datetime.utcnow(),
+                errors=counts["errors"]
+            )
+
+        # Fire-and-forget: the UploadFile handles die with the request, so
+        # ingest must finish before returning; only parse+flush run on in
+        # the background.
+        staged = [(file.filename, await self._ingest_upload(file)) for file in files]
+
+        async def staged_ready():
+            for item in staged:
+                yield item
 
+        asyncio.get_running_loop().create_task(self._run_pipeline(staged_ready(), counts))
         return BatchJobResponse(
             job_id=job_id,
-            status="created",
+            status="processing",
             total_files=len(files),
             processed_files=0,
             failed_files=0,
-            created_at=datetime.utcnow(),
+            created_at=created_at,
             errors=[]
         )
 
     def list_profiles(self):
-        """List available profiles"""
-        # TODO: Use ra_d_ps.profile_manager
+        """List available parsing profiles via the shared ProfileManager"""
         from ...profile_manager import get_profile_manager
 
-        try:
-            manager = get_profile_manager()
-            profiles = manager.list_profiles()
+        manager = get_profile_manager()
+        return {
+            "profiles": [
+                {
+                    "name": p.profile_name,
+                    "description": p.source_format_description or ""
+                }
+                for p in manager.list_profiles()
+            ]
+        }
 
-            return {
-                "profiles": [
-                    {"name": p, "description": f"Profile: {p}"}
-                    for p in profiles
-                ]
-            }
-        except Exception as e:
-            return {
-                "profiles": [
-                    {"name": "lidc_idri_standard", "description": "LIDC-IDRI standard format"},
-                    {"name": "maps_standard", "description": "NYT XML format"}
-                ],
-                "error": str(e)
-            }
+
+# Shared instance used by the routers
+parse_service = ParseService()
@@ -7,6 +7,7 @@ Uses ra_d_ps.adapters.pylidc_adapter.
 
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
+import asyncio
 import time
 import hashlib
 import json
@@ -414,9 +415,17 @@ class PyLIDCService:
         self,
         limit: Optional[int],
         extract_keywords: bool,
-        detect_parse_case: bool
+        detect_parse_case: bool,
+        concurrency: int = 8
     ) -> Dict[str, Any]:
-        """Import multiple PYLIDC scans in batch"""
+        """
+        Import multiple PYLIDC scans in batch.
+
+        Conversions run on executor threads behind a semaphore so pylidc
+        disk reads and pydicom decoding for several scans overlap instead
+        of proceeding one scan at a time; per-scan failures are collected
+        rather than aborting the whole batch.
+        """
         start_time = time.time()
 
         try:
@@ -427,24 +436,33 @@ class PyLIDCService:
 
             scans = query.all()
 
-            imported_count = 0
-            failed_count = 0
-            errors = []
-
             adapter = PyLIDCAdapter()
+            loop = asyncio.get_running_loop()
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            def convert(scan):
+                canonical_doc = adapter.scan_to_canonical(scan, include_annotations=True)
 
-            for scan in scans:
-                try:
-                    canonical_doc = adapter.scan_to_canonical(scan, include_annotations=True)
+                # TODO: Insert to database
+                if self.db:
+                    pass  # Insert logic here
 
-                    # TODO: Insert to database
-                    if self.db:
-                        pass  # Insert logic here
+            async def import_one(scan):
+                async with semaphore:
+                    return await loop.run_in_executor(None, convert, scan)
+
+            results = await asyncio.gather(
+                *(import_one(scan) for scan in scans),
+                return_exceptions=True
+            )
 
-                    imported_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    errors.append(f"{scan.patient_id}: {str(e)}")
+            errors = [
+                f"{scan.patient_id}: {result}"
+                for scan, result in zip(scans, results)
+                if isinstance(result, Exception)
+            ]
+            failed_count = len(errors)
+            imported_count = len(scans) - failed_count
 
             processing_time = (time.time() - start_time) * 1000
 
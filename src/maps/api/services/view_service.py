@@ -1,25 +1,96 @@
 """View Service - Access Supabase views"""
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Rows fetched per round trip when streaming from a server-side cursor
+_STREAM_YIELD = 1000
+
 
 class ViewService:
-    def __init__(self, db: Session):
-        self.db = db
+    # Stateless: the session is passed per call, so routers share the single
+    # module-level instance below instead of allocating a service per request.
+    #
+    # Statements are built once per (view, filter-column) shape and reused,
+    # so SQLAlchemy's compiled-statement cache sees the same TextClause on
+    # every request instead of recompiling per call. Values — including
+    # LIMIT/OFFSET — travel as bind parameters at execute time, keeping the
+    # SQL text identical regardless of the requested page or filter value.
+    _statements: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+
+    @classmethod
+    def _statement(cls, view_name: str, filter_cols: Tuple[str, ...]):
+        """Get (or build once) the SELECT for a view/filter-shape pair"""
+        key = (view_name, filter_cols)
+        stmt = cls._statements.get(key)
+        if stmt is None:
+            sql = f"SELECT * FROM {view_name}"
+            if filter_cols:
+                sql += " WHERE " + " AND ".join(f"{col} = :{col}" for col in filter_cols)
+            sql += " LIMIT :_limit OFFSET :_offset"
+            stmt = text(sql)
+            cls._statements[key] = stmt
+        return stmt
+
+    @classmethod
+    def _stream_statement(cls, view_name: str, order_col: str, keyset: bool):
+        """Get (or build once) the keyset-paginated streaming SELECT"""
+        key = (view_name, order_col, keyset)
+        stmt = cls._statements.get(key)
+        if stmt is None:
+            sql = f"SELECT * FROM {view_name}"
+            if keyset:
+                sql += f" WHERE {order_col} > :_after"
+            sql += f" ORDER BY {order_col} LIMIT :_limit"
+            # Server-side cursor: rows arrive in _STREAM_YIELD batches
+            # instead of one buffered fetchall
+            stmt = text(sql).execution_options(
+                stream_results=True, yield_per=_STREAM_YIELD
+            )
+            cls._statements[key] = stmt
+        return stmt
+
+    def stream_view(
+        self,
+        db: Session,
+        view_name: str,
+        order_col: str,
+        limit: int = 100,
+        after: Optional[Any] = None
+    ) -> Iterator[dict]:
+        """
+        Yield view rows one at a time with keyset pagination.
+
+        Unlike OFFSET — which makes PostgreSQL scan and discard all prior
+        rows — the keyset predicate seeks straight to the page, and the
+        server-side cursor keeps memory constant regardless of page size.
+        The caller resumes from the last row's order column value;
+        order_col must name a key column of the view (the universal views
+        expose file_id/segment_id, not a generic id).
+        """
+        stmt = self._stream_statement(view_name, order_col, after is not None)
+        params: Dict[str, Any] = {"_limit": limit}
+        if after is not None:
+            params["_after"] = after
 
-    def get_view(self, view_name: str, limit: int = 100, offset: int = 0, filters=None):
+        result = db.execute(stmt, params)
+        for row in result.mappings():
+            yield dict(row)
+
+    def get_view(self, db: Session, view_name: str, limit: int = 100, offset: int = 0, filters=None):
         """Query Supabase materialized view"""
         try:
-            query = f"SELECT * FROM {view_name}"
-            
-            if filters:
-                conditions = [f"{k} = %s" for k in filters.keys()]
-                query += " WHERE " + " AND ".join(conditions)
-                
-            query += f" LIMIT {limit} OFFSET {offset}"
-            
-            params = list(filters.values()) if filters else []
-            result = self.db.execute(query, params)
-            data = [dict(row) for row in result.fetchall()]
-            
+            filter_cols = tuple(sorted(filters)) if filters else ()
+            params = dict(filters) if filters else {}
+            params["_limit"] = limit
+            params["_offset"] = offset
+
+            result = db.execute(self._statement(view_name, filter_cols), params)
+            # .mappings() yields dict-like rows directly; dict() on these is a
+            # plain copy, cheaper than Row tuple->dict conversion, and the
+            # result feeds orjson without a jsonable_encoder pass
+            data = [dict(row) for row in result.mappings()]
+
             return {
                 "view_name": view_name,
                 "data": data,
@@ -34,3 +105,7 @@ class ViewService:
                 "total": 0,
                 "error": str(e)
             }
+
+
+# Shared instance used by the routers
+view_service = ViewService()
@@ -21,6 +21,12 @@ class VisualizationService:
         """TODO: Query lidc_nodule_spatial_stats view"""
         return {}
 
-    async def generate_mesh_file(self, patient_id: str, nodule_id: str, format: str):
-        """TODO: Generate mesh file"""
-        return "/tmp/mesh.stl"
+    async def generate_mesh_bytes(self, patient_id: str, nodule_id: str, format: str) -> bytes:
+        """
+        TODO: Generate the STL/OBJ mesh in memory.
+
+        Returns the encoded mesh as bytes so the router can send it
+        straight to the client — no temp file written and re-read per
+        download.
+        """
+        return b""
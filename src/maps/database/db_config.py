@@ -42,6 +42,7 @@ class PostgreSQLConfig(BaseModel):
     # Performance settings
     echo_sql: bool = Field(default=False, description="Echo SQL statements (debug)")
     pool_pre_ping: bool = Field(default=True, description="Test connections before use")
+    query_cache_size: int = Field(default=1200, description="SQLAlchemy compiled-statement cache size")
 
     @classmethod
     def from_env(cls) -> "PostgreSQLConfig":
@@ -62,6 +63,7 @@ class PostgreSQLConfig(BaseModel):
             ssl_root_cert=os.getenv("DB_SSL_ROOT_CERT"),
             echo_sql=os.getenv("DB_ECHO_SQL", "false").lower() == "true",
             pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+            query_cache_size=int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
         )
 
     def get_connection_string(self, async_driver: bool = False) -> str:
@@ -104,6 +106,7 @@ class PostgreSQLConfig(BaseModel):
             "pool_recycle": self.pool_recycle,
             "pool_pre_ping": self.pool_pre_ping,
             "echo": self.echo_sql,
+            "query_cache_size": self.query_cache_size,
         }
 
 
@@ -134,6 +137,7 @@ class SupabaseConfig(BaseModel):
     # Performance settings
     echo_sql: bool = Field(default=False, description="Echo SQL statements (debug)")
     pool_pre_ping: bool = Field(default=True, description="Test connections before use")
+    query_cache_size: int = Field(default=1200, description="SQLAlchemy compiled-statement cache size")
 
     @classmethod
     def from_env(cls) -> "SupabaseConfig":
@@ -164,6 +168,7 @@ class SupabaseConfig(BaseModel):
             pool_timeout=int(os.getenv("SUPABASE_POOL_TIMEOUT", "30")),
             pool_recycle=int(os.getenv("SUPABASE_POOL_RECYCLE", "1800")),
             echo_sql=os.getenv("SUPABASE_ECHO_SQL", "false").lower() == "true",
+            query_cache_size=int(os.getenv("SUPABASE_QUERY_CACHE_SIZE", "1200")),
         )
 
     def get_connection_string(self, async_driver: bool = False) -> str:
@@ -198,6 +203,7 @@ class SupabaseConfig(BaseModel):
             "pool_recycle": self.pool_recycle,
             "pool_pre_ping": self.pool_pre_ping,
             "echo": self.echo_sql,
+            "query_cache_size": self.query_cache_size,
         }
 
 
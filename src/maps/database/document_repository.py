@@ -21,6 +21,7 @@ Usage:
     document = repo.insert_canonical_document(canonical_doc, source_file=f"pylidc://{scan.patient_id}")
 """
 
+import json
 import logging
 import hashlib
 from datetime import datetime
@@ -28,16 +29,38 @@ from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 from uuid import uuid4, UUID
 
-from sqlalchemy import create_engine, and_, or_, desc, func
+from sqlalchemy import create_engine, and_, or_, desc, func, tuple_, select, bindparam, update, cast, String
 from sqlalchemy.orm import sessionmaker, Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import insert, JSONB, ARRAY
 
 from .models import Base, Document, DocumentContent
 from .db_config import db_config
 
 logger = logging.getLogger(__name__)
 
+# Prepared statements for the hottest single-row lookups. Building these once
+# at module load lets SQLAlchemy's compiled-statement cache skip SQL
+# compilation (~100us per call) on every subsequent execution.
+_GET_DOCUMENT = select(Document).where(Document.id == bindparam('document_id'))
+_GET_DOCUMENT_CONTENT = select(DocumentContent).where(
+    DocumentContent.document_id == bindparam('document_id')
+)
+_GET_DOCUMENTS_BY_BATCH = select(Document).where(
+    Document.batch_id == bindparam('batch_id')
+)
+
+
+def _hash_source_path(source_file: str) -> str:
+    """
+    Fixed-width digest of a source file path.
+
+    Upsert lookups filter on this 32-char hex value instead of the full
+    (often very long) pylidc:// path: shorter index keys pack more entries
+    per B-tree page, improving cache hit rate.
+    """
+    return hashlib.blake2b(source_file.encode(), digest_size=16).hexdigest()
+
 
 class DocumentRepository:
     """
@@ -152,6 +175,7 @@ class DocumentRepository:
             document = Document(
                 source_file_name=source_file_name,
                 source_file_path=source_file_path,
+                source_file_path_hash=_hash_source_path(source_file_path),
                 file_type=file_type,
                 uploaded_by=uploaded_by,
                 source_system=source_system,
@@ -166,7 +190,9 @@ class DocumentRepository:
     def get_document(self, document_id: UUID) -> Optional[Document]:
         """Get document by ID"""
         with self.get_session() as session:
-            return session.query(Document).filter(Document.id == document_id).first()
+            return session.execute(
+                _GET_DOCUMENT, {'document_id': document_id}
+            ).scalar_one_or_none()
 
     def get_document_with_content(self, document_id: UUID) -> Optional[Document]:
         """Get document with content eagerly loaded"""
@@ -242,9 +268,9 @@ class DocumentRepository:
     def get_document_content(self, document_id: UUID) -> Optional[DocumentContent]:
         """Get document content by document ID"""
         with self.get_session() as session:
-            return session.query(DocumentContent)\
-                .filter(DocumentContent.document_id == document_id)\
-                .first()
+            return session.execute(
+                _GET_DOCUMENT_CONTENT, {'document_id': document_id}
+            ).scalar_one_or_none()
 
     def update_document_content(
         self,
@@ -268,6 +294,46 @@ class DocumentRepository:
                     content.tags = tags
                 logger.info(f"Updated content for document: {document_id}")
 
+    def update_canonical_patch(
+        self,
+        document_id: UUID,
+        patches: Dict[Tuple[str, ...], Any]
+    ) -> bool:
+        """
+        Patch individual fields inside canonical_data (PostgreSQL only)
+
+        Overwriting the whole JSONB blob forces Postgres to TOAST-rewrite
+        the entire field and reindex every GIN path. jsonb_set only rewrites
+        the affected leaves, so prefer this for small in-place updates;
+        keep update_document_content / upsert for full re-ingest.
+
+        Args:
+            document_id: UUID of parent document
+            patches: Mapping of JSON path tuples to new values,
+                     e.g. {('metadata', 'status'): 'reviewed'}
+
+        Returns:
+            True if a row was updated, False otherwise
+        """
+        if not patches:
+            return False
+
+        expr = DocumentContent.canonical_data
+        for path, value in patches.items():
+            pg_path = '{' + ','.join(path) + '}'
+            expr = func.jsonb_set(expr, pg_path, cast(json.dumps(value), JSONB))
+
+        with self.get_session() as session:
+            result = session.execute(
+                update(DocumentContent)
+                .where(DocumentContent.document_id == document_id)
+                .values(canonical_data=expr)
+            )
+            if result.rowcount:
+                logger.info(f"Patched {len(patches)} canonical field(s) for document: {document_id}")
+                return True
+            return False
+
     # =========================================================================
     # CANONICAL DOCUMENT OPERATIONS (High-Level API)
     # =========================================================================
@@ -300,6 +366,7 @@ class DocumentRepository:
                 source_file=source_file,
                 uploaded_by=uploaded_by
             )
+            doc.source_file_path_hash = _hash_source_path(source_file)
             doc.batch_id = batch_id
             session.add(doc)
             session.flush()  # Get the document ID
@@ -340,10 +407,21 @@ class DocumentRepository:
             Tuple of (Document, DocumentContent)
         """
         with self.get_session() as session:
-            # Check if document exists
+            # Check if document exists. Probe the compact path-hash index
+            # first; only on a miss fall back to a separate path-equality
+            # query for rows ingested before the hash column was
+            # backfilled. OR-ing the two in one query would force a
+            # sequential scan, since source_file_path has no index.
             existing_doc = session.query(Document)\
-                .filter(Document.source_file_path == source_file)\
+                .filter(Document.source_file_path_hash == _hash_source_path(source_file))\
                 .first()
+            if existing_doc is None:
+                existing_doc = session.query(Document)\
+                    .filter(
+                        Document.source_file_path_hash.is_(None),
+                        Document.source_file_path == source_file
+                    )\
+                    .first()
 
             if existing_doc:
                 # Update existing document
@@ -430,9 +508,30 @@ class DocumentRepository:
 
     def get_documents_by_batch(self, batch_id: UUID) -> List[Document]:
         """Get all documents in a batch"""
+        with self.get_session() as session:
+            return session.execute(
+                _GET_DOCUMENTS_BY_BATCH, {'batch_id': batch_id}
+            ).scalars().all()
+
+    def get_documents_by_tags(self, tags: List[str]) -> List[Document]:
+        """
+        Get documents whose content carries all of the given tags
+        (PostgreSQL only)
+
+        Uses array containment (tags @> ARRAY[...]) which the GIN index on
+        document_content.tags serves in O(log N), instead of a sequential
+        scan with per-row ANY(tags) checks.
+
+        Args:
+            tags: Tags that must all be present on the document
+
+        Returns:
+            List of matching Document objects
+        """
         with self.get_session() as session:
             return session.query(Document)\
-                .filter(Document.batch_id == batch_id)\
+                .join(DocumentContent, Document.id == DocumentContent.document_id)\
+                .filter(DocumentContent.tags.op('@>')(cast(tags, ARRAY(String))))\
                 .all()
 
     def get_documents_by_source_system(self, source_system: str) -> List[Document]:
@@ -446,35 +545,50 @@ class DocumentRepository:
         self,
         search_text: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Tuple[Document, DocumentContent]]:
         """
         Full-text search across documents
 
+        Results are ordered newest-first by (ingestion_timestamp, id). For
+        deep pagination pass the last row's (ingestion_timestamp, id) as
+        `cursor`: keyset pagination seeks the index directly instead of
+        scanning and discarding `offset` rows on every page.
+
         Args:
             search_text: Text to search for
             limit: Maximum results
-            offset: Offset for pagination
+            offset: Offset for pagination (legacy; prefer cursor)
+            cursor: (ingestion_timestamp, id) of the last row of the
+                    previous page; only rows strictly older are returned
 
         Returns:
             List of (Document, DocumentContent) tuples
         """
         with self.get_session() as session:
             # PostgreSQL full-text search
-            results = session.query(Document, DocumentContent)\
+            query = session.query(Document, DocumentContent)\
                 .join(DocumentContent, Document.id == DocumentContent.document_id)\
                 .filter(
                     or_(
                         Document.source_file_name.ilike(f'%{search_text}%'),
                         DocumentContent.searchable_text.ilike(f'%{search_text}%')
                     )
-                )\
+                )
+
+            if cursor is not None:
+                query = query.filter(
+                    tuple_(Document.ingestion_timestamp, Document.id) < cursor
+                )
+            elif offset:
+                query = query.offset(offset)
+
+            return query\
+                .order_by(desc(Document.ingestion_timestamp), desc(Document.id))\
                 .limit(limit)\
-                .offset(offset)\
                 .all()
 
-            return results
-
     def get_recent_documents(
         self,
         limit: int = 50,
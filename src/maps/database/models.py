@@ -262,6 +262,9 @@ class Document(Base):
     id = Column(UUIDCompat, primary_key=True, default=uuid4)
     source_file_name = Column(String(500), nullable=False)
     source_file_path = Column(Text, nullable=False)
+    # Fixed-width blake2b digest of source_file_path; indexing 32 hex chars
+    # packs far more entries per B-tree page than long pylidc:// paths
+    source_file_path_hash = Column(String(32), index=True)
     file_type = Column(
         String(50),
         nullable=False,
@@ -5,7 +5,7 @@ Abstract base class for document structure/parse case detection.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import ClassVar, Dict, Any, FrozenSet, List
 import hashlib
 
 
@@ -31,6 +31,11 @@ class BaseStructureDetector(ABC):
                 }
     """
 
+    #: Lowercase file extensions (including the dot) this detector handles.
+    #: Declaring these lets the factory dispatch via an O(1) dict lookup;
+    #: detectors that leave this empty fall back to can_detect() scanning.
+    supported_extensions: ClassVar[FrozenSet[str]] = frozenset()
+
     @abstractmethod
     def can_detect(self, file_path: str) -> bool:
         """
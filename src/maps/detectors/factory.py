@@ -4,8 +4,10 @@ Structure Detector Factory
 Auto-selects appropriate detector based on file format.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 import logging
+import os
 
 from .base import BaseStructureDetector
 
@@ -25,13 +27,16 @@ class DetectorFactory:
     def __init__(self):
         """Initialize factory with default detectors."""
         self.detectors: List[BaseStructureDetector] = []
+        # Extension -> detector index for O(1) dispatch (built from each
+        # detector's declared supported_extensions).
+        self._by_ext: Dict[str, BaseStructureDetector] = {}
         self._register_default_detectors()
 
     def _register_default_detectors(self):
         """Register built-in detectors (XML, etc.)."""
         try:
             from .xml_structure_detector import XMLStructureDetector
-            self.detectors.append(XMLStructureDetector())
+            self._add_detector(XMLStructureDetector())
             logger.info("Registered XMLStructureDetector")
         except ImportError as e:
             logger.warning(f"Could not load XMLStructureDetector: {e}")
@@ -41,18 +46,34 @@ class DetectorFactory:
         # - JSONStructureDetector
         # - DICOMStructureDetector
 
+    def _add_detector(self, detector: BaseStructureDetector):
+        """Append detector and index its declared extensions."""
+        self.detectors.append(detector)
+        for ext in detector.supported_extensions:
+            self._by_ext.setdefault(ext, detector)
+
     def get_detector(self, file_path: str) -> Optional[BaseStructureDetector]:
         """
         Get the appropriate detector for the given file.
 
+        Detectors that declare supported_extensions are resolved via a
+        single dict lookup; the remainder are scanned with can_detect().
+
         Args:
             file_path: Path to file
 
         Returns:
             BaseStructureDetector instance or None if no detector found
         """
+        ext = os.path.splitext(file_path)[1].lower()
+        detector = self._by_ext.get(ext)
+        if detector is not None:
+            logger.info(f"Selected {detector.__class__.__name__} for {file_path}")
+            return detector
+
+        # Fall back to linear scan for detectors without declared extensions
         for detector in self.detectors:
-            if detector.can_detect(file_path):
+            if not detector.supported_extensions and detector.can_detect(file_path):
                 logger.info(f"Selected {detector.__class__.__name__} for {file_path}")
                 return detector
 
@@ -69,7 +90,7 @@ class DetectorFactory:
         if not isinstance(detector, BaseStructureDetector):
             raise TypeError(f"Detector must inherit from BaseStructureDetector, got {type(detector)}")
 
-        self.detectors.append(detector)
+        self._add_detector(detector)
         logger.info(f"Registered custom detector: {detector.__class__.__name__}")
 
     def list_detectors(self) -> List[str]:
@@ -77,13 +98,13 @@ class DetectorFactory:
         return [detector.__class__.__name__ for detector in self.detectors]
 
 
-# Singleton instance
-_factory_instance: Optional[DetectorFactory] = None
-
-
+@lru_cache(maxsize=1)
 def get_detector_factory() -> DetectorFactory:
-    """Get singleton factory instance."""
-    global _factory_instance
-    if _factory_instance is None:
-        _factory_instance = DetectorFactory()
-    return _factory_instance
+    """
+    Get singleton factory instance.
+
+    lru_cache is thread-safe at the C level, so concurrent first calls
+    cannot double-initialize the factory (unlike the previous unlocked
+    module global). Tests can reset with get_detector_factory.cache_clear().
+    """
+    return DetectorFactory()
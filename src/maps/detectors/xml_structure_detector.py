@@ -107,6 +107,8 @@ class XMLStructureDetector(BaseStructureDetector):
     # BaseStructureDetector Implementation
     # =========================================================================
 
+    supported_extensions = frozenset({'.xml'})
+
     def can_detect(self, file_path: str) -> bool:
         """Check if this detector can handle XML files."""
         return file_path.lower().endswith(('.xml', '.XML'))
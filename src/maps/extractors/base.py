@@ -6,11 +6,17 @@ Enables adding new file formats without modifying existing code.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple
+from typing import ClassVar, FrozenSet, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+import sys
 
+# slots=True removes the per-instance __dict__ (~2-3x smaller objects, faster
+# attribute access); batch extractions create tens of thousands of keywords.
+# The keyword argument only exists on Python 3.10+, so fall back gracefully.
+_SLOTS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS_KWARGS)
 class ExtractedKeyword:
     """
     Container for an extracted keyword with metadata.
@@ -33,7 +39,9 @@ class ExtractedKeyword:
     position: Optional[Tuple[int, int]] = None
 
     def __repr__(self):
-        return f"<ExtractedKeyword(text='{self.text}', category='{self.category}', freq={self.frequency})>"
+        # Compact single-pass format: repr gets called for every element when
+        # keyword lists end up in log output, so keep it cheap.
+        return f"<EK {self.text!r}/{self.category} x{self.frequency}>"
 
 
 class BaseKeywordExtractor(ABC):
@@ -55,6 +63,11 @@ class BaseKeywordExtractor(ABC):
                 pass
     """
 
+    #: Lowercase file extensions (including the dot) this extractor handles.
+    #: Declaring these lets the factory dispatch via an O(1) dict lookup;
+    #: extractors that leave this empty fall back to can_extract() scanning.
+    supported_extensions: ClassVar[FrozenSet[str]] = frozenset()
+
     @abstractmethod
     def can_extract(self, file_path: str) -> bool:
         """
@@ -108,17 +121,20 @@ class BaseKeywordExtractor(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        from pathlib import Path
-
-        path = Path(file_path)
-
-        if not path.exists():
+        import os
+        import stat
+
+        # Single os.stat call answers existence, file-type and size checks
+        # (vs three syscalls with exists()/is_file()/stat()).
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             return False, f"File not found: {file_path}"
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Not a file: {file_path}"
 
-        if path.stat().st_size == 0:
+        if st.st_size == 0:
             return False, f"File is empty: {file_path}"
 
         return True, None
@@ -5,8 +5,10 @@ Auto-selects appropriate extractor based on file format.
 Implements plugin pattern for custom extractors.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 import logging
+import os
 
 from .base import BaseKeywordExtractor
 
@@ -29,20 +31,23 @@ class KeywordExtractorFactory:
     def __init__(self):
         """Initialize factory with default extractors."""
         self.extractors: List[BaseKeywordExtractor] = []
+        # Extension -> extractor index for O(1) dispatch (built from each
+        # extractor's declared supported_extensions).
+        self._by_ext: Dict[str, BaseKeywordExtractor] = {}
         self._register_default_extractors()
 
     def _register_default_extractors(self):
         """Register built-in extractors (XML, PDF)."""
         try:
             from .xml_keyword_extractor import XMLKeywordExtractor
-            self.extractors.append(XMLKeywordExtractor())
+            self._add_extractor(XMLKeywordExtractor())
             logger.info("Registered XMLKeywordExtractor")
         except ImportError as e:
             logger.warning(f"Could not load XMLKeywordExtractor: {e}")
 
         try:
             from .pdf_keyword_extractor import PDFKeywordExtractor
-            self.extractors.append(PDFKeywordExtractor())
+            self._add_extractor(PDFKeywordExtractor())
             logger.info("Registered PDFKeywordExtractor")
         except ImportError as e:
             logger.warning(f"Could not load PDFKeywordExtractor: {e}")
@@ -52,18 +57,34 @@ class KeywordExtractorFactory:
         # - JSONKeywordExtractor
         # - DICOMKeywordExtractor
 
+    def _add_extractor(self, extractor: BaseKeywordExtractor):
+        """Append extractor and index its declared extensions."""
+        self.extractors.append(extractor)
+        for ext in extractor.supported_extensions:
+            self._by_ext.setdefault(ext, extractor)
+
     def get_extractor(self, file_path: str) -> Optional[BaseKeywordExtractor]:
         """
         Get the appropriate extractor for the given file.
 
+        Extractors that declare supported_extensions are resolved via a
+        single dict lookup; the remainder are scanned with can_extract().
+
         Args:
             file_path: Path to file
 
         Returns:
             BaseKeywordExtractor instance or None if no extractor found
         """
+        ext = os.path.splitext(file_path)[1].lower()
+        extractor = self._by_ext.get(ext)
+        if extractor is not None:
+            logger.info(f"Selected {extractor.__class__.__name__} for {file_path}")
+            return extractor
+
+        # Fall back to linear scan for extractors without declared extensions
         for extractor in self.extractors:
-            if extractor.can_extract(file_path):
+            if not extractor.supported_extensions and extractor.can_extract(file_path):
                 logger.info(f"Selected {extractor.__class__.__name__} for {file_path}")
                 return extractor
 
@@ -80,7 +101,7 @@ class KeywordExtractorFactory:
         if not isinstance(extractor, BaseKeywordExtractor):
             raise TypeError(f"Extractor must inherit from BaseKeywordExtractor, got {type(extractor)}")
 
-        self.extractors.append(extractor)
+        self._add_extractor(extractor)
         logger.info(f"Registered custom extractor: {extractor.__class__.__name__}")
 
     def list_extractors(self) -> List[str]:
@@ -88,13 +109,14 @@ class KeywordExtractorFactory:
         return [extractor.__class__.__name__ for extractor in self.extractors]
 
 
-# Singleton instance
-_factory_instance: Optional[KeywordExtractorFactory] = None
-
-
+@lru_cache(maxsize=1)
 def get_keyword_extractor_factory() -> KeywordExtractorFactory:
-    """Get singleton factory instance."""
-    global _factory_instance
-    if _factory_instance is None:
-        _factory_instance = KeywordExtractorFactory()
-    return _factory_instance
+    """
+    Get singleton factory instance.
+
+    lru_cache is thread-safe at the C level, so concurrent first calls
+    cannot double-initialize the factory (unlike the previous unlocked
+    module global). Tests can reset with
+    get_keyword_extractor_factory.cache_clear().
+    """
+    return KeywordExtractorFactory()
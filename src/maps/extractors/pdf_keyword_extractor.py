@@ -89,6 +89,8 @@ class PDFKeywordExtractor(BaseKeywordExtractor):
     # BaseKeywordExtractor Implementation
     # =========================================================================
 
+    supported_extensions = frozenset({'.pdf'})
+
     def can_extract(self, file_path: str) -> bool:
         """Check if this extractor can handle PDF files."""
         return file_path.lower().endswith(('.pdf', '.PDF'))
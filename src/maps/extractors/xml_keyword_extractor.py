@@ -102,6 +102,8 @@ class XMLKeywordExtractor(BaseKeywordExtractor):
     # BaseKeywordExtractor Implementation
     # =========================================================================
 
+    supported_extensions = frozenset({'.xml'})
+
     def can_extract(self, file_path: str) -> bool:
         """
         Check if this extractor can handle the file.
@@ -180,7 +182,8 @@ class XMLKeywordExtractor(BaseKeywordExtractor):
             self._extraction_stats['files_processed'] += 1
             self._extraction_stats['total_keywords'] += len(keywords)
             
-            logger.debug(f"Extracted {len(keywords)} keywords from {Path(xml_path).name}")
+            # Lazy %s formatting: skipped entirely when DEBUG is filtered out
+            logger.debug("Extracted %d keywords from %s", len(keywords), Path(xml_path).name)
             
             return keywords
             
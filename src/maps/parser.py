@@ -10,7 +10,9 @@ import re
 import subprocess
 import traceback
 import xml.etree.ElementTree as ET
+from lxml import etree as lxml_etree
 from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional, Union, Any
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -361,8 +363,13 @@ def convert_parsed_data_to_maps_format(dataframes: Dict[str, pd.DataFrame]) -> L
     return records
 
 # function to parse a single radiology xml file
+@lru_cache(maxsize=None)
 def get_expected_attributes_for_case(parse_case: str) -> Dict[str, List[str]]:
-    """define what attributes should be expected for each parse case"""
+    """define what attributes should be expected for each parse case
+
+    pure function of a small string key, so the table literal is built
+    once per case instead of on every file; callers only read the result
+    """
     expected_attrs = {
         "Complete_Attributes": {
             "header": ["StudyInstanceUID", "SeriesInstanceUID", "Modality", "DateService", "TimeService"],
@@ -430,335 +437,277 @@ def get_expected_attributes_for_case(parse_case: str) -> Dict[str, List[str]]:
     
     return expected_attrs.get(parse_case, default_expected)
 
-def parse_radiology_sample(file_path: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def parse_radiology_sample(file_path, filename: Optional[str] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     parse a single radiology xml file and extract nodule/roi data
-    
+
+    the document is streamed with lxml iterparse rather than loaded as one
+    DOM: each reading session is processed and freed as its end tag
+    arrives, so peak memory tracks the largest session instead of the
+    whole file
+
     args:
-        file_path: path to the xml file to parse
-    
+        file_path: path to the xml file, or a seekable binary file-like
+            object (rewound between the detection and extraction passes)
+        filename: original name when a stream is given; supplies the FileID
+
     returns:
         tuple: (main_dataframe, unblinded_dataframe) containing extracted data
     """
-    print(f"🔍 Parsing XML file: {os.path.basename(file_path)}")
-    
+    is_stream = hasattr(file_path, "read")
+    source_name = filename if is_stream else os.path.basename(file_path)
+    print(f"🔍 Parsing XML file: {source_name or '<stream>'}")
+
     # detect the parse case first to understand xml structure
     print(f"  📋 Detecting parse case...")
     parse_case = detect_parse_case(file_path)
+    if is_stream:
+        file_path.seek(0)
     print(f"  ✅ Parse case: {parse_case}")
-    
+
     expected_attrs = get_expected_attributes_for_case(parse_case)
-    
-    # re already imported at module level
-    file_id = os.path.basename(file_path).split('.')[0]
+
+    file_id = os.path.basename(source_name).split('.')[0] if source_name else "stream"
     print(f"  📄 File ID: {file_id}")
-    
-    print(f"  🔄 Loading XML structure...")
-    tree = ET.parse(file_path)
-    xml_root = tree.getroot()
-    print(f"  ✅ XML loaded, root element: {xml_root.tag.split('}')[-1] if '}' in xml_root.tag else xml_root.tag}")
-    
+
     # Debug logging for N/A diagnosis
     debug_info = []
 
-    # Dynamically get the namespace from the root tag
-    m = re.match(r'\{(.*)\}', xml_root.tag)
-    ns_uri = m.group(1) if m else ''
-
-    # Helper to build tag with or without namespace
-    def tag(name):
-        return f"{{{ns_uri}}}{name}" if ns_uri else name
-
-    # Detect XML structure based on root element
-    root_tag_name = xml_root.tag.split('}')[-1] if '}' in xml_root.tag else xml_root.tag
-    is_lidc_format = root_tag_name == 'LidcReadMessage'
-
-    # Extract header information with expected vs missing logic
-    print(f"  🔍 Extracting header information...")
-    header = xml_root.find(tag('ResponseHeader'))
+    # Header defaults follow the expected-vs-missing logic; overwritten in
+    # place when the ResponseHeader element streams past
     header_values = {}
-    
-    if header is not None:
-        print(f"  ✅ ResponseHeader found")
-        debug_info.append("✓ ResponseHeader found")
-        
-        # Check each expected header field
-        for field in ["StudyInstanceUID", "SeriesInstanceUID", "SeriesInstanceUid", "Modality", "DateService", "TimeService"]:
+    for field in ["StudyInstanceUID", "SeriesInstanceUID", "Modality", "DateService", "TimeService"]:
+        header_values[field] = "MISSING" if field in expected_attrs["header"] else "#N/A"
+    header_seen = False
+
+    def extract_header(header):
+        """Fill header_values from a ResponseHeader element"""
+        for field in ["StudyInstanceUID", "SeriesInstanceUID", "Modality", "DateService", "TimeService"]:
             if field == "SeriesInstanceUID":
                 # Handle different spelling variations
-                elem = header.find(tag('SeriesInstanceUID')) or header.find(tag('SeriesInstanceUid'))
-                field_key = "SeriesInstanceUID"
+                elem = header.find('{*}SeriesInstanceUID')
+                if elem is None:
+                    elem = header.find('{*}SeriesInstanceUid')
             else:
-                elem = header.find(tag(field))
-                field_key = field
-            
+                elem = header.find('{*}' + field)
+
             if elem is not None and elem.text:
-                header_values[field_key] = elem.text
-            elif field_key in expected_attrs["header"]:
-                header_values[field_key] = "MISSING"
-                debug_info.append(f"⚠️  {field_key} expected but MISSING")
-            else:
-                header_values[field_key] = "#N/A"
-    else:
-        print(f"  ⚠️  ResponseHeader NOT FOUND")
-        debug_info.append("❌ ResponseHeader NOT FOUND")
-        # Set all header fields based on expectations
-        for field in ["StudyInstanceUID", "SeriesInstanceUID", "Modality", "DateService", "TimeService"]:
-            if field in expected_attrs["header"]:
+                header_values[field] = elem.text
+            elif field in expected_attrs["header"]:
                 header_values[field] = "MISSING"
+                debug_info.append(f"⚠️  {field} expected but MISSING")
             else:
                 header_values[field] = "#N/A"
-    
-    # Extract values with defaults
-    study_uid = header_values.get("StudyInstanceUID", "#N/A")
-    series_uid = header_values.get("SeriesInstanceUID", "#N/A") 
-    modality = header_values.get("Modality", "#N/A")
-    date_service = header_values.get("DateService", "#N/A")
-    time_service = header_values.get("TimeService", "#N/A")
-    print(f"  📊 Header extracted: StudyUID={study_uid[:20]}...{'(truncated)' if len(study_uid) > 20 else ''}")
 
-    data_rows = []
-    unblinded_data_rows = []
+    def _num(value):
+        """Coerce numeric-looking strings, leaving sentinels untouched"""
+        if value not in ["#N/A", "MISSING"] and str(value).replace('.', '', 1).isdigit():
+            return float(value)
+        return value
 
-    # Determine session element name based on format
-    session_tag = 'readingSession' if is_lidc_format else 'CXRreadingSession'
-    unblinded_tag = 'unblindedReadNodule' if is_lidc_format else 'unblindedRead'
+    def process_session(session, session_idx):
+        """Extract all data rows for one reading session element"""
+        rows = []
 
-    # Look for session elements
-    print(f"  🔍 Looking for reading sessions...")
-    sessions = xml_root.findall(tag(session_tag))
-    print(f"  📊 Found {len(sessions)} sessions (searching for {session_tag})")
-    debug_info.append(f"Sessions found: {len(sessions)} (looking for {session_tag})")
-    
-    if not sessions:
-        print(f"  ⚠️  No sessions found - trying alternative session tags")
-        debug_info.append(f"❌ NO SESSIONS FOUND - trying alternative session tags")
-        # Try alternative session tags
-        alt_sessions = xml_root.findall(tag('readingSession')) + xml_root.findall(tag('CXRreadingSession'))
-        print(f"  📊 Alternative sessions found: {len(alt_sessions)}")
-        debug_info.append(f"Alternative sessions: {len(alt_sessions)}")
-        if alt_sessions:
-            sessions = alt_sessions
-            print(f"  ✅ Using alternative sessions")
-            debug_info.append("✓ Using alternative sessions")
-    
-    # Print debug info for files with issues
-    if not sessions or any("❌" in info for info in debug_info):
-        print(f"\nDEBUG INFO for {file_id}:")
-        for info in debug_info:
-            print(f"  {info}")
-        if not sessions:
-            print(f"  Root children: {[child.tag for child in root]}")
-    
-    print(f"  🔄 Processing {len(sessions)} sessions...")
-    for session_idx, session in enumerate(sessions):
-        print(f"    📋 Session {session_idx + 1}/{len(sessions)}")
-        
-        rad_base_elem = session.find(tag('servicingRadiologistID'))
+        rad_base_elem = session.find('{*}servicingRadiologistID')
         rad_base = rad_base_elem.text if rad_base_elem is not None else "unknown"
-        
+
         # Use session index + 1 for consistent radiologist numbering
         radiologist = f"anonRad{session_idx + 1}"
         print(f"      👨‍⚕️ Radiologist: {radiologist} (base: {rad_base})")
-        
-        # Check if this is the last radiologist (unblinded read)
-        is_last_radiologist = session_idx == len(sessions) - 1
 
-        # Look for unblinded read elements
-        unblinded_reads = session.findall(tag(unblinded_tag))
+        # LIDC sessions carry unblindedReadNodule, CXR sessions unblindedRead
+        unblinded_reads = session.findall('{*}unblindedReadNodule')
+        if not unblinded_reads:
+            unblinded_reads = session.findall('{*}unblindedRead')
         print(f"      📊 Found {len(unblinded_reads)} unblinded reads")
-        
-        for unblinded_idx, unblinded in enumerate(unblinded_reads):
-            print(f"        🔍 Processing unblinded read {unblinded_idx + 1}/{len(unblinded_reads)}")
-            
-            nodule_id_elem = unblinded.find(tag('noduleID'))
+
+        for unblinded in unblinded_reads:
+            nodule_id_elem = unblinded.find('{*}noduleID')
             nodule_id = nodule_id_elem.text if nodule_id_elem is not None else "#N/A"
-            print(f"          📌 Nodule ID: {nodule_id}")
-            
+
             # Parse characteristics with expected vs missing logic
-            print(f"          🔍 Extracting characteristics...")
-            characteristics = unblinded.find(tag('characteristics'))
+            characteristics = unblinded.find('{*}characteristics')
             char_values = {}
-            
-            if characteristics is not None:
-                print(f"          ✅ Characteristics found")
-                # Check each characteristic field
-                for char_field in ["confidence", "subtlety", "obscuration", "reason"]:
-                    elem = characteristics.find(tag(char_field))
-                    if elem is not None and elem.text:
-                        char_values[char_field] = elem.text
-                    elif char_field in expected_attrs["characteristics"]:
-                        char_values[char_field] = "MISSING"
-                    else:
-                        char_values[char_field] = "#N/A"
-            else:
-                print(f"          ⚠️  No characteristics found")
-                # No characteristics found
-                for char_field in ["confidence", "subtlety", "obscuration", "reason"]:
-                    if char_field in expected_attrs["characteristics"]:
-                        char_values[char_field] = "MISSING"
-                    else:
-                        char_values[char_field] = "#N/A"
-            
-            confidence = char_values.get("confidence", "#N/A")
-            subtlety = char_values.get("subtlety", "#N/A")
-            obscuration = char_values.get("obscuration", "#N/A")
-            reason = char_values.get("reason", "#N/A")
-            print(f"          📊 Extracted: confidence={confidence}, subtlety={subtlety}, obscuration={obscuration}, reason={reason}")
+            for char_field in ["confidence", "subtlety", "obscuration", "reason"]:
+                elem = characteristics.find('{*}' + char_field) if characteristics is not None else None
+                if elem is not None and elem.text:
+                    char_values[char_field] = elem.text
+                elif char_field in expected_attrs["characteristics"]:
+                    char_values[char_field] = "MISSING"
+                else:
+                    char_values[char_field] = "#N/A"
+
+            confidence = char_values["confidence"]
+            subtlety = char_values["subtlety"]
+            obscuration = char_values["obscuration"]
+            reason = char_values["reason"]
 
             # Process ROI elements with expected vs missing logic
-            print(f"          🔍 Processing ROI elements...")
-            rois = unblinded.findall(tag('roi'))
-            print(f"          📊 Found {len(rois)} ROI elements")
-            
+            rois = unblinded.findall('{*}roi')
+
             if not rois:
-                print(f"          ⚠️  No ROIs found - creating entry with missing ROI data")
                 # No ROIs found - determine what should be marked as MISSING vs N/A
                 sop_uid = "MISSING" if "imageSOP_UID" in expected_attrs["roi"] else "#N/A"
                 x = "MISSING" if "xCoord" in expected_attrs["roi"] else "#N/A"
                 y = "MISSING" if "yCoord" in expected_attrs["roi"] else "#N/A"
-                
+
                 # Create one entry for missing ROI data
-                row_data = {
+                rows.append({
                     "FileID": file_id,
                     "ParseCase": parse_case,
                     "Radiologist": radiologist,
                     "SessionType": "Standard",  # No ROIs means standard session
                     "NoduleID": int(nodule_id) if nodule_id not in ["#N/A", "MISSING"] and str(nodule_id).isdigit() else nodule_id,
-                    "Confidence": float(confidence) if confidence not in ["#N/A", "MISSING"] and str(confidence).replace('.', '', 1).isdigit() else confidence,
-                    "Subtlety": float(subtlety) if subtlety not in ["#N/A", "MISSING"] and str(subtlety).replace('.', '', 1).isdigit() else subtlety,
-                    "Obscuration": float(obscuration) if obscuration not in ["#N/A", "MISSING"] and str(obscuration).replace('.', '', 1).isdigit() else obscuration,
+                    "Confidence": _num(confidence),
+                    "Subtlety": _num(subtlety),
+                    "Obscuration": _num(obscuration),
                     "Reason": reason,
                     "SOP_UID": sop_uid,
                     "X_coord": x,
                     "Y_coord": y,
                     "CoordCount": 0,  # No coordinates
-                    "StudyInstanceUID": study_uid,
-                    "SeriesInstanceUID": series_uid,
-                    "Modality": modality,
-                    "DateService": date_service,
-                    "TimeService": time_service
-                }
-                
-                if is_last_radiologist:
-                    unblinded_data_rows.append(row_data)
-                    print(f"          ✅ Added row to unblinded data")
+                    "StudyInstanceUID": header_values["StudyInstanceUID"],
+                    "SeriesInstanceUID": header_values["SeriesInstanceUID"],
+                    "Modality": header_values["Modality"],
+                    "DateService": header_values["DateService"],
+                    "TimeService": header_values["TimeService"]
+                })
+                continue
+
+            for roi in rois:
+                # Parse ROI data with expected vs missing logic
+                sop_uid_elem = roi.find('{*}imageSOP_UID')
+                if sop_uid_elem is not None and sop_uid_elem.text:
+                    sop_uid = sop_uid_elem.text
+                elif "imageSOP_UID" in expected_attrs["roi"]:
+                    sop_uid = "MISSING"
                 else:
-                    data_rows.append(row_data)
-                    print(f"          ✅ Added row to main data")
+                    sop_uid = "#N/A"
+
+                # Get coordinates including Z position from edgeMap
+                x, y, z = "#N/A", "#N/A", "#N/A"  # Default values
+
+                # First, try to get imageZposition from roi level
+                z_elem = roi.find('{*}imageZposition')
+                if z_elem is not None and z_elem.text:
+                    z = z_elem.text
+
+                edge_maps = roi.findall('{*}edgeMap')
+                if edge_maps:
+                    # Use the first edge map for coordinates
+                    first_edge = edge_maps[0]
+                    x_elem = first_edge.find('{*}xCoord')
+                    y_elem = first_edge.find('{*}yCoord')
+
+                    # Also try to get z from edgeMap if not found at roi level
+                    if z == "#N/A":
+                        z_edge_elem = first_edge.find('{*}imageZposition')
+                        if z_edge_elem is not None and z_edge_elem.text:
+                            z = z_edge_elem.text
+
+                    if x_elem is not None and x_elem.text:
+                        x = x_elem.text
+                    elif "xCoord" in expected_attrs["roi"]:
+                        x = "MISSING"
+
+                    if y_elem is not None and y_elem.text:
+                        y = y_elem.text
+                    elif "yCoord" in expected_attrs["roi"]:
+                        y = "MISSING"
+                else:
+                    # No edge map found
+                    if "xCoord" in expected_attrs["roi"]:
+                        x = "MISSING"
+                    if "yCoord" in expected_attrs["roi"]:
+                        y = "MISSING"
+
+                # Mark sessions with many coordinates as "Detailed"
+                coord_count = len(edge_maps)
+                session_type = "Detailed" if coord_count > 10 else "Standard"
+
+                rows.append({
+                    "FileID": file_id,
+                    "ParseCase": parse_case,
+                    "Radiologist": radiologist,
+                    "SessionType": session_type,  # Identifies detailed sessions
+                    "NoduleID": int(nodule_id) if nodule_id not in ["#N/A", "MISSING"] and str(nodule_id).isdigit() else nodule_id,
+                    "Confidence": _num(confidence),
+                    "Subtlety": _num(subtlety),
+                    "Obscuration": _num(obscuration),
+                    "Reason": reason,
+                    "SOP_UID": sop_uid,
+                    "X_coord": _num(x),
+                    "Y_coord": _num(y),
+                    "Z_coord": _num(z),
+                    "CoordCount": coord_count,  # Track number of coordinates
+                    "StudyInstanceUID": header_values["StudyInstanceUID"],
+                    "SeriesInstanceUID": header_values["SeriesInstanceUID"],
+                    "Modality": header_values["Modality"],
+                    "DateService": header_values["DateService"],
+                    "TimeService": header_values["TimeService"]
+                })
+
+        return rows
+
+    data_rows = []
+    # The final session is the unblinded read, but the total session count
+    # isn't known while streaming: the newest session's rows are held here
+    # and flushed to data_rows when the next session arrives
+    last_session_rows = None
+    session_count = 0
+
+    print(f"  🔄 Streaming XML structure...")
+    context = lxml_etree.iterparse(
+        file_path,
+        events=("end",),
+        tag=("{*}ResponseHeader", "{*}readingSession", "{*}CXRreadingSession"),
+        huge_tree=True,
+        collect_ids=False,
+        remove_blank_text=True
+    )
+
+    try:
+        for _event, elem in context:
+            localname = lxml_etree.QName(elem).localname
+            if localname == 'ResponseHeader':
+                header_seen = True
+                debug_info.append("✓ ResponseHeader found")
+                extract_header(elem)
             else:
-                for roi_idx, roi in enumerate(rois):
-                    print(f"            🔍 Processing ROI {roi_idx + 1}/{len(rois)}")
-                    # Parse ROI data with expected vs missing logic
-                    sop_uid_elem = roi.find(tag('imageSOP_UID'))
-                    if sop_uid_elem is not None and sop_uid_elem.text:
-                        sop_uid = sop_uid_elem.text
-                    elif "imageSOP_UID" in expected_attrs["roi"]:
-                        sop_uid = "MISSING"
-                    else:
-                        sop_uid = "#N/A"
-                    
-                    # Get coordinates including Z position from edgeMap with expected vs missing logic
-                    print(f"            🔍 Extracting coordinates...")
-                    x, y, z = "#N/A", "#N/A", "#N/A"  # Default values
-                    
-                    # First, try to get imageZposition from roi level
-                    z_elem = roi.find(tag('imageZposition'))
-                    if z_elem is not None and z_elem.text:
-                        z = z_elem.text
-                        print(f"            📍 Z coordinate from ROI level: {z}")
-                    
-                    edge_maps = roi.findall(tag('edgeMap'))
-                    print(f"            📊 Found {len(edge_maps)} edge maps")
-                    
-                    if edge_maps:
-                        # Use the first edge map for coordinates
-                        first_edge = edge_maps[0]
-                        x_elem = first_edge.find(tag('xCoord'))
-                        y_elem = first_edge.find(tag('yCoord'))
-                        
-                        # Also try to get z from edgeMap if not found at roi level
-                        if z == "#N/A":
-                            z_edge_elem = first_edge.find(tag('imageZposition'))
-                            if z_edge_elem is not None and z_edge_elem.text:
-                                z = z_edge_elem.text
-                                print(f"            📍 Z coordinate from edge map: {z}")
-                        
-                        if x_elem is not None and x_elem.text:
-                            x = x_elem.text
-                        elif "xCoord" in expected_attrs["roi"]:
-                            x = "MISSING"
-                            
-                        if y_elem is not None and y_elem.text:
-                            y = y_elem.text
-                        elif "yCoord" in expected_attrs["roi"]:
-                            y = "MISSING"
-                        
-                        print(f"            📍 Coordinates extracted: X={x}, Y={y}, Z={z}")
-                    else:
-                        # Look for single edge map (original format)
-                        edge = roi.find(tag('edgeMap'))
-                        if edge is not None:
-                            x_elem = edge.find(tag('xCoord'))
-                            y_elem = edge.find(tag('yCoord'))
-                            
-                            # Also try to get z from edgeMap if not found at roi level
-                            if z == "#N/A":
-                                z_edge_elem = edge.find(tag('imageZposition'))
-                                if z_edge_elem is not None and z_edge_elem.text:
-                                    z = z_edge_elem.text
-                            
-                            if x_elem is not None and x_elem.text:
-                                x = x_elem.text
-                            elif "xCoord" in expected_attrs["roi"]:
-                                x = "MISSING"
-                                
-                            if y_elem is not None and y_elem.text:
-                                y = y_elem.text
-                            elif "yCoord" in expected_attrs["roi"]:
-                                y = "MISSING"
-                        else:
-                            # No edge map found
-                            if "xCoord" in expected_attrs["roi"]:
-                                x = "MISSING"
-                            if "yCoord" in expected_attrs["roi"]:
-                                y = "MISSING"
-
-                    # Count coordinates for this ROI to determine if it's a detailed session
-                    edge_maps = roi.findall(tag('edgeMap'))
-                    coord_count = len(edge_maps)
-                    
-                    # Mark sessions with many coordinates as "Detailed"
-                    session_type = "Detailed" if coord_count > 10 else "Standard"
-                    
-                    row_data = {
-                        "FileID": file_id,
-                        "ParseCase": parse_case,
-                        "Radiologist": radiologist,
-                        "SessionType": session_type,  # New field to identify detailed sessions
-                        "NoduleID": int(nodule_id) if nodule_id not in ["#N/A", "MISSING"] and str(nodule_id).isdigit() else nodule_id,
-                        "Confidence": float(confidence) if confidence not in ["#N/A", "MISSING"] and str(confidence).replace('.', '', 1).isdigit() else confidence,
-                        "Subtlety": float(subtlety) if subtlety not in ["#N/A", "MISSING"] and str(subtlety).replace('.', '', 1).isdigit() else subtlety,
-                        "Obscuration": float(obscuration) if obscuration not in ["#N/A", "MISSING"] and str(obscuration).replace('.', '', 1).isdigit() else obscuration,
-                        "Reason": reason,
-                        "SOP_UID": sop_uid,
-                        "X_coord": float(x) if x not in ["#N/A", "MISSING"] and str(x).replace('.', '', 1).isdigit() else x,
-                        "Y_coord": float(y) if y not in ["#N/A", "MISSING"] and str(y).replace('.', '', 1).isdigit() else y,
-                        "Z_coord": float(z) if z not in ["#N/A", "MISSING"] and str(z).replace('.', '', 1).isdigit() else z,
-                        "CoordCount": coord_count,  # Track number of coordinates
-                        "StudyInstanceUID": study_uid,
-                        "SeriesInstanceUID": series_uid,
-                        "Modality": modality,
-                        "DateService": date_service,
-                        "TimeService": time_service
-                    }
-                    
-                    if is_last_radiologist:
-                        unblinded_data_rows.append(row_data)
-                        print(f"            ✅ Added ROI row to unblinded data")
-                    else:
-                        data_rows.append(row_data)
-                        print(f"            ✅ Added ROI row to main data")
+                session_count += 1
+                print(f"    📋 Session {session_count}")
+                if last_session_rows is not None:
+                    data_rows.extend(last_session_rows)
+                last_session_rows = process_session(elem, session_count - 1)
+
+            # Free the processed subtree and any fully-parsed preceding siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except lxml_etree.XMLSyntaxError as e:
+        # Keep the pre-lxml error contract: callers handle ET.ParseError
+        # for malformed or empty documents
+        raise ET.ParseError(str(e)) from e
+    del context
+
+    # The last radiologist's session is the unblinded read
+    unblinded_data_rows = last_session_rows if last_session_rows is not None else []
+
+    if not header_seen:
+        print(f"  ⚠️  ResponseHeader NOT FOUND")
+        debug_info.append("❌ ResponseHeader NOT FOUND")
+
+    study_uid = header_values["StudyInstanceUID"]
+    print(f"  📊 Header extracted: StudyUID={study_uid[:20]}...{'(truncated)' if len(study_uid) > 20 else ''}")
+    print(f"  📊 Found {session_count} sessions")
+    debug_info.append(f"Sessions found: {session_count}")
+
+    # Print debug info for files with issues
+    if not session_count or any("❌" in info for info in debug_info):
+        print(f"\nDEBUG INFO for {file_id}:")
+        for info in debug_info:
+            print(f"  {info}")
 
     print(f"  🏁 Parsing complete for {file_id}")
     print(f"    📊 Main data rows: {len(data_rows)}")
@@ -845,55 +794,75 @@ def parse_multiple(files: List[str]) -> Tuple[Dict[str, pd.DataFrame], Dict[str,
     return case_data, case_unblinded_data
 
 
-def detect_parse_case(file_path: str) -> str:
+def detect_parse_case(file_path) -> str:
     """
     Detect the structure/case of an XML file for appropriate parsing strategy
+
+    accepts a path or a binary file-like object; everything the heuristic
+    needs — header completeness, the first read's characteristics, and the
+    session count — is collected in one lxml streaming pass, so detection
+    never builds the full document tree
     """
     try:
-        tree = ET.parse(file_path)
-        xml_root = tree.getroot()
-        # Get namespace if present
-        m = re.match(r'\{(.*)\}', xml_root.tag)
-        ns_uri = m.group(1) if m else ''
-        def tag(name):
-            return f"{{{ns_uri}}}{name}" if ns_uri else name
-        
-        # Check for basic structure indicators
-        header = xml_root.find(tag('ResponseHeader'))
-        sessions = xml_root.findall(tag('readingSession')) or xml_root.findall(tag('CXRreadingSession'))
-        
-        if not sessions:
+        header_complete = False
+        modality_present = False
+        session_count = 0
+        reads_found = False
+        characteristics_found = False
+        available_chars = []
+
+        context = lxml_etree.iterparse(
+            file_path,
+            events=("end",),
+            tag=("{*}ResponseHeader", "{*}readingSession", "{*}CXRreadingSession"),
+            huge_tree=True,
+            collect_ids=False
+        )
+        try:
+            for _event, elem in context:
+                localname = lxml_etree.QName(elem).localname
+                if localname == 'ResponseHeader':
+                    header_complete = True
+                    modality_elem = elem.find('{*}Modality')
+                    modality_present = modality_elem is not None and bool(modality_elem.text)
+                else:
+                    session_count += 1
+                    if session_count == 1:
+                        # Analyze the first session's first read for characteristics
+                        reads = elem.findall('{*}unblindedReadNodule')
+                        if not reads:
+                            reads = elem.findall('{*}unblindedRead')
+                        if reads:
+                            reads_found = True
+                            characteristics = reads[0].find('{*}characteristics')
+                            if characteristics is not None:
+                                characteristics_found = True
+                                for field in ('confidence', 'subtlety', 'obscuration', 'reason'):
+                                    char_elem = characteristics.find('{*}' + field)
+                                    if char_elem is not None and char_elem.text:
+                                        available_chars.append(field)
+
+                # Free the inspected subtree before the next one streams in
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except lxml_etree.XMLSyntaxError:
+            # Truncated input (e.g. detection over a bounded prefix of an
+            # upload): classify from whatever header/sessions streamed in
+            # before the cut — only raise if nothing usable was seen
+            if not (header_complete or session_count):
+                raise
+        del context
+
+        if not session_count:
             return "No_Sessions_Found"
-        
-        # Analyze first session for characteristics
-        first_session = sessions[0]
-        unblinded_reads = first_session.findall(tag('unblindedReadNodule')) or first_session.findall(tag('unblindedRead'))
-        
-        if not unblinded_reads:
+
+        if not reads_found:
             return "No_Reads_Found"
-        
-        # Analyze first read for characteristics
-        first_read = unblinded_reads[0]
-        characteristics = first_read.find(tag('characteristics'))
-        
-        if characteristics is None:
+
+        if not characteristics_found:
             return "No_Characteristics"
-        
-        # Count available characteristics
-        char_fields = ['confidence', 'subtlety', 'obscuration', 'reason']
-        available_chars = []
-        for field in char_fields:
-            elem = characteristics.find(tag(field))
-            if elem is not None and elem.text:
-                available_chars.append(field)
-        
-        # Determine case based on available characteristics and header completeness
-        header_complete = header is not None
-        modality_present = False
-        if header:
-            modality_elem = header.find(tag('Modality'))
-            modality_present = modality_elem is not None and modality_elem.text
-        
+
         # Classification logic
         if len(available_chars) >= 3 and 'reason' in available_chars and header_complete and modality_present:
             return "Complete_Attributes"
@@ -903,13 +872,13 @@ def detect_parse_case(file_path: str) -> str:
             return "Core_Attributes_Only"
         elif len(available_chars) == 1:
             return "Minimal_Attributes"
-        elif len(sessions) == 1:
+        elif session_count == 1:
             return "LIDC_Single_Session"
-        elif len(sessions) == 2:
+        elif session_count == 2:
             return "LIDC_Multi_Session_2"
-        elif len(sessions) == 3:
+        elif session_count == 3:
             return "LIDC_Multi_Session_3"
-        elif len(sessions) == 4:
+        elif session_count == 4:
             return "LIDC_Multi_Session_4"
         else:
             return "Unknown_Structure"
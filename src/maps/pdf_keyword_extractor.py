@@ -86,24 +86,31 @@ class PDFKeywordExtractor:
         
     def extract_from_pdf(
         self,
-        pdf_path: str,
+        pdf_path,
         store_in_db: bool = True,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        filename: Optional[str] = None
     ) -> tuple[PDFMetadata, List[ExtractedPDFKeyword]]:
         """
         extract keywords from pdf file.
         
         args:
-            pdf_path: path to pdf file
+            pdf_path: path to pdf file, or a binary file-like object
+                (pdfplumber reads either directly)
             store_in_db: whether to store keywords in database
             max_pages: optional maximum number of pages to process
+            filename: source name when a stream is given
             
         returns:
             tuple of (metadata, list of extracted keywords)
         """
-        pdf_path = Path(pdf_path)
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"pdf not found: {pdf_path}")
+        if hasattr(pdf_path, "read"):
+            source_name = filename or "stream.pdf"
+        else:
+            pdf_path = Path(pdf_path)
+            if not pdf_path.exists():
+                raise FileNotFoundError(f"pdf not found: {pdf_path}")
+            source_name = pdf_path.name
             
         metadata = PDFMetadata()
         all_keywords = []
@@ -177,7 +184,7 @@ class PDFKeywordExtractor:
         
         # store in database if requested
         if store_in_db and self.repository:
-            self._store_keywords_in_db(pdf_path.name, all_keywords, metadata)
+            self._store_keywords_in_db(source_name, all_keywords, metadata)
             # Store candidate keywords for approval in a special sector
             for cand in candidate_keywords:
                 # Only add if not already present
@@ -188,7 +195,7 @@ class PDFKeywordExtractor:
                         normalized_form=cand.lower()
                     ).keyword_id,
                     source_type="pdf",
-                    source_file=str(pdf_path.name),
+                    source_file=str(source_name),
                     frequency=1,
                     context=None,
                     sector="pending_keywords",
@@ -319,7 +319,46 @@ class ProfileManager:
         
         is_valid = len(errors) == 0
         return is_valid, errors
-    
+
+    def validate_profile_dict(self, profile_data: Dict[str, Any]) -> tuple[bool, List[str]]:
+        """
+        Validate a raw profile dictionary.
+
+        Structural checking rides on the Profile pydantic model, whose
+        validator is compiled once per class at import — no schema is
+        reparsed per call. The converted object then goes through the
+        same semantic checks as validate_profile.
+
+        Args:
+            profile_data: Profile as a plain dictionary
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        try:
+            profile = dict_to_profile(profile_data)
+        except Exception as e:
+            return False, [str(e)]
+        return self.validate_profile(profile)
+
+    def save_profile_dict(self, profile_data: Dict[str, Any], overwrite: bool = True) -> bool:
+        """
+        Save a profile supplied as a plain dictionary.
+
+        Args:
+            profile_data: Profile as a plain dictionary
+            overwrite: Whether to replace an existing profile
+
+        Returns:
+            True if saved successfully
+        """
+        try:
+            profile = dict_to_profile(profile_data)
+        except Exception as e:
+            print(f"❌ Invalid profile data: {e}")
+            return False
+        return self.save_profile(profile, overwrite=overwrite)
+
     # =========================================================================
     # PROFILE INHERITANCE
     # =========================================================================
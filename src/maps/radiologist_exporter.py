@@ -5,11 +5,43 @@ Provides easy access to individual characteristics (subtlety, malignancy, etc.)
 
 import os
 import csv
+import itertools
 import json
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from supabase import create_client, Client
 
+from .utils import write_csv_fast, write_json_fast
+
+
+# Compiled once; matching per row is a single C-level search
+_PATIENT_RE = re.compile(r'LIDC-IDRI-\d+')
+
+
+def _patient_key(row: Dict[str, Any]) -> str:
+    """
+    Grouping key for per-patient export.
+
+    Falls back to extracting the LIDC patient identifier from file_name so
+    rows without an explicit patient_id don't all collapse into 'unknown'.
+    """
+    patient_id = row.get('patient_id')
+    if patient_id:
+        return patient_id
+    match = _PATIENT_RE.search(row.get('file_name') or '')
+    return match.group(0) if match else 'unknown'
+
+
+def _write_one_patient_csv(filepath: Path, rows: List[Dict[str, Any]],
+                           fieldnames=None) -> int:
+    """Worker for export_by_patient; module-level so it pickles cleanly."""
+    write_csv_fast(rows, filepath, fieldnames=fieldnames)
+    return len(rows)
+
 
 class RadiologistExporter:
     """Export radiologist annotations with separate columns for each characteristic."""
@@ -25,26 +57,40 @@ class RadiologistExporter:
             )
         
         self.supabase: Client = create_client(url, key)
-    
+
+        # In-process TTL cache for full-table reads; repeated calls within a
+        # single export job hit memory instead of re-downloading the table
+        self._cache_ttl = int(os.environ.get("CACHE_TTL", "300"))
+        self._read_cache: Dict[str, Any] = {}
+
+    def _cached_table_read(self, table_name: str) -> List[Dict[str, Any]]:
+        """Full-table SELECT with a TTL memo keyed by table name."""
+        now = time.monotonic()
+        cached = self._read_cache.get(table_name)
+        if cached is not None and now - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        response = self.supabase.table(table_name).select('*').execute()
+        self._read_cache[table_name] = (now, response.data)
+        return response.data
+
     def get_flattened_annotations(self) -> List[Dict[str, Any]]:
         """
         Get radiologist annotations with each characteristic in its own column.
-        
+
         Returns:
             List of dictionaries with flattened annotation data
         """
-        response = self.supabase.table('radiologist_annotations_flat').select('*').execute()
-        return response.data
-    
+        return self._cached_table_read('radiologist_annotations_flat')
+
     def get_export_ready_data(self) -> List[Dict[str, Any]]:
         """
         Get export-ready data with human-readable column names.
-        
+
         Returns:
             List of dictionaries ready for export
         """
-        response = self.supabase.table('export_radiologist_data').select('*').execute()
-        return response.data
+        return self._cached_table_read('export_radiologist_data')
     
     def filter_by_malignancy(self, min_score: int = 1, max_score: int = 5) -> List[Dict[str, Any]]:
         """
@@ -77,6 +123,8 @@ class RadiologistExporter:
         Returns:
             All annotations for the specified patient
         """
+        # Substring ILIKE is served by the pg_trgm GIN index on
+        # file_imports.filename (migration 019) rather than a seq scan
         response = (
             self.supabase
             .table('radiologist_annotations_flat')
@@ -105,6 +153,8 @@ class RadiologistExporter:
     def refresh_export_table(self):
         """Refresh the materialized export view with latest data."""
         self.supabase.rpc('refresh_radiologist_export', {}).execute()
+        # Cached reads are stale once the view is rebuilt
+        self._read_cache.clear()
     
     def export_to_csv(
         self, 
@@ -121,15 +171,15 @@ class RadiologistExporter:
         if not data:
             print("No data to export")
             return
-        
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with output_file.open('w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-        
+
+        # Opt-in gzip output: honors ENABLE_EXPORT_COMPRESSION or an
+        # explicit .gz suffix on the requested path
+        if (os.environ.get('ENABLE_EXPORT_COMPRESSION', 'false').lower() == 'true'
+                and not str(output_path).endswith('.gz')):
+            output_path = f"{output_path}.gz"
+
+        write_csv_fast(data, output_path)
+
         print(f"✅ Exported {len(data)} rows to {output_path}")
     
     def export_to_json(
@@ -144,12 +194,8 @@ class RadiologistExporter:
             data: List of annotation dictionaries
             output_path: Path where JSON will be saved
         """
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with output_file.open('w') as f:
-            json.dump(data, f, indent=2, default=str)
-        
+        write_json_fast(data, output_path)
+
         print(f"✅ Exported {len(data)} rows to {output_path}")
     
     def export_by_patient(self, output_dir: str = './exports/by_patient'):
@@ -168,25 +214,29 @@ class RadiologistExporter:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Group by patient
-        patients = {}
-        for row in data:
-            patient_id = row.get('patient_id', 'unknown')
-            if patient_id not in patients:
-                patients[patient_id] = []
-            patients[patient_id].append(row)
-        
-        # Export each patient
-        for patient_id, patient_data in patients.items():
-            filename = f"{patient_id}.csv"
-            filepath = output_path / filename
-            
-            with filepath.open('w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=patient_data[0].keys())
-                writer.writeheader()
-                writer.writerows(patient_data)
-            
-            print(f"✅ Exported {len(patient_data)} annotations for {patient_id}")
+        # All patients share the schema of get_export_ready_data, so derive
+        # the column order once rather than per file inside the workers
+        fieldnames = tuple(data[0].keys())
+
+        # One in-place sort, then stream groups off itertools.groupby:
+        # avoids doubling peak memory with a dict holding a list per patient
+        data.sort(key=_patient_key)
+
+        # Export each patient. The files are independent, so fan the writes
+        # out over a process pool for near-linear speedup on multiple cores.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                patient_id: executor.submit(
+                    _write_one_patient_csv,
+                    output_path / f"{patient_id}.csv",
+                    list(rows),
+                    fieldnames
+                )
+                for patient_id, rows in itertools.groupby(data, key=_patient_key)
+            }
+            for patient_id, future in futures.items():
+                count = future.result()  # Propagate worker errors
+                print(f"✅ Exported {count} annotations for {patient_id}")
     
     def print_summary(self):
         """Print summary statistics of radiologist annotations."""
@@ -201,23 +251,30 @@ class RadiologistExporter:
         print("="*70)
         
         print(f"\nTotal Annotations: {len(data)}")
-        
-        # Count unique patients
-        patients = set(row.get('file_name') for row in data)
+
+        # Single pass: unique patients, score histogram and score sum together
+        # (vs one set-build pass plus five O(N) list.count scans)
+        patients = set()
+        score_counts = Counter()
+        score_sum = 0
+        for row in data:
+            patients.add(row.get('file_name'))
+            malignancy = row.get('malignancy')
+            if malignancy:
+                score_counts[malignancy] += 1
+                score_sum += malignancy
+
         print(f"Unique Patients: {len(patients)}")
-        
-        # Malignancy distribution
-        malignancy_scores = [row.get('malignancy') for row in data if row.get('malignancy')]
-        if malignancy_scores:
+
+        total_scored = sum(score_counts.values())
+        if total_scored:
             print(f"\nMalignancy Score Distribution:")
             for score in range(1, 6):
-                count = malignancy_scores.count(score)
-                percentage = (count / len(malignancy_scores)) * 100
+                count = score_counts[score]
+                percentage = (count / total_scored) * 100
                 print(f"  Score {score}: {count} ({percentage:.1f}%)")
-        
-        # Average scores
-        if malignancy_scores:
-            avg_malignancy = sum(malignancy_scores) / len(malignancy_scores)
+
+            avg_malignancy = score_sum / total_scored
             print(f"\nAverage Malignancy Score: {avg_malignancy:.2f}")
         
         print("="*70 + "\n")
@@ -3,6 +3,24 @@ Utility functions for the MAPS package
 """
 import re
 import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+# Optional fast CSV path: pyarrow dispatches row serialization to a single
+# vectorized C loop instead of per-cell Python bytecode
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pa_csv = None
+
+# Optional fast JSON path: orjson encodes in C, ~5-10x faster than the
+# stdlib encoder on large row lists
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 
 def sanitize_filename(filename: str) -> str:
@@ -10,6 +28,111 @@ def sanitize_filename(filename: str) -> str:
     return re.sub(r'[<>:"/\\|?*]', '_', filename)
 
 
+def write_csv_fast(data: List[Dict[str, Any]], output_path: Union[str, Path],
+                   fieldnames: Any = None) -> Path:
+    """
+    Write a list of row dicts to a CSV file.
+
+    Uses pyarrow's vectorized C writer when available (roughly an order of
+    magnitude faster than csv.DictWriter on large row lists); falls back to
+    csv.DictWriter otherwise. All rows must share the schema of the first row.
+
+    Args:
+        data: Non-empty list of row dictionaries
+        output_path: Destination CSV path (parent dirs created as needed)
+        fieldnames: Optional pre-computed column order; callers writing many
+                    files with the same schema can derive this once instead
+                    of per file
+
+    Returns:
+        Path object of the written file
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if output_file.suffix == '.gz':
+        # Level-1 DEFLATE compresses CSV text 5-10x at near-memcpy speed,
+        # trading a little CPU for far less disk IO
+        import csv  # pylint: disable=import-outside-toplevel
+        import gzip  # pylint: disable=import-outside-toplevel
+        import operator  # pylint: disable=import-outside-toplevel
+
+        if fieldnames is None:
+            fieldnames = list(data[0].keys())
+        getter = operator.itemgetter(*fieldnames)
+        with gzip.open(output_file, 'wt', newline='', encoding='utf-8',
+                       compresslevel=1) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            if len(fieldnames) == 1:
+                writer.writerows((getter(row),) for row in data)
+            else:
+                writer.writerows(getter(row) for row in data)
+        return output_file
+
+    if pa is not None:
+        table = pa.Table.from_pylist(data)
+        pa_csv.write_csv(
+            table,
+            str(output_file),
+            write_options=pa_csv.WriteOptions(include_header=True)
+        )
+        return output_file
+
+    # Stdlib fallback: csv.writer over pre-extracted tuples skips the
+    # per-row fieldname re-lookup DictWriter does, and the 1 MiB buffer
+    # batches write() syscalls.
+    import csv  # pylint: disable=import-outside-toplevel
+    import io  # pylint: disable=import-outside-toplevel
+    import operator  # pylint: disable=import-outside-toplevel
+
+    if fieldnames is None:
+        fieldnames = list(data[0].keys())
+    getter = operator.itemgetter(*fieldnames)
+    with output_file.open('wb', buffering=1 << 20) as raw:
+        with io.TextIOWrapper(raw, encoding='utf-8', newline='', write_through=False) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            if len(fieldnames) == 1:
+                writer.writerows((getter(row),) for row in data)
+            else:
+                writer.writerows(getter(row) for row in data)
+    return output_file
+
+
+def write_json_fast(data: Any, output_path: Union[str, Path], pretty: bool = True) -> Path:
+    """
+    Write data to a JSON file.
+
+    Uses orjson's C encoder when available; falls back to json.dump.
+    Non-serializable values (datetimes, UUIDs, ...) are stringified.
+
+    Args:
+        data: JSON-serializable payload
+        output_path: Destination JSON path (parent dirs created as needed)
+        pretty: Indent output for readability
+
+    Returns:
+        Path object of the written file
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        with output_file.open('wb') as f:
+            f.write(orjson.dumps(data, option=option, default=str))
+        return output_file
+
+    import json  # pylint: disable=import-outside-toplevel
+    with output_file.open('w', encoding='utf-8') as f:
+        if pretty:
+            json.dump(data, f, indent=2, default=str)
+        else:
+            json.dump(data, f, default=str)
+    return output_file
+
+
 def format_timestamp(dt: datetime.datetime = None) -> str:
     """Format timestamp for file naming"""
     if dt is None:
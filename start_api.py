@@ -19,5 +19,13 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.RELOAD,
+        # uvloop/httptools come with uvicorn[standard]; pinning them here
+        # (rather than "auto") makes the fast path explicit
+        loop="uvloop",
+        http="httptools",
+        # reload and multi-worker are mutually exclusive in uvicorn
+        workers=None if settings.RELOAD else settings.WORKERS,
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+        timeout_keep_alive=settings.TIMEOUT_KEEP_ALIVE,
         log_level=settings.LOG_LEVEL.lower()
     )
@@ -70,6 +70,19 @@ class TestProfileEndpoints:
         response = client.get("/api/v1/profiles/nonexistent_profile_xyz")
         assert response.status_code == 404
 
+    def test_profile_routes_registered_once(self):
+        """Duplicate registrations would silently shadow each other"""
+        # Not every entry in app.routes carries a path (newer FastAPI
+        # versions add router wrapper objects), so resolve it defensively
+        profile_routes = [
+            (path, method)
+            for route in app.routes
+            if (path := getattr(route, "path", None)) is not None
+            and path.startswith("/api/v1/profiles")
+            for method in getattr(route, "methods", [])
+        ]
+        assert len(profile_routes) == len(set(profile_routes))
+
     def test_create_profile(self):
         """Test creating a new profile"""
         new_profile = {
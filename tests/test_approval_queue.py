@@ -0,0 +1,76 @@
+"""
+Unit tests for the approval queue helper.
+
+add_to_queue builds QueueItem via model_construct (validation bypassed for
+trusted server-side values), so these tests pin down the type correctness
+that the validators would otherwise have enforced.
+"""
+
+import pytest
+from datetime import datetime
+
+from src.maps.api.routers import approval_queue as aq
+
+
+@pytest.fixture(autouse=True)
+def clean_queue():
+    """Reset the in-memory queue and its running stats around each test"""
+    aq._approval_queue.clear()
+    aq._payload_cache.clear()
+    aq._oldest_heap.clear()
+    for key in aq._stats:
+        aq._stats[key] = 0
+    yield
+    aq._approval_queue.clear()
+    aq._payload_cache.clear()
+    aq._oldest_heap.clear()
+    for key in aq._stats:
+        aq._stats[key] = 0
+
+
+def test_add_to_queue_builds_correctly_typed_item():
+    """model_construct bypasses validation, so field types must stay correct"""
+    item = aq.add_to_queue(
+        filename="scan.xml",
+        detected_parse_case="LIDC_Single_Session",
+        confidence=0.4,
+        file_type="XML",
+        file_size=1234,
+    )
+
+    assert isinstance(item, aq.QueueItem)
+    assert isinstance(item.id, str)
+    assert isinstance(item.confidence, float)
+    assert isinstance(item.file_size, int)
+    assert isinstance(item.uploaded_at, datetime)
+    assert item.status == "pending"
+    assert item.reviewed_by is None
+    assert item.reviewed_at is None
+    assert item.notes is None
+    # Round-trips through Pydantic validation without changes
+    revalidated = aq.QueueItem(**item.model_dump())
+    assert revalidated == item
+
+
+def test_add_to_queue_auto_approves_high_confidence():
+    """Items at or above the threshold are not queued"""
+    item = aq.add_to_queue(
+        filename="scan.xml",
+        detected_parse_case="LIDC_Single_Session",
+        confidence=aq.DEFAULT_CONFIDENCE_THRESHOLD,
+        file_type="XML",
+        file_size=10,
+    )
+    assert item is None
+    assert not aq._approval_queue
+
+
+def test_running_stats_track_added_items():
+    """Incremental counters match the items actually queued"""
+    aq.add_to_queue("a.xml", "case", 0.3, "XML", 1)
+    aq.add_to_queue("b.xml", "case", 0.6, "XML", 1)
+
+    assert aq._stats["pending"] == 2
+    assert aq._stats["low"] == 1
+    assert aq._stats["med"] == 1
+    assert aq._stats["conf_sum"] == pytest.approx(0.9)